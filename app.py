@@ -2,10 +2,14 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 import streamlit.components.v1 as components
+from functions import Cache_Warmup
 
 # Page setup
 st.set_page_config(page_title="🏐 Volleyball Team Analytics", layout="wide")
 
+# Build or validate every data cache in the background so no page pays for a cold rebuild
+Cache_Warmup.request()
+
 # Header
 st.title("🏐 Crandall Chargers Volleyball Analytics Platform")
 st.markdown("""
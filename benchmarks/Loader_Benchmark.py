@@ -0,0 +1,180 @@
+# benchmarks/Loader_Benchmark.py
+#
+# Times the dataset loaders against synthetic exports at multiples of today's volume.
+# Run from the repository root:
+#   python -m benchmarks.Loader_Benchmark --scales 10,100,1000 --output loader_benchmark.json
+#   python -m benchmarks.Loader_Benchmark --scales 10 --compare loader_benchmark.json
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+from benchmarks import Synthetic_Exports
+from functions import (
+    Athlete_Data_Load,
+    Dataset_Cache,
+    Match_Data_Load,
+    Overall_Data_Load,
+    Rotation_Data_Load,
+)
+
+LOADERS = {
+    "match": Match_Data_Load,
+    "athlete": Athlete_Data_Load,
+    "overall": Overall_Data_Load,
+    "rotation": Rotation_Data_Load,
+}
+DEFAULT_SCALES = [10, 100, 1000]
+REPORT_VERSION = 1
+COMPARED_METRICS = {"cold_build_seconds": "cold", "warm_load_seconds": "warm", "cold_peak_bytes": "peak"}
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, round(time.perf_counter() - start, 4)
+
+def peak_memory(func):
+    # tracemalloc sees numpy/pandas buffers but not pyarrow's own pool, and slows the run,
+    # so peaks come from a separate pass and never from the timed one
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_dataset(name, workers=None, memory=True):
+    module = LOADERS[name]
+    load = getattr(module, f"load_preprocessed_{name}_data")
+    kwargs = {"workers": workers} if workers is not None else {}
+
+    def cold():
+        Dataset_Cache.clear()
+        return load(force_rebuild=True, **kwargs)
+
+    def warm():
+        # Warm from disk: the manifest check plus a parquet read
+        Dataset_Cache.clear()
+        return load()
+
+    df, cold_seconds = timed(cold)
+    _, warm_seconds = timed(warm)
+    # Warm from memory: what a second rerun in the same process pays
+    _, memory_seconds = timed(load)
+
+    return {
+        "rows": int(len(df)),
+        "columns": int(df.shape[1]),
+        "cold_build_seconds": cold_seconds,
+        "cold_peak_bytes": peak_memory(cold) if memory else None,
+        "warm_load_seconds": warm_seconds,
+        "warm_peak_bytes": peak_memory(warm) if memory else None,
+        "memory_hit_seconds": memory_seconds,
+        "cache_bytes": os.path.getsize(module.CACHE_FILE) if os.path.exists(module.CACHE_FILE) else 0,
+    }
+
+def run_scale(scale, datasets, workers=None, memory=True, keep=False, seed=0):
+    # Loaders use paths relative to the working directory, so each scale runs in its own tree
+    root = tempfile.mkdtemp(prefix=f"loader_bench_{scale}x_")
+    cwd = os.getcwd()
+    try:
+        start = time.perf_counter()
+        files = Synthetic_Exports.generate(root, scale, datasets, seed)
+        generate_seconds = round(time.perf_counter() - start, 2)
+        print(f"🔧 {scale}x: generated {sum(files.values())} files in {generate_seconds}s ({root})")
+
+        os.chdir(root)
+        results = {}
+        for name in datasets:
+            results[name] = dict(benchmark_dataset(name, workers, memory), source_files=files.get(name, 0))
+            r = results[name]
+            peak = f" peak={r['cold_peak_bytes'] / 1e6:.1f}MB" if r["cold_peak_bytes"] is not None else ""
+            print(
+                f"   {name:<8} rows={r['rows']:<9} cold={r['cold_build_seconds']:.3f}s "
+                f"warm={r['warm_load_seconds']:.3f}s{peak}"
+            )
+        return {"scale": scale, "generate_seconds": generate_seconds, "datasets": results}
+    finally:
+        os.chdir(cwd)
+        Dataset_Cache.clear()
+        if not keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+def compare_reports(baseline, current):
+    # Prints current/baseline ratios for every timing both reports share
+    base_runs = {run["scale"]: run for run in baseline.get("runs", [])}
+    print(f"\n📊 Compared with {baseline.get('commit') or 'baseline'}:")
+    for run in current["runs"]:
+        base_run = base_runs.get(run["scale"])
+        if base_run is None:
+            continue
+        for name, result in run["datasets"].items():
+            base_result = base_run["datasets"].get(name)
+            if not base_result:
+                continue
+            ratios = [
+                f"{label} x{result[key] / base_result[key]:.2f}"
+                for key, label in COMPARED_METRICS.items() if base_result.get(key)
+            ]
+            print(f"   {run['scale']}x {name:<8} " + "  ".join(ratios))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dataset loaders on synthetic exports.")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="comma-separated multiples of today's volume")
+    parser.add_argument("--datasets", default=",".join(LOADERS), help="comma-separated subset of " + ",".join(LOADERS))
+    parser.add_argument("--workers", type=int, default=None, help="parse workers passed to the loaders")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="loader_benchmark.json", help="where to write the JSON report")
+    parser.add_argument("--compare", default=None, help="earlier report to compare against")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory passes")
+    parser.add_argument("--keep", action="store_true", help="keep the generated data trees")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    datasets = [d.strip() for d in args.datasets.split(",") if d.strip()]
+    unknown = [d for d in datasets if d not in LOADERS]
+    if unknown:
+        parser.error(f"unknown datasets: {', '.join(unknown)}")
+
+    report = {
+        "version": REPORT_VERSION,
+        "commit": git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "seed": args.seed,
+        "runs": [run_scale(scale, datasets, args.workers, not args.no_memory, args.keep, args.seed) for scale in scales],
+    }
+    # ru_maxrss is kilobytes on Linux
+    report["process_max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare_reports(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# benchmarks/Synthetic_Exports.py
+
+import csv
+import os
+import random
+from datetime import date, timedelta
+
+# Headers copied from the real exports; the repeated "0" spacer columns are part of the shape
+TEAM_STAT_HEADER = [
+    "MP", "0", "S Pts W", "S Pts L", "S W %", "0", "SR Pts W", "SR Pts L", "SO %", "0",
+    "Ace", "S Err", "S Att", "S Rtg", "S %", "0", "SR Perf", "SR Good", "SR Poor", "SR Err", "SR Att", "SR Rtg", "0",
+    "Kill", "A Err", "Att", "H %", "0", "B Solo", "B Assist", "B Total", "0", "Assist", "A Att", "0",
+    "Digs", "0", "Sent", "Received", "0", "Violations", "BHE",
+]
+ATHLETE_HEADER = [
+    "#", "Athlete", "MP", "SP", "0", "Ace", "S Err", "S Att", "S Rtg", "S %", "0",
+    "SR Perf", "SR Good", "SR Poor", "SR Err", "SR Att", "SR Rtg", "0",
+    "Kill", "A Err", "Att", "H %", "0", "B Solo", "B Assist", "B Total", "0", "Assist", "A Att", "0",
+    "Digs", "0", "Sent", "Received", "0", "Violations", "BHE",
+]
+MATCH_HEADER = ["Date", "Opponent", "Result", "0", "Set 1", "Set 2", "Set 3", "Set 4", "Set 5"] + TEAM_STAT_HEADER[1:]
+
+HOME_TEAM = ("CU", "CU")  # (name in match title, name after "Totals")
+OPPONENTS = [
+    ("DAL AC", "DAL AC"), ("Holland College", "Holland"), ("STU", "STU"),
+    ("UNBSJ", "UNBSJ"), ("USTA", "USTA"), ("MTA", "MTA"), ("UNB", "UNB"), ("CBU", "CBU"),
+]
+FIRST_NAMES = ["Noah", "Liam", "Evan", "Kyle", "Jack", "Sam", "Cole", "Shane", "Bryce", "Austin", "Owen", "Luke"]
+LAST_NAMES = ["MacDonald", "King", "Barnes", "Reeder", "Wilson", "Trites", "Hillier", "Benoit", "Gionet", "Huggard"]
+
+# Today's volume: 26 matches with a per-team export each, and two seasons of match summaries
+MATCHES_PER_SCALE = 26
+MATCH_SEASONS_PER_SCALE = 2
+MATCH_ROWS_PER_SEASON = 22
+FIRST_SEASON_YEAR = 2000
+SEASON_YEARS = 200  # stays well inside the pandas Timestamp range
+
+DATASET_DIRS = {
+    "match": "Match Data",
+    "athlete": "Athlete Data",
+    "overall": "Overall Data",
+    "rotation": "Rotation Data",
+}
+
+# --- Value helpers ---
+def count(rng, high):
+    return str(rng.randint(0, high))
+
+def percent(rng):
+    # Older exports write two decimals, newer ones one
+    return f"{rng.uniform(20, 100):.{rng.choice([1, 2])}f}%"
+
+def rating(rng):
+    return rng.choice(["-", f"{rng.uniform(0.5, 3):.2f}".rstrip("0").rstrip(".")])
+
+def hitting(rng):
+    value = rng.uniform(-0.6, 0.7)
+    return rng.choice(["-", f"- {abs(value):.3f}" if value < 0 else f"{value:.3f}"])
+
+STAT_VALUES = {
+    "S W %": percent, "SO %": percent, "S %": percent,
+    "S Rtg": rating, "SR Rtg": rating, "H %": hitting,
+}
+
+def stat_row(rng, header, scale=1):
+    row = []
+    for col in header:
+        if col == "0":
+            row.append("0")
+        elif col in STAT_VALUES:
+            row.append(STAT_VALUES[col](rng))
+        else:
+            row.append(count(rng, 40 * scale))
+    return row
+
+def season_label(season_index):
+    year = FIRST_SEASON_YEAR + season_index % SEASON_YEARS
+    return year, f"{year}-{year + 1}"
+
+def season_date(rng, year):
+    # Volleyball seasons run September through March
+    return date(year, 9, 1) + timedelta(days=rng.randint(0, 200))
+
+def write_rows(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+def unique_name(used, base):
+    # Same-day rematches get " 1", " 2" suffixes like the real exports
+    if base not in used:
+        used[base] = 0
+        return f"{base}.csv"
+    used[base] += 1
+    return f"{base} {used[base]}.csv"
+
+# --- Per-match exports (athlete, overall, rotation) ---
+def match_title(rng, opponent):
+    # Some exports carry a double space before the em dash
+    separator = rng.choice(["vs", "@"])
+    spacer = rng.choice([" ", " ", "  "])
+    return f"{HOME_TEAM[0]} {separator} {opponent[0]}{spacer}— All Athletes — Whole Match — Totals"
+
+def athlete_rows(rng, title, roster):
+    rows = [[title], ATHLETE_HEADER]
+    for number, name in rng.sample(roster, k=min(len(roster), rng.randint(14, 20))):
+        stats = stat_row(rng, ATHLETE_HEADER[2:])
+        rows.append([str(number), name] + stats)
+    return rows
+
+def team_rows(rng, title, season, section_label, labels):
+    header = ["Matches"] + TEAM_STAT_HEADER
+    rows = [[title], header, [f"{season} Season"] + stat_row(rng, TEAM_STAT_HEADER, scale=3)]
+    rows.append(["0"] * len(header))
+    rows.append([section_label] + TEAM_STAT_HEADER)
+    for label in labels:
+        rows.append([label] + stat_row(rng, TEAM_STAT_HEADER))
+    return rows
+
+def build_roster(rng, size=20):
+    numbers = rng.sample(range(1, 30), k=size)
+    names = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(size)]
+    return list(zip(numbers, names))
+
+def generate_match_exports(root, scale, rng, datasets):
+    dirs = {name: os.path.join(root, DATASET_DIRS[name]) for name in ("athlete", "overall", "rotation") if name in datasets}
+    if not dirs:
+        return {}
+    for path in dirs.values():
+        os.makedirs(path, exist_ok=True)
+
+    rosters = {team: build_roster(rng) for team in [HOME_TEAM] + OPPONENTS}
+    used = {}
+    files = {name: 0 for name in dirs}
+    for match_index in range(MATCHES_PER_SCALE * scale):
+        year, season = season_label(match_index // MATCHES_PER_SCALE)
+        match_day = season_date(rng, year).isoformat()
+        opponent = rng.choice(OPPONENTS)
+        title = match_title(rng, opponent)
+        for team in (HOME_TEAM, opponent):
+            file_name = unique_name(used, f"{title} {team[1]} ({match_day})")
+            if "athlete" in dirs:
+                write_rows(os.path.join(dirs["athlete"], file_name), athlete_rows(rng, title, rosters[team]))
+            if "overall" in dirs:
+                write_rows(os.path.join(dirs["overall"], file_name),
+                           team_rows(rng, title, season, "By Set", ["1", "2", "3", "4", "5"]))
+            if "rotation" in dirs:
+                write_rows(os.path.join(dirs["rotation"], file_name),
+                           team_rows(rng, title, season, "By Rotation", ["1", "2", "3", "4", "5", "6", "Unknown"]))
+            for name in dirs:
+                files[name] += 1
+    return files
+
+# --- Season match summaries ---
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+def match_date_text(rng, day):
+    # Exports mix "Feb 15" and Excel-mangled "17-Feb"
+    month = MONTHS[day.month - 1]
+    return rng.choice([f"{month} {day.day}", f"{day.day}-{month}"])
+
+def set_scores(rng, sets_played):
+    scores = []
+    for index in range(5):
+        if index < sets_played:
+            target = 15 if index == 4 else 25
+            scores.append(f"{target} - {rng.randint(10, target - 2)}" if rng.random() < 0.5 else f"{rng.randint(10, target - 2)} - {target}")
+        else:
+            scores.append("-")
+    return scores
+
+def match_rows(rng, year):
+    rows = [MATCH_HEADER]
+    for _ in range(MATCH_ROWS_PER_SEASON):
+        sets_played = rng.randint(3, 5)
+        opponent = rng.choice(OPPONENTS)[0]
+        lost_sets = sets_played - 3
+        result = rng.choice([f"W 3-{lost_sets}", f"L {lost_sets}-3"])
+        rows.append(
+            [match_date_text(rng, season_date(rng, year)), f"{rng.choice(['vs', '@'])} {opponent}{rng.choice(['', ' '])}", result, "0"]
+            + set_scores(rng, sets_played)
+            + stat_row(rng, TEAM_STAT_HEADER[1:], scale=3)
+        )
+    return rows
+
+def generate_match_data(root, scale, rng):
+    match_dir = os.path.join(root, DATASET_DIRS["match"])
+    os.makedirs(match_dir, exist_ok=True)
+    files = 0
+    for season_index in range(MATCH_SEASONS_PER_SCALE * scale):
+        year, season = season_label(season_index)
+        block = season_index // SEASON_YEARS
+        prefix = "Crandall University" + (f" {block}" if block else "")
+        for suffix in ("", "'s Opponents"):
+            file_name = f"{prefix}{suffix} — {MATCH_ROWS_PER_SEASON} Matches — All Athletes — Whole Match — Totals {season}.csv"
+            write_rows(os.path.join(match_dir, file_name), match_rows(rng, year))
+            files += 1
+    return files
+
+def generate(root, scale=1, datasets=tuple(DATASET_DIRS), seed=0):
+    # Writes a data/ tree under root; returns {dataset: file count}
+    rng = random.Random(seed)
+    data_root = os.path.join(root, "data")
+    files = generate_match_exports(data_root, scale, rng, datasets)
+    if "match" in datasets:
+        files["match"] = generate_match_data(data_root, scale, rng)
+    return files
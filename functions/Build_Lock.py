@@ -0,0 +1,83 @@
+# functions/Build_Lock.py
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# A lock file next to each cache makes concurrent sessions, threads and processes wait for one
+# build instead of each parsing the same sources. The holder touches the lock every
+# HEARTBEAT_SECONDS, so a lock untouched for STALE_LOCK_SECONDS was left behind by a crashed
+# build; waiters give up only after LOCK_TIMEOUT_SECONDS, well past the stale window.
+HEARTBEAT_SECONDS = 30
+STALE_LOCK_SECONDS = 180
+LOCK_TIMEOUT_SECONDS = 1800
+POLL_SECONDS = 0.2
+
+_local = threading.local()
+
+def lock_path(cache_file):
+    return f"{cache_file}.lock"
+
+def held_locks():
+    if not hasattr(_local, "held"):
+        _local.held = set()
+    return _local.held
+
+def try_acquire(path):
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(f"{os.getpid()} {time.time():.0f}\n")
+    return True
+
+def remove_stale(path, stale_seconds=STALE_LOCK_SECONDS):
+    try:
+        if time.time() - os.path.getmtime(path) > stale_seconds:
+            os.remove(path)
+            print(f"⚠️ Removed stale build lock {path}")
+    except OSError:
+        pass
+
+def heartbeat(path, stop):
+    while not stop.wait(HEARTBEAT_SECONDS):
+        try:
+            os.utime(path)
+        except OSError:
+            if not stop.is_set():
+                print(f"⚠️ Build lock {path} disappeared while its build was still running")
+            return
+
+@contextmanager
+def cache_lock(cache_file, timeout=LOCK_TIMEOUT_SECONDS):
+    path = lock_path(cache_file)
+    held = held_locks()
+    if path in held:
+        # Re-entered from the same build
+        yield
+        return
+
+    deadline = time.monotonic() + timeout
+    while not try_acquire(path):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Timed out after {timeout}s waiting for {path}")
+        remove_stale(path)
+        time.sleep(POLL_SECONDS)
+
+    held.add(path)
+    stop = threading.Event()
+    threading.Thread(target=heartbeat, args=(path, stop), name="build-lock-heartbeat", daemon=True).start()
+    try:
+        yield
+    finally:
+        stop.set()
+        held.discard(path)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def is_locked(cache_file):
+    return os.path.exists(lock_path(cache_file))
@@ -0,0 +1,157 @@
+# functions/Build_Log.py
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# One JSON line per cache build: per-file stage timings, rows in/out and skip reasons
+BUILD_LOG_FILE = "data/build_log.jsonl"
+MAX_RUNS = 200
+
+_local = threading.local()
+_write_lock = threading.Lock()
+
+def current_run():
+    return getattr(_local, "run", None)
+
+def current_file():
+    return getattr(_local, "file", None)
+
+@contextmanager
+def stage(name):
+    # Time goes to the file being parsed on this thread, else to the running build, else nowhere
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        target = current_file() or current_run()
+        if target is not None:
+            stages = target["stages"]
+            stages[name] = round(stages.get(name, 0.0) + time.perf_counter() - start, 6)
+
+def set_rows(rows_in=None, rows_out=None):
+    record = current_file()
+    if record is None:
+        return
+    if rows_in is not None:
+        record["rows_in"] = int(rows_in)
+    if rows_out is not None:
+        record["rows_out"] = int(rows_out)
+
+def skip(reason):
+    record = current_file()
+    if record is not None:
+        record["status"] = "skipped"
+        record["skip_reason"] = str(reason)
+
+@contextmanager
+def track_file(file_name, status="parsed"):
+    record = {"file": file_name, "status": status, "rows_in": None, "rows_out": None, "stages": {}}
+    previous = current_file()
+    _local.file = record
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = round(time.perf_counter() - start, 6)
+        _local.file = previous
+
+class FileTask:
+    # Wraps a process_*_data_file function so its record travels back from pool workers with the frame
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, file_path, file_name):
+        with track_file(file_name) as record:
+            result = self.func(file_path, file_name)
+            if result is None:
+                if record["status"] != "skipped":
+                    skip("no rows returned")
+            elif record["rows_out"] is None:
+                record["rows_out"] = int(len(result))
+        return result, record
+
+def add_file(record):
+    run = current_run()
+    if run is not None:
+        run["files"].append(record)
+
+@contextmanager
+def build_run(dataset, cache_file):
+    run = {
+        "dataset": dataset,
+        "cache_file": cache_file,
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "stages": {},
+        "files": [],
+        "errors": [],
+    }
+    _local.run = run
+    start = time.perf_counter()
+    try:
+        yield run
+    except Exception as e:
+        run["errors"].append(f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        run["seconds"] = round(time.perf_counter() - start, 6)
+        _local.run = None
+        write_run(run)
+
+def error(message):
+    run = current_run()
+    if run is not None:
+        run["errors"].append(str(message))
+
+def set_rows_out(rows):
+    run = current_run()
+    if run is not None:
+        run["rows_out"] = int(rows)
+
+def write_run(run, log_file=BUILD_LOG_FILE):
+    try:
+        with _write_lock:
+            lines = []
+            if os.path.exists(log_file):
+                with open(log_file, "r", encoding="utf-8") as f:
+                    lines = f.readlines()[-(MAX_RUNS - 1):]
+            lines.append(json.dumps(run, sort_keys=True) + "\n")
+            tmp_path = log_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            os.replace(tmp_path, log_file)
+    except OSError as e:
+        print(f"⚠️ Failed to write build log: {e}")
+
+def read_runs(log_file=BUILD_LOG_FILE):
+    runs = []
+    try:
+        with open(log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return runs
+
+def last_runs(log_file=BUILD_LOG_FILE):
+    # Latest run per dataset
+    latest = {}
+    for run in read_runs(log_file):
+        latest[run.get("dataset")] = run
+    return latest
+
+def stage_totals(run):
+    # Per-file stages summed over files, plus the build-level stages
+    totals = {}
+    for record in run.get("files", []):
+        for name, seconds in record.get("stages", {}).items():
+            totals[f"file {name}"] = totals.get(f"file {name}", 0.0) + seconds
+    for name, seconds in run.get("stages", {}).items():
+        totals[name] = totals.get(name, 0.0) + seconds
+    return totals
@@ -0,0 +1,108 @@
+# functions/Cache_Manifest.py
+
+import hashlib
+import json
+import os
+from functions import Dataset_Cache, Dataset_Summary, Filter_Index
+
+# Bump whenever the cached frame layout, dtypes or values change so existing caches are rebuilt
+MANIFEST_VERSION = 5
+HASH_SOURCE_CONTENTS = False
+
+def manifest_path(cache_file):
+    return f"{cache_file}.manifest.json"
+
+def hash_file(file_path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def describe_source(file_path):
+    stat = os.stat(file_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+# Only stat() is used here so that checking a warm cache never reads source contents
+def build_source_manifest(source_dirs=(), source_files=()):
+    sources = {}
+    for source_dir in source_dirs:
+        if not os.path.isdir(source_dir):
+            continue
+        for file in sorted(os.listdir(source_dir)):
+            if file.endswith(".csv"):
+                file_path = os.path.join(source_dir, file)
+                sources[file_path] = describe_source(file_path)
+    for file_path in source_files:
+        if os.path.exists(file_path):
+            sources[file_path] = describe_source(file_path)
+    return {"version": MANIFEST_VERSION, "sources": sources}
+
+def read_manifest(cache_file):
+    try:
+        with open(manifest_path(cache_file), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_manifest(cache_file, manifest, hash_contents=None):
+    # Read the switch at call time so setting HASH_SOURCE_CONTENTS after import takes effect
+    if hash_contents is None:
+        hash_contents = HASH_SOURCE_CONTENTS
+    if hash_contents:
+        for file_path, entry in manifest.get("sources", {}).items():
+            if "sha256" not in entry and os.path.exists(file_path):
+                entry["sha256"] = hash_file(file_path)
+    try:
+        tmp_path = manifest_path(cache_file) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path(cache_file))
+    except OSError as e:
+        print(f"❌ Failed to write cache manifest for {cache_file}: {e}")
+
+def same_stat(stored, current):
+    return stored.get("size") == current.get("size") and stored.get("mtime_ns") == current.get("mtime_ns")
+
+def is_cache_current(cache_file, manifest):
+    if not os.path.exists(cache_file):
+        return False
+    stored = read_manifest(cache_file)
+    if not stored or stored.get("version") != manifest.get("version"):
+        return False
+
+    stored_sources = stored.get("sources", {})
+    current_sources = manifest.get("sources", {})
+    if set(stored_sources) != set(current_sources):
+        return False
+
+    touched = [path for path in current_sources if not same_stat(stored_sources[path], current_sources[path])]
+    if not touched:
+        return True
+
+    # A touched-but-identical file only counts as unchanged when hashes were recorded
+    for path in touched:
+        stored_entry = stored_sources[path]
+        if "sha256" not in stored_entry or stored_entry.get("size") != current_sources[path].get("size"):
+            return False
+        try:
+            if hash_file(path) != stored_entry["sha256"]:
+                return False
+        except OSError:
+            return False
+
+    # Record the new stat so the same files are not re-hashed on the next load
+    for path, entry in current_sources.items():
+        if "sha256" in stored_sources[path]:
+            entry["sha256"] = stored_sources[path]["sha256"]
+    write_manifest(cache_file, manifest)
+    return True
+
+def remove_cache(cache_file):
+    Dataset_Cache.discard(cache_file)
+    removed = False
+    for path in (cache_file, manifest_path(cache_file), Dataset_Summary.summary_path(cache_file), Filter_Index.index_path(cache_file)):
+        if os.path.exists(path):
+            os.remove(path)
+            removed = True
+    return removed
@@ -0,0 +1,187 @@
+# functions/Cache_Warmup.py
+
+import threading
+import time
+from collections import OrderedDict
+import pandas as pd
+import streamlit as st
+from functions import (
+    Athlete_Data_Load,
+    Cache_Manifest,
+    Match_Data_Load,
+    Overall_Data_Load,
+    Rotation_Data_Load,
+    Setter_Distribution_Load,
+)
+
+# One background thread per process builds or validates every loader cache, so pages only ever
+# read a current cache and show a progress state while a build is under way
+POLL_SECONDS = 2
+
+def build_setter_caches(force_rebuild=False):
+    Setter_Distribution_Load.load_preprocessed_setter_data(force_rebuild=force_rebuild)
+    for level in Setter_Distribution_Load.AGGREGATE_LEVELS:
+        Setter_Distribution_Load.load_setter_aggregate(level)
+
+DATASETS = OrderedDict([
+    ("match", {
+        "label": "Match Data",
+        "cache_file": Match_Data_Load.CACHE_FILE,
+        "manifest": Match_Data_Load.source_manifest,
+        "build": Match_Data_Load.load_preprocessed_match_data,
+    }),
+    ("overall", {
+        "label": "Overall Data",
+        "cache_file": Overall_Data_Load.CACHE_FILE,
+        "manifest": Overall_Data_Load.source_manifest,
+        "build": Overall_Data_Load.load_preprocessed_overall_data,
+    }),
+    ("rotation", {
+        "label": "Rotation Data",
+        "cache_file": Rotation_Data_Load.CACHE_FILE,
+        "manifest": Rotation_Data_Load.source_manifest,
+        "build": Rotation_Data_Load.load_preprocessed_rotation_data,
+    }),
+    ("athlete", {
+        "label": "Athlete Data",
+        "cache_file": Athlete_Data_Load.CACHE_FILE,
+        "manifest": Athlete_Data_Load.source_manifest,
+        "build": Athlete_Data_Load.load_preprocessed_athlete_data,
+    }),
+    ("setter", {
+        "label": "Setter Distribution Data",
+        "cache_file": Setter_Distribution_Load.CACHE_FILE,
+        "manifest": Setter_Distribution_Load.source_manifest,
+        "build": build_setter_caches,
+    }),
+])
+
+_lock = threading.Lock()
+_state = {
+    "running": False,
+    "queue": OrderedDict(),  # dataset -> force_rebuild
+    "current": None,
+    "current_started": None,
+    "attempted": {},  # dataset -> source manifest of the last build that left no current cache
+    "errors": {},  # dataset -> message from the last failed build
+}
+
+def is_current(name):
+    spec = DATASETS[name]
+    return Cache_Manifest.is_cache_current(spec["cache_file"], spec["manifest"]())
+
+def request(names=None, force=False):
+    # Queues stale caches (or every named cache when force is set) and starts the worker if idle.
+    # A cache whose last build failed or came back empty is not retried until its sources change.
+    stale = {}
+    for name in names or DATASETS:
+        if force or not is_current(name):
+            stale[name] = DATASETS[name]["manifest"]()
+
+    with _lock:
+        for name, manifest in stale.items():
+            if force:
+                _state["queue"][name] = True
+            elif name not in _state["queue"] and name != _state["current"] and _state["attempted"].get(name) != manifest:
+                _state["queue"][name] = False
+        if _state["queue"] and not _state["running"]:
+            _state["running"] = True
+            threading.Thread(target=_run, name="cache-warmup", daemon=True).start()
+
+def _run():
+    while True:
+        with _lock:
+            if not _state["queue"]:
+                _state["running"] = False
+                _state["current"] = None
+                _state["current_started"] = None
+                return
+            name, force = _state["queue"].popitem(last=False)
+            _state["current"] = name
+            _state["current_started"] = time.time()
+
+        spec = DATASETS[name]
+        manifest = spec["manifest"]()
+        error = None
+        try:
+            spec["build"](force_rebuild=force)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"❌ Background build of {spec['label']} failed: {error}")
+
+        built = error is None and is_current(name)
+        with _lock:
+            if built:
+                _state["attempted"].pop(name, None)
+            else:
+                _state["attempted"][name] = manifest
+            if error:
+                _state["errors"][name] = error
+            else:
+                _state["errors"].pop(name, None)
+
+def status(name):
+    # "ready", "building", "queued", "failed", "empty" (built without rows) or "stale"
+    if is_current(name):
+        return "ready"
+    with _lock:
+        if _state["current"] == name:
+            return "building"
+        if name in _state["queue"]:
+            return "queued"
+        if name in _state["errors"]:
+            return "failed"
+        attempted = _state["attempted"].get(name)
+    return "empty" if attempted is not None and attempted == DATASETS[name]["manifest"]() else "stale"
+
+def statuses():
+    return {name: status(name) for name in DATASETS}
+
+def is_busy():
+    with _lock:
+        return _state["running"]
+
+def progress():
+    with _lock:
+        started = _state["current_started"]
+        return {
+            "current": _state["current"],
+            "elapsed": time.time() - started if started else 0.0,
+            "queued": list(_state["queue"]),
+            "errors": dict(_state["errors"]),
+        }
+
+def load_ready(name, load_func):
+    # Reads a current cache; returns None while the warm-up still owes a build
+    dataset_status = status(name)
+    if dataset_status == "ready":
+        return load_func()
+    if dataset_status == "empty":
+        return pd.DataFrame()
+    return None
+
+# --- Page rendering ---
+@st.fragment(run_every=POLL_SECONDS)
+def render_progress(rendered_statuses):
+    # Polls while a build is under way and reruns the page once any dataset changes state
+    if statuses() != rendered_statuses:
+        st.rerun()
+    current = progress()
+    done = sum(value in ("ready", "empty", "failed") for value in rendered_statuses.values())
+    text = f"⏳ Preparing data caches: {done}/{len(DATASETS)} ready"
+    if current["current"]:
+        text += f" — building {DATASETS[current['current']]['label']} ({current['elapsed']:.0f}s)"
+    st.progress(done / len(DATASETS), text=text)
+
+def render_pending(name):
+    label = DATASETS[name]["label"]
+    dataset_status = status(name)
+    if dataset_status == "failed":
+        st.error(f"❌ Background build of {label} failed: {progress()['errors'].get(name)}")
+        if st.button(f"🔁 Retry {label}", key=f"{name}_warmup_retry"):
+            request([name], force=True)
+            st.rerun()
+    elif dataset_status == "building":
+        st.info(f"⏳ Building the {label} cache in the background ({progress()['elapsed']:.0f}s so far). This section fills in when it is ready.")
+    else:
+        st.info(f"⏳ {label} is queued for a background cache build. This section fills in when it is ready.")
@@ -0,0 +1,102 @@
+# functions/Data_Export.py
+
+import gzip
+import io
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+# Files are built only when someone asks for one, then kept per (dataset, data version, filters, format)
+EXPORT_BUDGET_BYTES = 128 * 1024 * 1024
+CSV_CHUNK_ROWS = 50_000
+
+FORMATS = {
+    "CSV": {"extension": "csv", "mime": "text/csv"},
+    "CSV (gzip)": {"extension": "csv.gz", "mime": "application/gzip"},
+    "Parquet": {"extension": "parquet", "mime": "application/octet-stream"},
+}
+
+_exports = OrderedDict()  # key -> bytes
+_lock = threading.Lock()
+
+def filter_key(filters):
+    # Selection order does not change the rows, so it does not change the key either
+    return tuple(sorted(
+        (name, tuple(sorted(map(str, value))) if isinstance(value, (list, tuple, set)) else str(value))
+        for name, value in (filters or {}).items()
+        if value
+    ))
+
+def make_key(dataset, version, filters, fmt):
+    return (dataset, version, filter_key(filters), fmt)
+
+def iter_csv_chunks(df, chunk_rows=CSV_CHUNK_ROWS):
+    # Encodes a bounded number of rows at a time; only the first chunk carries the header
+    if df.empty:
+        yield df.to_csv(index=False).encode("utf-8")
+        return
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=start == 0).encode("utf-8")
+
+def build_export(df, fmt):
+    buffer = io.BytesIO()
+    if fmt == "CSV":
+        for chunk in iter_csv_chunks(df):
+            buffer.write(chunk)
+    elif fmt == "CSV (gzip)":
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
+            for chunk in iter_csv_chunks(df):
+                gz.write(chunk)
+    elif fmt == "Parquet":
+        out = df.copy(deep=False)
+        out.columns = [str(col) for col in out.columns]
+        out.to_parquet(buffer, index=False)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    return buffer.getvalue()
+
+def get_export(key):
+    with _lock:
+        data = _exports.get(key)
+        if data is not None:
+            _exports.move_to_end(key)
+        return data
+
+def put_export(key, data):
+    with _lock:
+        if len(data) > EXPORT_BUDGET_BYTES:
+            return data
+        _exports[key] = data
+        _exports.move_to_end(key)
+        total = sum(len(value) for value in _exports.values())
+        while total > EXPORT_BUDGET_BYTES and _exports:
+            _, old = _exports.popitem(last=False)
+            total -= len(old)
+    return data
+
+def clear():
+    with _lock:
+        _exports.clear()
+
+def render_download(df, dataset, file_stem, label, version=None, filters=None, formats=tuple(FORMATS)):
+    # version identifies the loaded data (e.g. the cache fingerprint); filters are the active selections
+    c1, c2 = st.columns([1, 2])
+    fmt = c1.selectbox("Format", list(formats), key=f"{dataset}_export_format", label_visibility="collapsed")
+    key = make_key(dataset, version, filters, fmt)
+
+    data = get_export(key)
+    if data is None:
+        if not c2.button(f"📦 Prepare {label}", key=f"{dataset}_export_prepare"):
+            return
+        with st.spinner(f"Building {fmt} export..."):
+            data = put_export(key, build_export(df, fmt))
+
+    spec = FORMATS[fmt]
+    c2.download_button(
+        f"💾 Download {label}",
+        data=data,
+        file_name=f"{file_stem}.{spec['extension']}",
+        mime=spec["mime"],
+        key=f"{dataset}_export_download",
+    )
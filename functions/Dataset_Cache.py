@@ -0,0 +1,97 @@
+# functions/Dataset_Cache.py
+
+import os
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+# Shared by every Streamlit session in the process; least recently used frames go first
+MEMORY_BUDGET_BYTES = 512 * 1024 * 1024
+
+PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+_entries = OrderedDict()  # key -> (frame, nbytes)
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+def cache_fingerprint(cache_file):
+    # The parquet is rewritten on every rebuild, so its stat identifies the data version
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return None
+    return (cache_file, stat.st_mtime_ns, stat.st_size)
+
+def make_key(fingerprint, columns=None, filters=None):
+    columns_key = tuple(columns) if columns else None
+    filters_key = repr(filters) if filters else None
+    return (fingerprint, columns_key, filters_key)
+
+def frame_size(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+def copy_on_write_enabled():
+    # Always on from pandas 3; earlier releases only when the application has switched it on
+    return PANDAS_MAJOR >= 3 or pd.get_option("mode.copy_on_write") is True
+
+def view(df):
+    # Sessions share the cached data. Under copy-on-write a shallow copy already keeps edits on the
+    # view out of the cache; without it every session gets its own full copy
+    return df.copy(deep=not copy_on_write_enabled())
+
+def get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return view(entry[0])
+
+def peek(key):
+    # Lookup without touching the counters or LRU order
+    with _lock:
+        entry = _entries.get(key)
+        return view(entry[0]) if entry is not None else None
+
+def put(key, df):
+    nbytes = frame_size(df)
+    cache_file = key[0][0]
+    with _lock:
+        # A newer build of the same cache file makes older entries unreachable
+        for old_key in [k for k in _entries if k[0][0] == cache_file and k[0] != key[0]]:
+            del _entries[old_key]
+        if nbytes > MEMORY_BUDGET_BYTES:
+            return view(df)
+        _entries[key] = (df, nbytes)
+        _entries.move_to_end(key)
+        _evict()
+    return view(df)
+
+def _evict():
+    total = sum(nbytes for _, nbytes in _entries.values())
+    while total > MEMORY_BUDGET_BYTES and _entries:
+        _, (_, nbytes) = _entries.popitem(last=False)
+        total -= nbytes
+        _stats["evictions"] += 1
+
+def discard(cache_file):
+    with _lock:
+        for key in [k for k in _entries if k[0][0] == cache_file]:
+            del _entries[key]
+
+def clear():
+    with _lock:
+        _entries.clear()
+        for name in _stats:
+            _stats[name] = 0
+
+def stats():
+    with _lock:
+        return dict(
+            _stats,
+            entries=len(_entries),
+            bytes=sum(nbytes for _, nbytes in _entries.values()),
+            budget=MEMORY_BUDGET_BYTES,
+        )
@@ -0,0 +1,105 @@
+# functions/Dataset_Schema.py
+
+import numpy as np
+import pandas as pd
+
+# --- Shared stat column groups ---
+COUNT_COLUMNS = [
+    "MP", "SP", "S Pts W", "S Pts L", "SR Pts W", "SR Pts L",
+    "Ace", "S Err", "S Att", "SR Perf", "SR Good", "SR Poor", "SR Err", "SR Att",
+    "Kill", "A Err", "Att", "B Solo", "B Assist", "B Total", "Assist", "A Att",
+    "Digs", "Sent", "Received", "Violations", "BHE"
+]
+PERCENT_COLUMNS = ["S W %", "SO %", "S %"]
+RATE_COLUMNS = ["S Rtg", "SR Rtg", "H %"]
+METADATA_CATEGORY_COLUMNS = ["Season", "Home", "Away", "Team", "source_file"]
+
+# --- Per-dataset schemas ---
+# category: low-cardinality labels; datetime: parsed dates; percent: "33.80%" -> 33.8 (float32)
+# float: ratings and ratios (float32); count: smallest nullable int that fits
+# Columns not listed keep the generic numeric-or-string coercion
+MATCH_SCHEMA = {
+    "category": METADATA_CATEGORY_COLUMNS + ["Result", "Set 1", "Set 2", "Set 3", "Set 4", "Set 5"],
+    "datetime": ["Date"],
+    "percent": PERCENT_COLUMNS,
+    "float": RATE_COLUMNS,
+    "count": COUNT_COLUMNS,
+}
+ATHLETE_SCHEMA = {
+    "category": METADATA_CATEGORY_COLUMNS + ["Athlete"],
+    "datetime": ["Date"],
+    "percent": PERCENT_COLUMNS,
+    "float": RATE_COLUMNS,
+    "count": COUNT_COLUMNS + ["#"],
+}
+OVERALL_SCHEMA = {
+    "category": METADATA_CATEGORY_COLUMNS + ["Matches"],
+    "datetime": ["Date"],
+    "percent": PERCENT_COLUMNS,
+    "float": RATE_COLUMNS,
+    "count": COUNT_COLUMNS + ["By Set"],
+}
+ROTATION_SCHEMA = {
+    "category": METADATA_CATEGORY_COLUMNS + ["Rotation"],
+    "datetime": ["Date"],
+    "percent": PERCENT_COLUMNS,
+    "float": RATE_COLUMNS,
+    "count": COUNT_COLUMNS,
+}
+SETTER_SCHEMA = {
+    "category": METADATA_CATEGORY_COLUMNS + ["Setter Tendency"],
+    "datetime": ["Date"],
+    "percent": ["A %", "H %"],
+    "count": ["Position", "A Att"],
+}
+
+INT_DTYPES = [("Int16", np.int16), ("Int32", np.int32), ("Int64", np.int64)]
+
+def to_number(series):
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    # Exports write "33.80%" and "- 0.053"; "-" placeholders become NaN
+    text = series.astype(str).str.replace(r"[%\s]", "", regex=True)
+    return pd.to_numeric(text, errors="coerce")
+
+def to_category(series):
+    # Mixed int/str labels (historical vs. export files) must share one string category set
+    text = series.where(series.isna(), series.astype(str))
+    return text.astype("category")
+
+def to_float(series):
+    return to_number(series).astype("float32")
+
+def to_count(series):
+    values = to_number(series)
+    present = values.dropna()
+    if len(present) and not (present % 1 == 0).all():
+        return values.astype("float32")
+
+    low, high = (present.min(), present.max()) if len(present) else (0, 0)
+    for dtype, np_type in INT_DTYPES:
+        info = np.iinfo(np_type)
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values.astype("float64")
+
+def to_datetime(series):
+    return pd.to_datetime(series, errors="coerce")
+
+CONVERTERS = {
+    "category": to_category,
+    "datetime": to_datetime,
+    "percent": to_float,
+    "float": to_float,
+    "count": to_count,
+}
+
+def apply_schema(df, schema):
+    typed_cols = set()
+    for kind, columns in schema.items():
+        convert = CONVERTERS[kind]
+        for col in columns:
+            if col in df.columns and col not in typed_cols:
+                df[col] = convert(df[col])
+                typed_cols.add(col)
+    return typed_cols
@@ -0,0 +1,74 @@
+# functions/Dataset_Summary.py
+
+import json
+import os
+import pandas as pd
+
+TEAM_COLUMNS = ["Home", "Away", "Team"]
+
+def summary_path(cache_file):
+    return f"{cache_file}.summary.json"
+
+def cache_stat(cache_file):
+    stat = os.stat(cache_file)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def distinct_values(df, columns):
+    values = set()
+    for col in columns:
+        if col in df.columns:
+            values.update(str(value) for value in df[col].dropna().unique())
+    values.discard("Unknown")
+    return sorted(values)
+
+def build_summary(combined):
+    latest = pd.to_datetime(combined["Date"], errors="coerce").max() if "Date" in combined.columns else pd.NaT
+    seasons = distinct_values(combined, ["Season"])
+    teams = distinct_values(combined, TEAM_COLUMNS)
+    return {
+        "rows": int(len(combined)),
+        "latest_date": latest.strftime("%Y-%m-%d") if pd.notnull(latest) else None,
+        "seasons": seasons,
+        "season_count": len(seasons),
+        "teams": teams,
+        "team_count": len(teams),
+        "athlete_count": len(distinct_values(combined, ["Athlete"])),
+        "source_file_count": int(combined["source_file"].nunique()) if "source_file" in combined.columns else 0,
+    }
+
+def write_summary(combined, cache_file):
+    # Written after the parquet so the recorded stat ties the summary to that exact build
+    try:
+        summary = dict(build_summary(combined), cache=cache_stat(cache_file))
+        tmp_path = summary_path(cache_file) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, summary_path(cache_file))
+    except Exception as e:
+        print(f"⚠️ Failed to write dataset summary for {cache_file}: {e}")
+
+def read_summary(cache_file):
+    # Returns None when the summary is missing or belongs to an older build of the cache
+    try:
+        with open(summary_path(cache_file), "r", encoding="utf-8") as f:
+            summary = json.load(f)
+        if summary.get("cache") != cache_stat(cache_file):
+            return None
+        return summary
+    except (OSError, ValueError):
+        return None
+
+def load_summary(cache_file, is_current, load_func):
+    # is_current: whether the cache still matches its sources; otherwise rebuild through the loader first
+    summary = read_summary(cache_file) if is_current else None
+    if summary is not None:
+        return summary
+
+    df = load_func()
+    summary = read_summary(cache_file)
+    if summary is None and not df.empty:
+        # Caches built before summaries existed get one from the frame already in hand
+        if os.path.exists(cache_file):
+            write_summary(df, cache_file)
+        summary = read_summary(cache_file) or build_summary(df)
+    return summary
@@ -0,0 +1,119 @@
+# functions/Filter_Index.py
+
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# Inverted index written next to each cache: for every filter column, each distinct value maps to
+# the row positions holding it, stored CSR-style as values / offsets / positions arrays
+INDEX_COLUMNS = ["Season", "Home", "Away", "Team", "Athlete", "Setter Tendency", "Position"]
+
+def index_path(cache_file):
+    return f"{cache_file}.index.npz"
+
+def build_column_index(series):
+    codes, values = pd.factorize(series, sort=True)
+    present = codes >= 0
+    order = np.flatnonzero(present)[np.argsort(codes[present], kind="stable")]
+    counts = np.bincount(codes[present], minlength=len(values))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return {
+        "values": np.asarray([str(value) for value in values], dtype=str),
+        "offsets": offsets.astype(np.int64),
+        "positions": order.astype(np.int64),
+    }
+
+def build_index(df, columns=INDEX_COLUMNS):
+    index = {"rows": len(df), "columns": {}}
+    for col in columns:
+        if col in df.columns:
+            index["columns"][col] = build_column_index(df[col])
+    return index
+
+def write_index(df, cache_file):
+    # Tied to the parquet's stat the same way the summary sidecar is
+    try:
+        stat = os.stat(cache_file)
+        arrays = {"rows": np.int64(len(df)), "cache_size": np.int64(stat.st_size), "cache_mtime_ns": np.int64(stat.st_mtime_ns)}
+        for col, entry in build_index(df)["columns"].items():
+            for name, array in entry.items():
+                arrays[f"{col}/{name}"] = array
+        tmp_path = index_path(cache_file) + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, index_path(cache_file))
+    except Exception as e:
+        print(f"⚠️ Failed to write filter index for {cache_file}: {e}")
+
+@lru_cache(maxsize=16)
+def _read_index(cache_file, size, mtime_ns):
+    # Keyed on the cache stat, so each build is read from disk once per process
+    try:
+        with np.load(index_path(cache_file), allow_pickle=False) as data:
+            if int(data["cache_size"]) != size or int(data["cache_mtime_ns"]) != mtime_ns:
+                return None
+            index = {"rows": int(data["rows"]), "columns": {}}
+            for key in data.files:
+                if "/" in key:
+                    col, name = key.split("/", 1)
+                    index["columns"].setdefault(col, {})[name] = data[key]
+            return index
+    except (OSError, ValueError, KeyError):
+        return None
+
+def read_index(cache_file):
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return None
+    return _read_index(cache_file, stat.st_size, stat.st_mtime_ns)
+
+def load_index(cache_file, df):
+    # Falls back to indexing the frame in hand for caches built before the index existed
+    index = read_index(cache_file)
+    if index is not None and index["rows"] == len(df):
+        return index
+    if os.path.exists(cache_file):
+        write_index(df, cache_file)
+        index = read_index(cache_file)
+        if index is not None and index["rows"] == len(df):
+            return index
+    return build_index(df)
+
+def remove_index(cache_file):
+    path = index_path(cache_file)
+    if os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
+
+# --- Queries ---
+def options(index, col):
+    entry = index["columns"].get(col)
+    return entry["values"].tolist() if entry is not None else []
+
+def value_positions(index, col, selected):
+    entry = index["columns"][col]
+    selected = set(selected)
+    offsets, positions = entry["offsets"], entry["positions"]
+    chunks = [
+        positions[offsets[code]:offsets[code + 1]]
+        for code, value in enumerate(entry["values"].tolist())
+        if value in selected
+    ]
+    return np.sort(np.concatenate(chunks)) if chunks else np.empty(0, dtype=np.int64)
+
+def select(index, selections, base=None):
+    # selections: {column: selected labels}; empty selections are ignored
+    # base: optional row positions every result must fall within
+    # Returns sorted row positions, or None when nothing narrows the frame
+    result = base
+    for col, selected in selections.items():
+        if not selected or col not in index["columns"]:
+            continue
+        matched = value_positions(index, col, selected)
+        result = matched if result is None else np.intersect1d(result, matched, assume_unique=True)
+    return result
+
+def take(df, positions):
+    return df if positions is None else df.iloc[positions]
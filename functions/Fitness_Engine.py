@@ -0,0 +1,441 @@
+# functions/Fitness_Engine.py
+
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from functions import Dataset_Cache
+
+# Testing Data.csv is read once per file version into a typed long-format store
+# (one row per athlete x testing date x metric); every tab query is memoized on that version
+TESTING_DATA_FILE = "data/Testing Data.csv"
+VBC_NORMS_FILE = "data/Volleyball Canada Normative.csv"
+ROSTER_DIR = "rosters"
+ROSTER_FILE = "team_info.csv"
+
+ID_COLUMNS = ["Athlete", "Primary Position", "Year of Eligibility", "Testing Date"]
+
+METRIC_LABELS = {
+    "Height (in.)": "Height", "Weight (lbs)": "Weight",
+    "Block Touch (in.)": "Block Touch", "Approach Touch (in.)": "Approach Touch",
+    "Broad Jump (in.)": "Broad Jump", "Block Vertical (in.)": "Block Vertical",
+    "Approach Vertical (in.)": "Approach Vertical", "Reps at E[X] Bench": "Reps @ E[X] Bench",
+    "Agility Test (s)": "Agility Test", "10 Down and Backs (s)": "10 Down and Backs",
+    "Yo-Yo Cardio Test": "Yo-Yo Test",
+}
+METRIC_COLUMNS = {label: col for col, label in METRIC_LABELS.items()}
+TRACKED_METRICS = sorted(METRIC_COLUMNS)
+
+POSITION_GROUPS = {
+    "Outside Hitters": ["LS", "RS"],
+    "Middle Hitters": ["MB", "M", "MH"],
+    "Setters & Liberos": ["S", "LIB"],
+}
+CORRELATION_COMPLETENESS = 0.75
+
+RADAR_GROUPS = {
+    "Touches & Physical Attributes": {
+        "Height (in.)": "Height", "Weight (lbs)": "Weight", "Block Touch (in.)": "Block Touch",
+        "Approach Touch (in.)": "Approach Touch", "Broad Jump (in.)": "Broad Jump",
+    },
+    "Performance & Capacity Metrics": {
+        "Block Vertical (in.)": "Block Vertical", "Approach Vertical (in.)": "Approach Vertical",
+        "Reps at E[X] Bench": "Reps @ E[X] Bench", "Agility Test (s)": "Agility Test",
+        "10 Down and Backs (s)": "10 Down/Backs", "Yo-Yo Cardio Test": "Yo-Yo Test",
+    },
+}
+LOWER_IS_BETTER = ["Agility Test (s)", "10 Down and Backs (s)"]
+
+# Team positions and the matching labels in the Volleyball Canada normative file
+VBC_METRICS = {
+    "Approach Touch (in.)": "Spike Touch (in)",
+    "Block Touch (in.)": "Block Touch (in)",
+    "Attack Velocity (km/h)": "Attack Velocity (kmph)",
+    "Serve Velocity (km/h)": "Spin Velocity (kmph)",
+}
+VBC_POSITIONS = {"S": "Setter", "LS": "Left Side", "RS": "Opposite", "M": "Middle", "LIB": "Libero"}
+VBC_RATINGS = ["Minimum", "Average", "Best"]
+
+def file_version(path):
+    # Identifies the file contents the same way the loader caches do: by stat
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+def scope_key(athletes):
+    # Hashable, order-independent key for an athlete selection; None means everyone
+    return None if athletes is None else tuple(sorted(set(athletes)))
+
+def selection_key(values):
+    return tuple(sorted(set(values))) if values else ()
+
+# --- Store ---
+def to_numeric(series):
+    # Free-text markers ("Injured", "RETIRED") become NaN; "1,620.00" keeps its value
+    return pd.to_numeric(series.str.replace(",", "", regex=False).str.strip(), errors="coerce")
+
+def build_store(raw):
+    raw = raw.copy()
+    raw.columns = raw.columns.str.strip()
+    wide = pd.DataFrame({
+        "Athlete": raw["Athlete"].astype(str).str.strip(),
+        "Primary Position": raw["Primary Position"].str.strip(),
+        "Year of Eligibility": pd.to_numeric(raw["Year of Eligibility"], errors="coerce").astype("Int64"),
+        "Testing Date": pd.to_datetime(raw["Testing Date"], errors="coerce"),
+    })
+    metrics = [col for col in raw.columns if col not in ID_COLUMNS]
+    for col in metrics:
+        wide[col] = to_numeric(raw[col]).astype("float64")
+
+    long = wide.melt(
+        id_vars=["Athlete", "Primary Position", "Testing Date"], value_vars=metrics,
+        var_name="Metric", value_name="Value",
+    ).dropna(subset=["Testing Date", "Value"])
+    for col in ["Athlete", "Primary Position", "Metric"]:
+        long[col] = long[col].astype("category")
+    long = long.sort_values(["Metric", "Athlete", "Testing Date"], kind="stable").reset_index(drop=True)
+    return {"wide": wide, "long": long, "metrics": metrics}
+
+@lru_cache(maxsize=4)
+def _read_store(path, size, mtime_ns):
+    try:
+        return build_store(pd.read_csv(path, dtype=str))
+    except Exception as e:
+        print(f"⚠️ Failed to load Testing Data: {e}")
+        return build_store(pd.DataFrame(columns=ID_COLUMNS))
+
+def load_store(path=TESTING_DATA_FILE):
+    version = file_version(path)
+    if version is None:
+        return build_store(pd.DataFrame(columns=ID_COLUMNS))
+    return _read_store(*version)
+
+def testing_version():
+    return file_version(TESTING_DATA_FILE)
+
+def scoped_wide(store, scope):
+    wide = store["wide"]
+    return wide if scope is None else wide[wide["Athlete"].isin(scope)]
+
+def metric_rows(store, column=None, scope=None):
+    # column=None keeps every metric
+    long = store["long"]
+    rows = long if column is None else long[long["Metric"] == column]
+    if scope is not None:
+        rows = rows[rows["Athlete"].isin(scope)]
+    return rows
+
+# --- Roster ---
+@lru_cache(maxsize=4)
+def _read_active_athletes(roster_path, size, mtime_ns):
+    try:
+        roster_df = pd.read_csv(roster_path)
+        roster_df.columns = roster_df.columns.str.strip().str.lower()
+        if "name" in roster_df.columns:
+            return tuple(sorted(set(roster_df["name"].dropna().str.strip())))
+    except Exception:
+        pass
+    return ()
+
+def active_athletes(roster_base_dir=ROSTER_DIR, csv_name=ROSTER_FILE):
+    # Names on the most recent season's roster, and that season
+    if not os.path.exists(roster_base_dir):
+        return (), None
+    seasons = sorted(
+        [d for d in os.listdir(roster_base_dir) if os.path.isdir(os.path.join(roster_base_dir, d))],
+        reverse=True
+    )
+    if not seasons:
+        return (), None
+    latest_season = seasons[0]
+    version = file_version(os.path.join(roster_base_dir, latest_season, csv_name))
+    if version is None:
+        return (), latest_season
+    return _read_active_athletes(*version), latest_season
+
+# --- Tab queries ---
+@lru_cache(maxsize=64)
+def _athlete_options(version, scope):
+    wide = scoped_wide(load_store(), scope)
+    return tuple(sorted(wide["Athlete"].dropna().unique())), tuple(sorted(wide["Primary Position"].dropna().unique()))
+
+def athlete_options(scope=None):
+    return list(_athlete_options(testing_version(), scope_key(scope))[0])
+
+def position_options(scope=None):
+    return list(_athlete_options(testing_version(), scope_key(scope))[1])
+
+@lru_cache(maxsize=64)
+def _metric_frame(version, metric, scope, athletes, positions):
+    column = METRIC_COLUMNS[metric]
+    rows = metric_rows(load_store(), column, scope)
+    if athletes:
+        rows = rows[rows["Athlete"].isin(athletes)]
+    if positions:
+        rows = rows[rows["Primary Position"].isin(positions)]
+    out = rows[["Athlete", "Primary Position", "Testing Date", "Value"]].rename(columns={"Value": column})
+    for col in ["Athlete", "Primary Position"]:
+        out[col] = out[col].astype(str)
+    return out.sort_values(["Testing Date", "Athlete"], kind="stable").reset_index(drop=True)
+
+def metric_frame(metric, scope=None, athletes=(), positions=()):
+    # One metric's tests as Athlete / Primary Position / Testing Date / <raw column>
+    return Dataset_Cache.view(_metric_frame(
+        testing_version(), metric, scope_key(scope), selection_key(athletes), selection_key(positions)
+    ))
+
+@lru_cache(maxsize=64)
+def _progress_table(version, metric, scope, athletes, positions):
+    column = METRIC_COLUMNS[metric]
+    chart_df = _metric_frame(version, metric, scope, athletes, positions)
+    pivot = chart_df.pivot_table(
+        index=["Athlete", "Primary Position"], columns="Testing Date", values=column, aggfunc="mean"
+    ).sort_index(axis=1)
+    date_cols = [col.strftime("%B %Y") for col in pivot.columns]
+    pivot.columns = date_cols
+    pivot = pivot.reset_index().rename(columns={"Athlete": "Name", "Primary Position": "Position"})
+
+    if len(date_cols) >= 2:
+        pivot["Δ Last"] = (pivot[date_cols[-1]] - pivot[date_cols[-2]]).round(2)
+        pivot["Δ Net"] = (pivot[date_cols[-1]] - pivot[date_cols[0]]).round(2)
+    else:
+        pivot["Δ Last"] = np.nan
+        pivot["Δ Net"] = np.nan
+    return pivot[["Name", "Position"] + date_cols + ["Δ Last", "Δ Net"]]
+
+def progress_table(metric, scope=None, athletes=(), positions=()):
+    # Athlete x testing date table with Δ Last (latest two dates) and Δ Net (first to latest date)
+    return Dataset_Cache.view(_progress_table(
+        testing_version(), metric, scope_key(scope), selection_key(athletes), selection_key(positions)
+    ))
+
+@lru_cache(maxsize=16)
+def _metric_ranges(version, scope, columns):
+    values = scoped_wide(load_store(), scope)[list(columns)]
+    return values.min().to_numpy(dtype=float), values.max().to_numpy(dtype=float)
+
+def normalize_values(values, low, high, columns):
+    # Min-max scale each metric to 0-100 over the team's range; timed tests are flipped so that
+    # a larger radar area always means a better result
+    span = high - low
+    scaled = (values - low) / np.where(span > 0, span, np.nan)
+    lower = np.isin(columns, LOWER_IS_BETTER)
+    scaled[:, lower] = 1 - scaled[:, lower]
+    return scaled * 100
+
+@lru_cache(maxsize=64)
+def _radar_data(version, scope, athletes, columns, normalize, team_average, latest_only):
+    wide = scoped_wide(load_store(), scope).dropna(subset=["Testing Date"])
+    columns = list(columns)
+
+    tests = wide.loc[wide["Athlete"].isin(athletes), ["Athlete", "Testing Date"] + columns]
+    tests = tests[tests[columns].notna().any(axis=1)].sort_values(["Athlete", "Testing Date"], kind="stable")
+    if latest_only:
+        tests = tests.groupby("Athlete", sort=False).tail(1)
+    dates = tests["Testing Date"].dt.strftime("%B %Y")
+    names = dates if len(athletes) == 1 else tests["Athlete"] + " – " + dates
+    blocks, labels = [tests[columns].to_numpy(dtype=float)], names.tolist()
+
+    if team_average:
+        team = wide.groupby("Testing Date")[columns].mean()
+        team = team[team.notna().any(axis=1)]
+        if latest_only:
+            team = team.tail(1)
+        blocks.append(team.to_numpy(dtype=float))
+        labels += ("Team Average – " + team.index.strftime("%B %Y")).tolist()
+
+    values = np.vstack(blocks) if blocks else np.empty((0, len(columns)))
+    if normalize:
+        values = normalize_values(values, *_metric_ranges(version, scope, tuple(columns)), columns)
+    values.setflags(write=False)
+    return {"names": tuple(labels), "values": values}
+
+def radar_data(athletes, columns, scope=None, normalize=False, team_average=False, latest_only=False):
+    # Dense (trace x metric) array for the selected athletes' tests, plus optional team averages per
+    # testing date; one trace per row, named by date (single athlete) or athlete and date
+    return _radar_data(
+        testing_version(), scope_key(scope), selection_key(athletes), tuple(columns),
+        bool(normalize), bool(team_average), bool(latest_only),
+    )
+
+DELTA_COLUMNS = [
+    "Athlete", "Δ_val_1st", "Δ_pct_1st", "Δ_val_2nd", "Δ_pct_2nd",
+    "First Test Date", "Second Last Test Date", "Most Recent Test Date",
+]
+
+def percent_change(diff, base):
+    # Relative to the most recent value, as the Delta tab has always shown it; undefined at zero
+    return (100 * diff / base.where(base != 0)).round(2)
+
+def build_delta_table(rows):
+    # rows: long-format tests sorted by Metric, Athlete, Testing Date
+    # Returns the Delta tab table for every (metric, athlete) with two or more tests
+    grouped = rows.groupby(["Metric", "Athlete"], observed=True, sort=False)
+    counts = grouped["Value"].transform("size")
+    from_end = grouped.cumcount(ascending=False)
+    rows = rows[counts >= 2]
+    from_end, counts = from_end[counts >= 2], counts[counts >= 2]
+
+    key = ["Metric", "Athlete"]
+    first = rows.groupby(key, observed=True, sort=False).head(1).set_index(key)
+    last = rows[from_end == 0].set_index(key)
+    # The previous test only counts once there are three or more, so Δ since previous is never Δ since first
+    previous = rows[(from_end == 1) & (counts >= 3)].set_index(key).reindex(last.index)
+
+    diff_first = last["Value"] - first["Value"].reindex(last.index)
+    diff_previous = last["Value"] - previous["Value"]
+    table = pd.DataFrame({
+        "Δ_val_1st": diff_first.round(2),
+        "Δ_pct_1st": percent_change(diff_first, last["Value"]),
+        "Δ_val_2nd": diff_previous.round(2),
+        "Δ_pct_2nd": percent_change(diff_previous, last["Value"]),
+        "First Test Date": first["Testing Date"].reindex(last.index).dt.strftime("%B %Y"),
+        "Second Last Test Date": previous["Testing Date"].dt.strftime("%B %Y"),
+        "Most Recent Test Date": last["Testing Date"].dt.strftime("%B %Y"),
+    }, index=last.index).reset_index()
+    table["Athlete"] = table["Athlete"].astype(str)
+    return table.sort_values(["Metric", "Athlete"], kind="stable")
+
+@lru_cache(maxsize=16)
+def _delta_tables(version, scope, positions):
+    rows = metric_rows(load_store(), None, scope)
+    if positions:
+        rows = rows[rows["Primary Position"].isin(positions)]
+    table = build_delta_table(rows)
+    # One frame per metric, so switching metric or display mode is a dictionary lookup
+    return {
+        str(metric): frame[DELTA_COLUMNS].reset_index(drop=True)
+        for metric, frame in table.groupby("Metric", observed=True, sort=False)
+    }
+
+def delta_summary(metric, scope=None, positions=()):
+    # Per athlete with two or more tests: change since the first and since the previous test
+    tables = _delta_tables(testing_version(), scope_key(scope), selection_key(positions))
+    table = tables.get(METRIC_COLUMNS[metric])
+    return Dataset_Cache.view(table) if table is not None else pd.DataFrame(columns=DELTA_COLUMNS)
+
+def build_standard_scores(rows):
+    # rows: long-format tests; adds Z-Score and Percentile against everyone tested on the same
+    # date for the same metric, keeping only dates with two or more scores
+    grouped = rows.groupby(["Metric", "Testing Date"], observed=True)["Value"]
+    counts = grouped.transform("count")
+    mean = grouped.transform("mean")
+    std = grouped.transform("std", ddof=0)
+    scores = rows.assign(
+        **{
+            "Z-Score": (rows["Value"] - mean) / std.where(std > 0),
+            "Percentile": (grouped.rank(pct=True) * 100).round(1),
+            "Tested": counts,
+        }
+    )
+    return scores[counts >= 2]
+
+@lru_cache(maxsize=8)
+def _standard_scores(version, scope):
+    scores = build_standard_scores(metric_rows(load_store(), None, scope))
+    return {
+        str(metric): frame.drop(columns="Metric").sort_values(["Testing Date", "Athlete"], kind="stable")
+        for metric, frame in scores.groupby("Metric", observed=True, sort=False)
+    }
+
+def zscore_frame(metric, athletes=(), scope=None):
+    # Slices the precomputed matrix: one row per selected athlete and testing date with the raw
+    # value, Z-Score and Percentile relative to every athlete in scope tested that day
+    column = METRIC_COLUMNS[metric]
+    scores = _standard_scores(testing_version(), scope_key(scope)).get(column)
+    if scores is None:
+        return pd.DataFrame(columns=["Athlete", "Testing Date", column, "Z-Score", "Percentile", "Tested"])
+    if athletes:
+        scores = scores[scores["Athlete"].isin(list(athletes))]
+    out = scores[["Athlete", "Testing Date", "Value", "Z-Score", "Percentile", "Tested"]].rename(columns={"Value": column})
+    out["Athlete"] = out["Athlete"].astype(str)
+    return out.reset_index(drop=True)
+
+@lru_cache(maxsize=64)
+def _testing_dates(version, scope):
+    dates = scoped_wide(load_store(), scope)["Testing Date"].dropna().unique()
+    return tuple(sorted(pd.Timestamp(date) for date in dates))
+
+def testing_dates(scope=None):
+    # Distinct testing dates in scope, oldest first
+    return list(_testing_dates(testing_version(), scope_key(scope)))
+
+def pooled_rows(version, scope, dates):
+    wide = scoped_wide(load_store(), scope)
+    return wide[wide["Testing Date"].isin(dates)]
+
+@lru_cache(maxsize=64)
+def _eligible_metrics(version, scope, dates):
+    rows = pooled_rows(version, scope, dates)
+    if rows.empty:
+        return ()
+    completeness = rows[list(METRIC_LABELS)].notna().mean()
+    return tuple(col for col in METRIC_LABELS if completeness[col] >= CORRELATION_COMPLETENESS)
+
+@lru_cache(maxsize=256)
+def _group_correlation(version, scope, dates, group, eligible):
+    # Keyed by (data version, scope, testing dates, position group, eligible metrics), so a rerun,
+    # or a return to a pooling choice already viewed, reuses the matrix instead of recomputing it
+    rows = pooled_rows(version, scope, dates)
+    group_df = rows.loc[rows["Primary Position"].isin(POSITION_GROUPS[group]), list(eligible)]
+    group_df = group_df.replace(0, np.nan).dropna()
+    if len(eligible) < 2 or group_df.shape[0] < 2:
+        return None
+    return group_df.corr()
+
+def position_correlations(scope=None, recent_dates=1):
+    # Metric correlations per position group over the most recent `recent_dates` testing dates
+    # (each athlete test is one sample), using only metrics at least CORRELATION_COMPLETENESS
+    # complete over those dates; groups with under two complete rows map to None
+    version = testing_version()
+    scope = scope_key(scope)
+    dates = _testing_dates(version, scope)[-max(int(recent_dates), 1):]
+    eligible = _eligible_metrics(version, scope, dates)
+    return {
+        "dates": list(dates),
+        "eligible": list(eligible),
+        "matrices": {group: _group_correlation(version, scope, dates, group, eligible) for group in POSITION_GROUPS},
+    }
+
+# --- Volleyball Canada benchmarks ---
+@lru_cache(maxsize=4)
+def _read_vbc_norms(path, size, mtime_ns):
+    df = pd.read_csv(path)
+    df.columns = df.columns.str.strip()
+    return df
+
+def load_vbc_norms(path=VBC_NORMS_FILE):
+    version = file_version(path)
+    return Dataset_Cache.view(_read_vbc_norms(*version)) if version else pd.DataFrame()
+
+def vbc_age_groups():
+    norms = load_vbc_norms()
+    return sorted(norms["Age-Group"].dropna().unique()) if "Age-Group" in norms.columns else []
+
+def benchmark_values(metric, position, age_group):
+    # Mean normative value per rating for a team metric and team position code; missing ratings are NaN
+    norms = load_vbc_norms()
+    vbc_metric = VBC_METRICS[metric]
+    rows = norms[
+        (norms["Position"] == VBC_POSITIONS[position])
+        & (norms["Age-Group"] == age_group)
+        & norms[vbc_metric].notna()
+    ]
+    means = pd.to_numeric(rows[vbc_metric], errors="coerce").groupby(rows["Rating"]).mean()
+    return {rating: means.get(rating, np.nan) for rating in VBC_RATINGS}
+
+def position_tests(metric, position):
+    # Every team test of one metric for a position, regardless of roster scope
+    wide = load_store()["wide"]
+    rows = wide.loc[wide["Primary Position"] == position, ["Athlete", "Testing Date", metric]]
+    rows = rows.dropna(subset=["Testing Date", metric, "Athlete"]).copy()
+    rows["Date Label"] = rows["Testing Date"].dt.strftime("%b %Y")
+    return rows
+
+def clear():
+    for cached in (_read_store, _read_active_athletes, _athlete_options, _metric_frame, _progress_table,
+                   _metric_ranges, _radar_data, _delta_tables, _standard_scores, _testing_dates,
+                   _eligible_metrics, _group_correlation, _read_vbc_norms):
+        cached.cache_clear()
@@ -0,0 +1,338 @@
+# functions/Ingestion_Core.py
+
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import re
+from datetime import datetime
+from functools import lru_cache
+from functions import Build_Log, Cache_Manifest, Dataset_Cache, Dataset_Schema, Dataset_Summary, Filter_Index, Parallel_Build, Partition_Store, Team_Aliases
+
+METADATA_COLUMNS = ["Season", "Date", "Home", "Away", "Team"]
+
+# Exports at or above this size are parsed in row batches of STREAM_CHUNK_ROWS instead of all at once
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_ROWS = 50_000
+
+DATE_IN_PARENS_PATTERN = re.compile(r"\((\d{4}-\d{2}-\d{2})\)")
+TOTALS_TEAM_PATTERN = re.compile(r"Totals\s+(.*?)\s+\(")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+VS_PATTERN = re.compile(r"(.+?)\s+vs\s+([^-^(]+)", re.IGNORECASE)
+AT_PATTERN = re.compile(r"(.+?)\s+@\s+([^-^(]+)", re.IGNORECASE)
+
+# --- Per-dataset specs ---
+# rename_columns: header renames applied right after dedup
+# drop_label_rows: {column: label} rows whose stripped, lower-cased value equals label are dropped
+# reorder_columns: force metadata first and source_file last
+ATHLETE_SPEC = {"reorder_columns": True}
+OVERALL_SPEC = {}
+ROTATION_SPEC = {
+    "rename_columns": {"Matches": "Rotation"},
+    "drop_label_rows": {"Rotation": "by rotation"},
+}
+
+def infer_season_from_date(date_str):
+    try:
+        match_date = datetime.strptime(date_str, "%Y-%m-%d")
+        year = match_date.year
+        return f"{year}-{year + 1}" if match_date.month >= 9 else f"{year - 1}-{year}"
+    except:
+        return "Unknown"
+
+def extract_home_away_team(file_name):
+    # Normalize dashes and whitespace
+    cleaned = file_name.replace("—", "-").replace("–", "-")
+    cleaned = WHITESPACE_PATTERN.sub(" ", cleaned)
+
+    prefix = cleaned.split("Totals")[0].strip()
+    vs_match = VS_PATTERN.search(prefix)
+    at_match = AT_PATTERN.search(prefix)
+
+    if vs_match:
+        home_team = vs_match.group(1).strip()
+        away_team = vs_match.group(2).strip()
+    elif at_match:
+        away_team = at_match.group(1).strip()
+        home_team = at_match.group(2).strip()
+    else:
+        home_team = away_team = "Unknown"
+
+    return home_team, away_team
+
+@lru_cache(maxsize=4096)
+def parse_filename_metadata(file_name):
+    date_match = DATE_IN_PARENS_PATTERN.search(file_name)
+    date_str = date_match.group(1) if date_match else "Unknown"
+    season = infer_season_from_date(date_str)
+    home_team, away_team = extract_home_away_team(file_name)
+    team_match = TOTALS_TEAM_PATTERN.search(file_name)
+    team = team_match.group(1).strip() if team_match else "Unknown"
+    return season, date_str, home_team, away_team, team
+
+def dedupe_headers(raw_cols):
+    seen = {}
+    deduped_cols = []
+    for col in raw_cols:
+        count = seen.get(col)
+        if count is None:
+            seen[col] = 0
+            deduped_cols.append(col)
+        else:
+            seen[col] = count + 1
+            deduped_cols.append(f"{col}.{count + 1}")
+    return deduped_cols
+
+def is_spacer_column(col):
+    return str(col).startswith("0")
+
+def read_export(file_path):
+    # Exports carry a title line, then the header row, then data
+    with Build_Log.stage("read"):
+        df_raw = pd.read_csv(file_path, header=None, skiprows=1)
+    with Build_Log.stage("dedup"):
+        df_raw.columns = dedupe_headers(list(df_raw.iloc[0]))
+        return df_raw.drop(index=0).reset_index(drop=True)
+
+def read_export_header(file_path):
+    header = pd.read_csv(file_path, header=None, skiprows=1, nrows=1, dtype=str)
+    return dedupe_headers(list(header.iloc[0]))
+
+def iter_export_chunks(file_path, chunk_rows=None):
+    # Text-only reads keep every batch on the same column types as a whole-file read of an export
+    chunk_rows = chunk_rows or STREAM_CHUNK_ROWS
+    header = read_export_header(file_path)
+    reader = pd.read_csv(file_path, header=None, skiprows=2, names=header, dtype=str, chunksize=chunk_rows)
+    with reader:
+        for chunk in reader:
+            yield chunk.reset_index(drop=True)
+
+def prepare_export_rows(df, spec):
+    rename_columns = spec.get("rename_columns")
+    if rename_columns:
+        df.columns = [rename_columns.get(col, col) for col in df.columns]
+
+    for col, label in spec.get("drop_label_rows", {}).items():
+        if col in df.columns:
+            df = df[df[col].astype(str).str.strip().str.lower() != label]
+    return df
+
+def add_export_metadata(df, file_name, spec):
+    # "0" spacer columns are dropped before the metadata is added so no copy carries them
+    df = df[[col for col in df.columns if not is_spacer_column(col)]]
+
+    for pos, value in enumerate(parse_filename_metadata(file_name)):
+        df.insert(pos, METADATA_COLUMNS[pos], value)
+    df["source_file"] = file_name
+
+    if spec.get("reorder_columns"):
+        other_cols = [col for col in df.columns if col not in METADATA_COLUMNS + ["source_file"]]
+        df = df[METADATA_COLUMNS + other_cols + ["source_file"]]
+
+    return df
+
+def process_export_file(file_path, file_name, spec):
+    try:
+        df = read_export(file_path)
+        Build_Log.set_rows(rows_in=len(df))
+        df = prepare_export_rows(df, spec)
+    except Exception as e:
+        Build_Log.skip(f"{type(e).__name__}: {e}")
+        return None
+    with Build_Log.stage("metadata"):
+        return add_export_metadata(df, file_name, spec)
+
+def stream_export_file(file_path, file_name, spec, dataset, chunk_rows=None):
+    # Parses one export in bounded row batches straight into its partition file
+    # Returns (partition path, rows), or None when the file cannot be parsed
+    season, date_str = parse_filename_metadata(file_name)[:2]
+    path = Partition_Store.partition_path(dataset, season, date_str, file_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    writer = None
+    rows_in = rows = 0
+    chunks = iter_export_chunks(file_path, chunk_rows)
+    try:
+        while True:
+            with Build_Log.stage("read"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            rows_in += len(chunk)
+            with Build_Log.stage("metadata"):
+                chunk = add_export_metadata(prepare_export_rows(chunk, spec), file_name, spec)
+                chunk.columns = [str(col) for col in chunk.columns]
+            with Build_Log.stage("parquet write"):
+                if writer is None:
+                    # Every export cell is text at this point, so one all-string schema fits every batch
+                    schema = pa.schema([(col, pa.string()) for col in chunk.columns])
+                    writer = pq.ParquetWriter(path, schema)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False))
+            rows += len(chunk)
+        Build_Log.set_rows(rows_in=rows_in, rows_out=rows)
+    except Exception as e:
+        print(f"⚠️ Failed to stream {file_name}: {e}")
+        Build_Log.skip(f"{type(e).__name__}: {e}")
+        if writer is not None:
+            writer.close()
+        Partition_Store.remove_partition(path)
+        return None
+    if writer is None:
+        Build_Log.skip("no rows returned")
+        return None
+    writer.close()
+    return path, rows
+
+def collect_export_frames(dataset, source_dir, process_func, force_rebuild=False, incremental=True, workers=None, executor=None, stream_func=None):
+    # stream_func(file_path, file_name, dataset) handles exports over STREAM_THRESHOLD_BYTES in incremental builds
+    if incremental:
+        return Partition_Store.load_partitioned_files(
+            dataset, source_dir, process_func, force_rebuild, workers, executor,
+            stream_func=stream_func, stream_threshold=STREAM_THRESHOLD_BYTES
+        )
+    files = Parallel_Build.list_source_files(source_dir)
+    return [
+        df for df in Parallel_Build.parse_files(process_func, files, workers, executor)
+        if df is not None
+    ]
+
+def align_with_exports(hist_df, all_dfs):
+    # Historical files and per-match exports share one column layout, padded with NA on either side
+    if all_dfs:
+        for col in all_dfs[0].columns:
+            if col not in hist_df.columns:
+                hist_df[col] = pd.NA
+        for col in hist_df.columns:
+            if col not in all_dfs[0].columns:
+                for i in range(len(all_dfs)):
+                    all_dfs[i][col] = pd.NA
+        hist_df = hist_df[all_dfs[0].columns]
+    return hist_df
+
+def coerce_column_types(combined, schema=None):
+    combined.columns = [str(col) for col in combined.columns]
+    typed_cols = Dataset_Schema.apply_schema(combined, schema) if schema else set()
+
+    for col in combined.columns:
+        if col in typed_cols:
+            continue
+        # A column with any non-numeric cell stays as it is (pandas 3 dropped errors="ignore")
+        try:
+            combined[col] = pd.to_numeric(combined[col])
+        except (ValueError, TypeError):
+            pass
+        if not pd.api.types.is_numeric_dtype(combined[col]) and not pd.api.types.is_bool_dtype(combined[col]):
+            try:
+                combined[col] = combined[col].astype(str)
+            except (ValueError, TypeError):
+                combined[col] = combined[col].apply(lambda x: str(x) if not isinstance(x, str) else x)
+
+    return combined
+
+def combine_frames(all_dfs, schema=None):
+    # Aliases are applied after concat so partitions keep the names as exported
+    with Build_Log.stage("concat"):
+        combined = pd.concat(all_dfs, ignore_index=True)
+        # Drop the per-file frames as soon as they are copied so typing only holds the combined frame
+        all_dfs.clear()
+        combined = Team_Aliases.apply_aliases(combined)
+    with Build_Log.stage("coercion"):
+        combined = coerce_column_types(combined, schema)
+    Build_Log.set_rows_out(len(combined))
+    return combined
+
+def write_parquet_batches(df, path, batch_rows=None):
+    # Converts one row batch to arrow at a time instead of the whole frame, under the schema the
+    # whole frame infers, so every batch lands with the same column types
+    batch_rows = batch_rows or STREAM_CHUNK_ROWS
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    tmp_path = path + ".tmp"
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for start in range(0, len(df), batch_rows):
+            batch = df.iloc[start:start + batch_rows]
+            writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
+    os.replace(tmp_path, path)
+
+def write_cache(combined, cache_file, manifest):
+    try:
+        with Build_Log.stage("parquet write"):
+            write_parquet_batches(combined, cache_file)
+            Cache_Manifest.write_manifest(cache_file, manifest)
+        with Build_Log.stage("sidecars"):
+            Dataset_Summary.write_summary(combined, cache_file)
+            Filter_Index.write_index(combined, cache_file)
+        return True
+    except Exception as e:
+        print(f"❌ Failed to write cache {cache_file}: {e}")
+        Build_Log.error(f"Failed to write cache {cache_file}: {e}")
+        return False
+
+# --- Projection and predicate pushdown ---
+FILTER_OPERATORS = {
+    "==": lambda col, value: col == value,
+    "=": lambda col, value: col == value,
+    "!=": lambda col, value: col != value,
+    "<": lambda col, value: col < value,
+    "<=": lambda col, value: col <= value,
+    ">": lambda col, value: col > value,
+    ">=": lambda col, value: col >= value,
+    "in": lambda col, value: col.isin(value),
+    "not in": lambda col, value: ~col.isin(value),
+}
+
+def normalize_filters(filters):
+    # Accepts pyarrow-style [(column, op, value), ...] or {column: value}; sets/lists mean "in"
+    if not filters:
+        return None
+    if isinstance(filters, dict):
+        filters = [
+            (col, "in", list(value)) if isinstance(value, (list, set, tuple)) else (col, "==", value)
+            for col, value in filters.items()
+        ]
+    return [
+        (col, op, list(value) if op in ("in", "not in") else value)
+        for col, op, value in filters
+    ]
+
+def apply_filters(df, filters):
+    filters = normalize_filters(filters)
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for col, op, value in filters:
+        mask &= FILTER_OPERATORS[op](df[col], value)
+    return df[mask].reset_index(drop=True)
+
+def slice_frame(df, columns=None, filters=None):
+    sliced = apply_filters(df, filters)
+    return sliced[columns] if columns else sliced
+
+def read_cache(cache_file, columns=None, filters=None):
+    fingerprint = Dataset_Cache.cache_fingerprint(cache_file)
+    if fingerprint is None:
+        return pd.read_parquet(cache_file, columns=columns, filters=normalize_filters(filters))
+
+    key = Dataset_Cache.make_key(fingerprint, columns, filters)
+    cached = Dataset_Cache.get(key)
+    if cached is not None:
+        return cached
+
+    # A slice of a frame that is already in memory is cheaper than another parquet read
+    if columns or filters:
+        full = Dataset_Cache.peek(Dataset_Cache.make_key(fingerprint))
+        if full is not None:
+            return slice_frame(full, columns, filters)
+
+    df = pd.read_parquet(cache_file, columns=columns, filters=normalize_filters(filters))
+    return Dataset_Cache.put(key, df)
+
+def select_slice(combined, cache_file, written, columns=None, filters=None):
+    # A fresh build hands back the same slice a warm read would
+    if not written:
+        return slice_frame(combined, columns, filters)
+    fingerprint = Dataset_Cache.cache_fingerprint(cache_file)
+    if fingerprint is None:
+        return slice_frame(combined, columns, filters)
+    full = Dataset_Cache.put(Dataset_Cache.make_key(fingerprint), combined)
+    if not columns and not filters:
+        return full
+    return read_cache(cache_file, columns, filters)
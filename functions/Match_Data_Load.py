@@ -1,9 +1,12 @@
 # functions/Match_Data_Load.py
 
+import numpy as np
 import pandas as pd
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
+from functions import Build_Lock, Build_Log, Cache_Manifest, Dataset_Schema, Dataset_Summary, Ingestion_Core, Parallel_Build, Team_Aliases
 
 MATCH_DATA_DIR = "data/Match Data"
 CACHE_FILE = "data/match_data_cache.parquet"
@@ -76,7 +79,7 @@ def adjust_result_for_team(row):
     if not match:
         return result
     outcome, team_score, opp_score = match.groups()
-    if team == "Crandall":
+    if team == Team_Aliases.HOME_TEAM:
         return result
     else:
         return f"{'L' if outcome == 'W' else 'W'} {opp_score}-{team_score}"
@@ -98,90 +101,234 @@ def normalize_set_score(value):
     return value
 
 def flip_set_score(row, col):
-    if row.get("Team", "") == "Crandall":
+    if row.get("Team", "") == Team_Aliases.HOME_TEAM:
         return row[col]
     parts = re.findall(r"(\d+)-(\d+)", str(row[col]))
     if parts:
         return f"{parts[0][1]}-{parts[0][0]}"
     return row[col]
 
-def process_match_data_file(file_path, file_name):
+# --- Column parsers: each distinct raw string is parsed once ---
+MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+# Same patterns and precedence as parse_date_column
+DATE_FORMATS = {
+    "iso": r"\d{4}-\d{2}-\d{2}",
+    "month_day": r"([A-Za-z]{3})[\s\-]*(\d{1,2})",
+    "day_month": r"(\d{1,2})[\s\-]*([A-Za-z]{3})",
+}
+
+def map_distinct(values, func):
+    # Applies a vectorized func to the distinct values only, then spreads the results back over the rows
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    mapped = func(pd.Series(uniques, dtype=object))
+    return pd.Series(mapped.to_numpy(dtype=object)[codes], index=values.index)
+
+def detect_date_format(text):
+    # The format most distinct values follow; exports use one per file ("Feb 15", "17-Feb" or ISO)
+    counts = {name: int(text.str.match(pattern).sum()) for name, pattern in DATE_FORMATS.items()}
+    name, count = max(counts.items(), key=lambda item: item[1])
+    return name if count else None
+
+@lru_cache(maxsize=65536)
+def parse_date_cached(raw_date, season):
+    return parse_date_column(raw_date, season)
+
+def parse_season_years(season):
     try:
-        df = pd.read_csv(file_path)
-        df = df[[col for col in df.columns if not str(col).startswith("0")]]
+        start_year, end_year = map(int, str(season).split("-"))
+        return start_year, end_year
+    except ValueError:
+        return None
+
+def parse_dates_fast(raw, season):
+    # raw: distinct raw values; returns ISO strings, NaN where the fast path does not apply
+    text = raw.astype(str).str.strip()
+    parsed = pd.Series(np.nan, index=raw.index, dtype=object)
+    fmt = detect_date_format(text)
+    is_iso = text.str.match(DATE_FORMATS["iso"])
+    if fmt == "iso":
+        parsed[is_iso] = text[is_iso]
+        return parsed
+
+    years = parse_season_years(season)
+    if fmt is None or years is None:
+        return parsed
+    parts = text.str.extract("^" + DATE_FORMATS[fmt])
+    month_text, day_text = (parts[0], parts[1]) if fmt == "month_day" else (parts[1], parts[0])
+    month = month_text.str.capitalize().map(MONTH_NUMBERS)
+    usable = month.notna() & ~is_iso
+    if fmt == "day_month":
+        # "Mon D" is tried first for every value, so only values it does not match are usable here
+        usable &= ~text.str.match(DATE_FORMATS["month_day"])
+    if not usable.any():
+        return parsed
+
+    month = month[usable].astype(int)
+    dates = pd.to_datetime(
+        pd.DataFrame({
+            "year": np.where(month >= 9, years[0], years[1]),
+            "month": month,
+            "day": pd.to_numeric(day_text[usable]),
+        }),
+        errors="coerce",
+    )
+    good = dates.notna()
+    parsed[good[good].index] = dates[good].dt.strftime("%Y-%m-%d")
+    return parsed
+
+def parse_date_values(values, season):
+    # Vectorized parse_date_column: fast path for the detected format, memoized scalar parse for the rest
+    def parse(raw):
+        parsed = parse_dates_fast(raw, season)
+        rest = parsed.isna()
+        parsed[rest] = [parse_date_cached(value, season) for value in raw[rest]]
+        return parsed
+    return map_distinct(values, parse)
+
+SET_SCORE_MONTHS = {
+    'Jan': '1', 'Feb': '2', 'Mar': '3', 'Apr': '4', 'May': '5',
+    'Jun': '6', 'Jul': '7', 'Aug': '8', 'Sep': '9', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+SET_SCORE_MONTH_PATTERN = re.compile("|".join(SET_SCORE_MONTHS))
+
+# --- Vectorized equivalents of the row-wise helpers above ---
+def require_text_column(series):
+    # The row-wise helpers call str methods on every cell, so a non-text cell fails the whole file
+    # (missing cells included: a string dtype column can hold NaN and still infer as "string")
+    if len(series) and (series.isna().any() or pd.api.types.infer_dtype(series, skipna=False) != "string"):
+        raise TypeError(f"Column '{series.name}' contains non-text values")
+
+def split_opponent_column(opponent, is_opponents_file):
+    require_text_column(opponent)
+    stripped = opponent.str.strip()
+    is_away = stripped.str.startswith("@")
+    is_home = ~is_away & stripped.str.lower().str.startswith("vs")
+    away_name = stripped.str[1:].str.strip()
+    home_name = stripped.str[3:].str.strip()
+
+    unknown = pd.Series("Unknown", index=opponent.index, dtype=object)
+    home = unknown.mask(is_away, away_name).mask(is_home, Team_Aliases.HOME_TEAM)
+    away = unknown.mask(is_away, Team_Aliases.HOME_TEAM).mask(is_home, home_name)
+    if is_opponents_file:
+        team = unknown.mask(is_away, away_name).mask(is_home, home_name)
+    else:
+        team = pd.Series(Team_Aliases.HOME_TEAM, index=opponent.index, dtype=object)
+    return team, home, away
 
-        season = infer_season_from_filename(file_name)
-        is_opponents_file = "Opponents" in file_name
+def adjust_result_column(result, team):
+    require_text_column(result)
+    parts = result.str.extract(r"^([WL])\s*(\d+)-(\d+)")
+    flipped = parts[0].map({"W": "L", "L": "W"}) + " " + parts[2] + "-" + parts[1]
+    return result.mask(parts[0].notna() & (team != Team_Aliases.HOME_TEAM), flipped)
 
-        df["Team"] = df.apply(lambda row: "Crandall" if not is_opponents_file else (
-            row["Opponent"].strip()[1:].strip() if row["Opponent"].strip().startswith("@")
-            else row["Opponent"].strip()[3:].strip() if row["Opponent"].strip().lower().startswith("vs")
-            else "Unknown"), axis=1)
+def normalize_set_scores(values):
+    # str() of a missing cell is "nan" in the row-wise helper
+    text = values.astype(str).fillna("nan").str.strip()
+    text = text.str.replace(SET_SCORE_MONTH_PATTERN, lambda m: SET_SCORE_MONTHS[m.group(0)], regex=True)
+    # Exactly two digit runs collapse to "a-b"; anything else is kept as-is
+    parts = text.str.extract(r"^\D*(\d+)\D+(\d+)\D*$")
+    return text.mask(parts[0].notna(), parts[0] + "-" + parts[1])
 
-        df["Home"] = df["Opponent"].apply(
-            lambda val: val.strip()[1:].strip() if val.strip().startswith("@")
-            else "Crandall" if val.strip().lower().startswith("vs")
-            else "Unknown"
-        )
-        df["Away"] = df["Opponent"].apply(
-            lambda val: "Crandall" if val.strip().startswith("@")
-            else val.strip()[3:].strip() if val.strip().lower().startswith("vs")
-            else "Unknown"
-        )
+def normalize_set_score_column(values):
+    return map_distinct(values, normalize_set_scores)
 
-        df["Season"] = season
-        df["source_file"] = file_name
+def flip_set_score_column(values, team):
+    parts = values.astype(str).str.extract(r"(\d+)-(\d+)")
+    return values.mask(parts[0].notna() & (team != Team_Aliases.HOME_TEAM), parts[1] + "-" + parts[0])
 
-        if "Date" in df.columns:
-            df["Date"] = df["Date"].apply(lambda d: parse_date_column(d, season))
+def normalize_match_frame(df, file_name):
+    df = df[[col for col in df.columns if not str(col).startswith("0")]]
 
-        if "Result" in df.columns:
-            df["Result"] = df.apply(adjust_result_for_team, axis=1)
+    season = infer_season_from_filename(file_name)
+    is_opponents_file = "Opponents" in file_name
 
-        set_columns = [col for col in df.columns if col.lower().startswith("score") or re.match(r"set\s*\d", col.lower())]
-        for col in set_columns:
-            df[col] = df[col].apply(normalize_set_score)
-            df[col] = df.apply(lambda row: flip_set_score(row, col), axis=1)
+    df["Team"], df["Home"], df["Away"] = split_opponent_column(df["Opponent"], is_opponents_file)
 
-        df.drop(columns=["Opponent"], inplace=True, errors="ignore")
+    df["Season"] = season
+    df["source_file"] = file_name
 
-        start_cols = ["Season", "Date", "Home", "Away", "Team"]
-        other_cols = [col for col in df.columns if col not in start_cols + ["source_file"]]
-        df = df[start_cols + other_cols + ["source_file"]]
+    if "Date" in df.columns:
+        df["Date"] = parse_date_values(df["Date"], season)
 
-        return df
+    if "Result" in df.columns:
+        df["Result"] = adjust_result_column(df["Result"], df["Team"])
+
+    set_columns = [col for col in df.columns if col.lower().startswith("score") or re.match(r"set\s*\d", col.lower())]
+    for col in set_columns:
+        df[col] = flip_set_score_column(normalize_set_score_column(df[col]), df["Team"])
+
+    df.drop(columns=["Opponent"], inplace=True, errors="ignore")
+
+    start_cols = ["Season", "Date", "Home", "Away", "Team"]
+    other_cols = [col for col in df.columns if col not in start_cols + ["source_file"]]
+    df = df[start_cols + other_cols + ["source_file"]]
+
+    return df
+
+def read_match_batches(file_path):
+    # Large exports come in bounded row batches; every row is normalized independently of the others.
+    # Batches are read as text: per-batch type inference could give one column different types in
+    # different batches, and the cache's coercion types the combined columns either way.
+    if os.path.getsize(file_path) < Ingestion_Core.STREAM_THRESHOLD_BYTES:
+        with Build_Log.stage("read"):
+            df = pd.read_csv(file_path)
+        yield df
+        return
+    with pd.read_csv(file_path, dtype=str, chunksize=Ingestion_Core.STREAM_CHUNK_ROWS) as reader:
+        while True:
+            with Build_Log.stage("read"):
+                df = next(reader, None)
+            if df is None:
+                return
+            yield df
+
+def process_match_data_file(file_path, file_name):
+    # Returns the file's normalized batches; the loader concatenates every file's batches in one pass
+    try:
+        rows_in = 0
+        frames = []
+        for df in read_match_batches(file_path):
+            rows_in += len(df)
+            with Build_Log.stage("metadata"):
+                frames.append(normalize_match_frame(df, file_name))
+        Build_Log.set_rows(rows_in=rows_in, rows_out=sum(len(df) for df in frames))
+        return frames
     except Exception as e:
         print(f"⚠️ Failed to process {file_name}: {e}")
+        Build_Log.skip(f"{type(e).__name__}: {e}")
         return None
 
-def load_preprocessed_match_data(force_rebuild=False):
-    if os.path.exists(CACHE_FILE) and not force_rebuild:
-        return pd.read_parquet(CACHE_FILE)
+def source_manifest():
+    return Cache_Manifest.build_source_manifest([MATCH_DATA_DIR], [Team_Aliases.ALIAS_FILE])
 
-    all_dfs = []
-    for file in os.listdir(MATCH_DATA_DIR):
-        if file.endswith(".csv"):
-            df = process_match_data_file(os.path.join(MATCH_DATA_DIR, file), file)
-            if df is not None:
-                all_dfs.append(df)
+def load_preprocessed_match_data(force_rebuild=False, workers=None, executor=None, columns=None, filters=None):
+    manifest = source_manifest()
+    if not force_rebuild and Cache_Manifest.is_cache_current(CACHE_FILE, manifest):
+        return Ingestion_Core.read_cache(CACHE_FILE, columns, filters)
 
-    if not all_dfs:
-        return pd.DataFrame()
+    with Build_Lock.cache_lock(CACHE_FILE):
+        # Another session may have finished the same build while this one waited
+        if not force_rebuild and Cache_Manifest.is_cache_current(CACHE_FILE, manifest):
+            return Ingestion_Core.read_cache(CACHE_FILE, columns, filters)
 
-    combined = pd.concat(all_dfs, ignore_index=True)
-    combined.columns = [str(col) for col in combined.columns]
+        with Build_Log.build_run("match", CACHE_FILE):
+            files = Parallel_Build.list_source_files(MATCH_DATA_DIR)
+            all_dfs = [
+                df for frames in Parallel_Build.parse_files(process_match_data_file, files, workers, executor)
+                if frames is not None for df in frames
+            ]
 
-    for col in combined.columns:
-        try:
-            combined[col] = pd.to_numeric(combined[col], errors="ignore")
-        except:
-            pass
-        if not pd.api.types.is_numeric_dtype(combined[col]) and not pd.api.types.is_bool_dtype(combined[col]):
-            combined[col] = combined[col].astype(str)
+            if not all_dfs:
+                return pd.DataFrame()
 
-    try:
-        combined.to_parquet(CACHE_FILE, index=False)
-    except Exception as e:
-        print(f"❌ Failed to write match data cache: {e}")
+            combined = Ingestion_Core.combine_frames(all_dfs, Dataset_Schema.MATCH_SCHEMA)
+            written = Ingestion_Core.write_cache(combined, CACHE_FILE, manifest)
+
+            return Ingestion_Core.select_slice(combined, CACHE_FILE, written, columns, filters)
 
-    return combined
+def load_match_summary():
+    current = Cache_Manifest.is_cache_current(CACHE_FILE, source_manifest())
+    return Dataset_Summary.load_summary(CACHE_FILE, current, load_preprocessed_match_data)
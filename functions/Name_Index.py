@@ -0,0 +1,80 @@
+# functions/Name_Index.py
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+# Searches run over the distinct names of a dataset, never its rows; row positions then come
+# from the Filter_Index entry for the same column
+FUZZY_RATIO = 0.8
+MIN_FUZZY_LENGTH = 3
+NON_ALNUM_PATTERN = re.compile(r"[^0-9a-z]+")
+
+def normalize(text):
+    # "Étienne  O'Neil" -> "etienne o neil"
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return NON_ALNUM_PATTERN.sub(" ", stripped.casefold()).strip()
+
+def trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+@lru_cache(maxsize=16)
+def build_index(names):
+    # names: tuple of distinct names; memoized, so each cache version's name list is indexed once
+    normalized = [normalize(name) for name in names]
+    tokens = [value.split() for value in normalized]
+    postings = {}
+    for name_id, name_tokens in enumerate(tokens):
+        for token in name_tokens:
+            for gram in trigrams(token):
+                postings.setdefault(gram, set()).add(name_id)
+    return {"names": names, "normalized": normalized, "tokens": tokens, "trigrams": postings}
+
+def token_score(query_token, name_token):
+    if name_token.startswith(query_token):
+        return 1.0
+    if len(query_token) < MIN_FUZZY_LENGTH:
+        return 0.0
+    # Compare against the whole token and the same-length prefix, so partial typing still matches
+    return max(
+        SequenceMatcher(None, query_token, name_token).ratio(),
+        SequenceMatcher(None, query_token, name_token[:len(query_token)]).ratio(),
+    )
+
+def candidates(index, query_tokens):
+    # Names sharing at least one trigram with every fuzzy-length query token
+    ids = None
+    for token in query_tokens:
+        if len(token) < MIN_FUZZY_LENGTH:
+            continue
+        token_ids = set()
+        for gram in trigrams(token):
+            token_ids |= index["trigrams"].get(gram, set())
+        ids = token_ids if ids is None else ids & token_ids
+    return range(len(index["names"])) if ids is None else sorted(ids)
+
+def search(index, query, fuzzy_ratio=FUZZY_RATIO):
+    # Returns matching names, best first; a plain substring match always counts
+    query = normalize(query)
+    if not query:
+        return []
+    query_tokens = query.split()
+
+    scored = []
+    substring_ids = {name_id for name_id, value in enumerate(index["normalized"]) if query in value}
+    for name_id in substring_ids:
+        scored.append((1.0, index["names"][name_id]))
+    for name_id in candidates(index, query_tokens):
+        if name_id in substring_ids:
+            continue
+        name_tokens = index["tokens"][name_id]
+        if not name_tokens:
+            continue
+        score = min(max(token_score(q, t) for t in name_tokens) for q in query_tokens)
+        if score >= fuzzy_ratio:
+            scored.append((score, index["names"][name_id]))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [name for _, name in scored]
@@ -0,0 +1,47 @@
+# functions/Parallel_Build.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functions import Build_Log
+
+# 0 or 1 keeps the original serial build; a negative value uses every CPU
+BUILD_WORKERS = 0
+BUILD_EXECUTOR = "process"  # "process" or "thread"
+
+def resolve_workers(workers=None):
+    if workers is None:
+        workers = BUILD_WORKERS
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+def list_source_files(source_dir):
+    return [
+        (os.path.join(source_dir, file), file)
+        for file in os.listdir(source_dir)
+        if file.endswith(".csv")
+    ]
+
+def parse_files(process_func, files, workers=None, executor=None):
+    # Results always come back in the same order as `files`
+    task = Build_Log.FileTask(process_func)
+    workers = min(resolve_workers(workers), len(files))
+    if workers <= 1:
+        return collect_results([task(file_path, file_name) for file_path, file_name in files])
+
+    pool_cls = ThreadPoolExecutor if (executor or BUILD_EXECUTOR) == "thread" else ProcessPoolExecutor
+    paths = [file_path for file_path, _ in files]
+    names = [file_name for _, file_name in files]
+    chunksize = max(1, len(files) // (workers * 4))
+    try:
+        with pool_cls(max_workers=workers) as pool:
+            return collect_results(list(pool.map(task, paths, names, chunksize=chunksize)))
+    except Exception as e:
+        print(f"⚠️ Parallel parse failed, falling back to serial build: {e}")
+        return collect_results([task(file_path, file_name) for file_path, file_name in files])
+
+def collect_results(results):
+    # File records are added to the build log on the calling thread, whatever pool produced them
+    for _, record in results:
+        Build_Log.add_file(record)
+    return [df for df, _ in results]
@@ -0,0 +1,166 @@
+# functions/Partition_Store.py
+
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from functions import Build_Log, Cache_Manifest, Parallel_Build
+
+PARTITION_ROOT = "data/partitions"
+INDEX_FILE = "_index.json"
+
+# Partitions hold parsed frames, so a change to the parsing code invalidates them just like the
+# caches; bumping Cache_Manifest.MANIFEST_VERSION clears every dataset's partitions on its next build
+def processing_version():
+    return Cache_Manifest.MANIFEST_VERSION
+
+def dataset_dir(dataset):
+    return os.path.join(PARTITION_ROOT, dataset)
+
+def index_path(dataset):
+    return os.path.join(dataset_dir(dataset), INDEX_FILE)
+
+def read_index(dataset):
+    # Returns {source path: entry}, or None when the index was written by another processing version
+    try:
+        with open(index_path(dataset), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(stored, dict) or stored.get("version") != processing_version():
+        return None
+    return stored.get("files", {})
+
+def write_index(dataset, index):
+    try:
+        os.makedirs(dataset_dir(dataset), exist_ok=True)
+        tmp_path = index_path(dataset) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": processing_version(), "files": index}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path(dataset))
+    except OSError as e:
+        print(f"❌ Failed to write partition index for {dataset}: {e}")
+
+def clear_dataset(dataset):
+    shutil.rmtree(dataset_dir(dataset), ignore_errors=True)
+
+def partition_path(dataset, season, date_str, file_name):
+    key = hashlib.sha1(file_name.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(dataset_dir(dataset), f"season={season}", f"date={date_str}", f"{key}.parquet")
+
+def write_partition(dataset, file_name, df):
+    season = str(df["Season"].iloc[0]) if len(df) and "Season" in df.columns else "Unknown"
+    date_str = str(df["Date"].iloc[0]) if len(df) and "Date" in df.columns else "Unknown"
+    path = partition_path(dataset, season, date_str, file_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    out = df.copy()
+    out.columns = [str(col) for col in out.columns]
+    out.to_parquet(path, index=False)
+    return path
+
+def read_partition(path):
+    df = pd.read_parquet(path)
+    # Missing text cells come back as None; restore NaN so they coerce exactly like a fresh parse
+    object_cols = df.select_dtypes(include="object").columns
+    if len(object_cols):
+        df[object_cols] = df[object_cols].where(df[object_cols].notna(), np.nan)
+    return df
+
+def remove_partition(path):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+def load_partitioned_files(dataset, source_dir, process_func, force_rebuild=False, workers=None, executor=None, stream_func=None, stream_threshold=None):
+    # stream_func(file_path, file_name, dataset) -> (partition path, rows) writes large sources itself
+    if force_rebuild:
+        clear_dataset(dataset)
+    index = read_index(dataset)
+    if index is None:
+        print(f"♻️ Partitions for {dataset} were written by another processing version; rebuilding them")
+        clear_dataset(dataset)
+        index = {}
+    new_index = {}
+
+    # First pass: reuse current partitions, collect everything that needs parsing
+    files = Parallel_Build.list_source_files(source_dir)
+    frames = [None] * len(files)
+    pending = []
+    streamed = []
+    for pos, (file_path, file) in enumerate(files):
+        stat = Cache_Manifest.describe_source(file_path)
+        entry = index.get(file_path)
+        reuse = (
+            entry is not None
+            and Cache_Manifest.same_stat(entry, stat)
+            and (entry.get("partition") is None or os.path.exists(entry["partition"]))
+        )
+        if reuse and entry.get("partition"):
+            try:
+                frames[pos] = read_partition(entry["partition"])
+            except Exception as e:
+                print(f"⚠️ Failed to read partition for {file}: {e}")
+                reuse = False
+
+        if reuse:
+            new_index[file_path] = entry
+            Build_Log.add_file({
+                "file": file, "status": "reused", "rows_in": None, "rows_out": entry.get("rows", 0),
+                "stages": {}, "seconds": 0.0,
+            })
+        elif stream_func is not None and stream_threshold is not None and stat["size"] >= stream_threshold:
+            streamed.append((pos, file_path, file, stat))
+        else:
+            pending.append((pos, file_path, file, stat))
+
+    # Second pass: parse new or changed sources and write their partitions
+    parsed = Parallel_Build.parse_files(
+        process_func, [(file_path, file) for _, file_path, file, _ in pending], workers, executor
+    )
+    for (pos, file_path, file, stat), df in zip(pending, parsed):
+        entry = index.get(file_path)
+        new_entry = dict(stat, partition=None, rows=0)
+        if df is not None:
+            try:
+                new_entry["partition"] = write_partition(dataset, file, df)
+                new_entry["rows"] = len(df)
+            except Exception as e:
+                # Leave the file out of the index so it is parsed again next time
+                print(f"⚠️ Failed to write partition for {file}: {e}")
+                new_entry = None
+        if entry is not None and entry.get("partition") != (new_entry or {}).get("partition"):
+            remove_partition(entry.get("partition"))
+        if new_entry is not None:
+            new_index[file_path] = new_entry
+        frames[pos] = df
+
+    # Large sources are parsed one at a time, batch by batch, so only one batch is in memory while parsing.
+    # Only the parse is bounded: the finished partition is read back whole to join the combined cache,
+    # whose typing needs whole columns, so a build still holds every export in memory at once.
+    for pos, file_path, file, stat in streamed:
+        entry = index.get(file_path)
+        with Build_Log.track_file(file, status="streamed") as record:
+            result = stream_func(file_path, file, dataset)
+        Build_Log.add_file(record)
+        new_entry = dict(stat, partition=None, rows=0)
+        if result is not None:
+            new_entry["partition"], new_entry["rows"] = result
+            try:
+                frames[pos] = read_partition(new_entry["partition"])
+            except Exception as e:
+                print(f"⚠️ Failed to read partition for {file}: {e}")
+                new_entry = None
+        if entry is not None and entry.get("partition") != (new_entry or {}).get("partition"):
+            remove_partition(entry.get("partition"))
+        if new_entry is not None:
+            new_index[file_path] = new_entry
+
+    # Sources that disappeared take their partitions with them
+    for file_path, entry in index.items():
+        if file_path not in new_index:
+            remove_partition(entry.get("partition"))
+
+    write_index(dataset, new_index)
+    return [df for df in frames if df is not None]
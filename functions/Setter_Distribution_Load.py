@@ -0,0 +1,120 @@
+# functions/Setter_Distribution_Load.py
+
+import pandas as pd
+import os
+from functions import Build_Lock, Build_Log, Cache_Manifest, Dataset_Schema, Dataset_Summary, Ingestion_Core, Parallel_Build, Team_Aliases
+
+SETTER_DATA_FILE = "data/Setter Distribution Data.csv"
+CACHE_FILE = "data/setter_distribution_cache.parquet"
+
+# Precomputed rollups, each with its own manifest so they are rebuilt together with the main cache
+MATCH_COLUMNS = ["Season", "Date", "Home", "Away", "Team", "Setter Tendency"]
+AGGREGATE_LEVELS = {
+    "match": MATCH_COLUMNS,
+    "team": ["Team", "Setter Tendency"],
+    "position": ["Team", "Setter Tendency", "Position"],
+}
+MATCH_KEY = ["Date", "Home", "Away"]
+AGGREGATE_FILES = {level: f"data/setter_by_{level}_cache.parquet" for level in AGGREGATE_LEVELS}
+
+def process_setter_data_file(file_path, file_name):
+    try:
+        with Build_Log.stage("read"):
+            df = pd.read_csv(file_path)
+        df["source_file"] = file_name
+        return df
+    except Exception as e:
+        print(f"⚠️ Failed to process {file_name}: {e}")
+        Build_Log.skip(f"{type(e).__name__}: {e}")
+        return None
+
+def source_manifest():
+    return Cache_Manifest.build_source_manifest([], [SETTER_DATA_FILE, Team_Aliases.ALIAS_FILE])
+
+def count_matches(df, keys, agg):
+    # A match is a distinct (Date, Home, Away), so both games of a same-day doubleheader count
+    match_cols = [col for col in MATCH_KEY if col not in keys]
+    played = df.loc[df["Date"].notna(), keys + match_cols].drop_duplicates()
+    counts = played.groupby(keys, observed=True).size()
+    return counts.reindex(pd.MultiIndex.from_frame(agg[keys]), fill_value=0).to_numpy()
+
+def build_aggregate(df, level):
+    # A Att is summed; A % is each group's share of its (team, tendency) attempts; H % is attempt-weighted
+    keys = AGGREGATE_LEVELS[level]
+    work = df[keys + ["A Att", "H %"]].copy()
+    work["A Att"] = work["A Att"].astype("float64")
+    work["H Weighted"] = work["H %"].astype("float64") * work["A Att"]
+    work["Hit Att"] = work["A Att"].where(work["H %"].notna())
+
+    grouped = work.groupby(keys, observed=True, sort=True)
+    agg = grouped[["A Att", "H Weighted", "Hit Att"]].sum(min_count=1).reset_index()
+    agg["H %"] = (agg["H Weighted"] / agg["Hit Att"]).astype("float32")
+    agg["Rows"] = grouped.size().to_numpy()
+    if level != "match":
+        agg["Matches"] = count_matches(df, keys, agg)
+
+    parent = [col for col in keys if col != "Position"] if level == "position" else None
+    if parent:
+        totals = agg.groupby(parent, observed=True)["A Att"].transform("sum")
+        agg["A %"] = (agg["A Att"] / totals * 100).astype("float32")
+    return agg.drop(columns=["H Weighted", "Hit Att"])
+
+def write_aggregates(combined, manifest):
+    for level, agg_file in AGGREGATE_FILES.items():
+        try:
+            build_aggregate(combined, level).to_parquet(agg_file, index=False)
+            Cache_Manifest.write_manifest(agg_file, manifest)
+        except Exception as e:
+            print(f"❌ Failed to write setter {level} aggregate: {e}")
+
+def load_preprocessed_setter_data(force_rebuild=False, columns=None, filters=None):
+    manifest = source_manifest()
+    if not force_rebuild and Cache_Manifest.is_cache_current(CACHE_FILE, manifest):
+        return Ingestion_Core.read_cache(CACHE_FILE, columns, filters)
+
+    with Build_Lock.cache_lock(CACHE_FILE):
+        # Another session may have finished the same build while this one waited
+        if not force_rebuild and Cache_Manifest.is_cache_current(CACHE_FILE, manifest):
+            return Ingestion_Core.read_cache(CACHE_FILE, columns, filters)
+
+        with Build_Log.build_run("setter", CACHE_FILE):
+            if not os.path.exists(SETTER_DATA_FILE):
+                return pd.DataFrame()
+            files = [(SETTER_DATA_FILE, os.path.basename(SETTER_DATA_FILE))]
+            df = Parallel_Build.parse_files(process_setter_data_file, files)[0]
+            if df is None or df.empty:
+                return pd.DataFrame()
+
+            combined = Ingestion_Core.combine_frames([df], Dataset_Schema.SETTER_SCHEMA)
+            written = Ingestion_Core.write_cache(combined, CACHE_FILE, manifest)
+            if written:
+                write_aggregates(combined, manifest)
+
+            return Ingestion_Core.select_slice(combined, CACHE_FILE, written, columns, filters)
+
+def load_setter_aggregate(level, force_rebuild=False, columns=None, filters=None):
+    # level: "match", "team" or "position"
+    agg_file = AGGREGATE_FILES[level]
+    manifest = source_manifest()
+    if not force_rebuild and Cache_Manifest.is_cache_current(agg_file, manifest):
+        return Ingestion_Core.read_cache(agg_file, columns, filters)
+
+    df = load_preprocessed_setter_data(force_rebuild=force_rebuild)
+    if df.empty:
+        return pd.DataFrame()
+    if Cache_Manifest.is_cache_current(CACHE_FILE, manifest) and not Cache_Manifest.is_cache_current(agg_file, manifest):
+        # Main cache predates the aggregates
+        write_aggregates(df, manifest)
+    if Cache_Manifest.is_cache_current(agg_file, manifest):
+        return Ingestion_Core.read_cache(agg_file, columns, filters)
+    return Ingestion_Core.slice_frame(build_aggregate(df, level), columns, filters)
+
+def remove_setter_cache():
+    removed = Cache_Manifest.remove_cache(CACHE_FILE)
+    for agg_file in AGGREGATE_FILES.values():
+        removed = Cache_Manifest.remove_cache(agg_file) or removed
+    return removed
+
+def load_setter_summary():
+    current = Cache_Manifest.is_cache_current(CACHE_FILE, source_manifest())
+    return Dataset_Summary.load_summary(CACHE_FILE, current, load_preprocessed_setter_data)
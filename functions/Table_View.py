@@ -0,0 +1,50 @@
+# functions/Table_View.py
+
+import math
+import streamlit as st
+
+# Only the visible page is sliced and sent to the browser, whatever the size of the frame
+PAGE_SIZES = [25, 50, 100, 250]
+DEFAULT_PAGE_SIZE = 50
+NO_SORT = "(source order)"
+
+def page_count(total_rows, page_size):
+    return max(1, math.ceil(total_rows / page_size))
+
+def sort_positions(df, sort_column, ascending=True):
+    # Sorts one column and returns row positions, so the other columns are never reordered or copied
+    order = df[sort_column].reset_index(drop=True).sort_values(
+        ascending=ascending, na_position="last", kind="stable"
+    )
+    return order.index.to_numpy()
+
+def page_slice(df, page, page_size, sort_column=None, ascending=True):
+    # page is 1-based and clamped to the available pages
+    page = min(max(1, page), page_count(len(df), page_size))
+    start = (page - 1) * page_size
+    stop = start + page_size
+    if sort_column and sort_column in df.columns:
+        return df.iloc[sort_positions(df, sort_column, ascending)[start:stop]]
+    return df.iloc[start:stop]
+
+def render_table(df, key, page_sizes=PAGE_SIZES, default_page_size=DEFAULT_PAGE_SIZE):
+    # Sort, page size and page number live in session state under `key`, one table per key
+    total = len(df)
+    c1, c2, c3, c4 = st.columns([3, 1, 1, 1])
+    sort_column = c1.selectbox("Sort by", [NO_SORT] + [str(col) for col in df.columns], key=f"{key}_sort")
+    ascending = c2.radio("Order", ["Ascending", "Descending"], key=f"{key}_order", horizontal=True) == "Ascending"
+    page_size = c3.selectbox(
+        "Rows per page", page_sizes, index=page_sizes.index(default_page_size), key=f"{key}_page_size"
+    )
+    pages = page_count(total, page_size)
+    # Narrower filters can leave a stale page number behind
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = c4.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+
+    page_df = page_slice(df, int(page), page_size, None if sort_column == NO_SORT else sort_column, ascending)
+    st.dataframe(page_df)
+    if total:
+        start = (int(page) - 1) * page_size
+        st.caption(f"Rows {start + 1:,}–{start + len(page_df):,} of {total:,}")
+    return page_df
@@ -0,0 +1,45 @@
+# functions/Team_Aliases.py
+
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# One registry for every spelling of a team name; loaders apply it once while building their caches
+ALIAS_FILE = "data/Team Aliases.csv"
+HOME_TEAM = "Crandall"
+TEAM_COLUMNS = ["Home", "Away", "Team"]
+
+@lru_cache(maxsize=4)
+def _read_aliases(alias_file, size, mtime_ns):
+    df = pd.read_csv(alias_file, dtype=str).dropna()
+    return {alias.strip(): canonical.strip() for alias, canonical in zip(df["Alias"], df["Canonical"])}
+
+def load_aliases(alias_file=ALIAS_FILE):
+    if not os.path.exists(alias_file):
+        return {}
+    try:
+        stat = os.stat(alias_file)
+        return dict(_read_aliases(alias_file, stat.st_size, stat.st_mtime_ns))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Failed to read team aliases from {alias_file}: {e}")
+        return {}
+
+def canonical_name(name, aliases=None):
+    aliases = load_aliases() if aliases is None else aliases
+    return aliases.get(name, name)
+
+def apply_aliases(df, columns=TEAM_COLUMNS, aliases=None):
+    # Maps each distinct value once rather than every cell
+    aliases = load_aliases() if aliases is None else aliases
+    if not aliases:
+        return df
+    for col in columns:
+        if col in df.columns:
+            codes, uniques = pd.factorize(df[col])
+            if not any(value in aliases for value in uniques):
+                continue
+            mapped = np.array([aliases.get(value, value) for value in uniques] + [np.nan], dtype=object)
+            # Missing cells have code -1, which picks the trailing NaN
+            df[col] = pd.Series(mapped[codes], index=df.index)
+    return df
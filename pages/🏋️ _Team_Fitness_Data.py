@@ -2,15 +2,11 @@
 
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
-import seaborn as sns
-import matplotlib.pyplot as plt
 import matplotlib.image as mpimg
 import base64
-import os
 from datetime import datetime
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.table import Table
@@ -18,6 +14,7 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import landscape, A4
 from reportlab.lib.utils import ImageReader
 from io import BytesIO
+from functions import Fitness_Engine
 
 # ✅ Must be first
 st.set_page_config(page_title="💪 Team Fitness Data", layout="wide")
@@ -48,34 +45,11 @@ def render_utilities(df, fig=None, filename="export", include_csv=True):
     with col3:
         if st.button(f"🔁 Clear Cache for {filename}"):
             st.cache_data.clear()
-            st.experimental_rerun()
-
-# --- Get Most Recent Roster (Active Athletes) ---
-def get_active_athletes(roster_base_dir="rosters", csv_name="team_info.csv"):
-    if not os.path.exists(roster_base_dir):
-        return set(), None
-    seasons = sorted(
-        [d for d in os.listdir(roster_base_dir) if os.path.isdir(os.path.join(roster_base_dir, d))],
-        reverse=True
-    )
-    if not seasons:
-        return set(), None
-    latest_season = seasons[0]
-    roster_path = os.path.join(roster_base_dir, latest_season, csv_name)
-    if not os.path.exists(roster_path):
-        return set(), latest_season
-    try:
-        roster_df = pd.read_csv(roster_path)
-        roster_df.columns = roster_df.columns.str.strip().str.lower()
-        if "name" in roster_df.columns:
-            active_names = set(roster_df["name"].dropna().str.strip())
-            return active_names, latest_season
-    except Exception:
-        pass
-    return set(), latest_season
+            Fitness_Engine.clear()
+            st.rerun()
 
 # Load active athlete list
-active_athlete_names, latest_loaded_season = get_active_athletes()
+active_athlete_names, latest_loaded_season = Fitness_Engine.active_athletes()
 
 # --- Header and Filter UI ---
 col1, col2 = st.columns([6, 2])
@@ -90,42 +64,18 @@ with col2:
     athlete_filter_mode = st.radio("Includes:", ["Active Athletes Only", "All Athletes"], horizontal=True)
 
 # --- Load & Filter Data ---
-@st.cache_data
-def load_testing_data():
-    try:
-        df = pd.read_csv("data/Testing Data.csv")
-        df.columns = df.columns.str.strip()
-        return df
-    except Exception as e:
-        st.error(f"Failed to load Testing Data: {e}")
-        return pd.DataFrame()
-
-df = load_testing_data()
-if df.empty:
+store = Fitness_Engine.load_store()
+if store["wide"].empty:
     st.warning("⚠️ No data available.")
     st.stop()
 
-df["Testing Date"] = pd.to_datetime(df["Testing Date"], errors="coerce")
-df["Athlete"] = df["Athlete"].astype(str).str.strip()
-
-# Apply filter
-if athlete_filter_mode == "Active Athletes Only":
-    df = df[df["Athlete"].isin(active_athlete_names)]
-
-# --- Preprocessing Metadata ---
-metric_cols = df.select_dtypes(include="number").columns.tolist()
-athlete_list = sorted(df["Athlete"].dropna().unique())
-
-metric_map = {
-    'Height (in.)': 'Height', 'Weight (lbs)': 'Weight',
-    'Block Touch (in.)': 'Block Touch', 'Approach Touch (in.)': 'Approach Touch',
-    'Broad Jump (in.)': 'Broad Jump', 'Block Vertical (in.)': 'Block Vertical',
-    'Approach Vertical (in.)': 'Approach Vertical', 'Reps at E[X] Bench': 'Reps @ E[X] Bench',
-    'Agility Test (s)': 'Agility Test', '10 Down and Backs (s)': '10 Down and Backs',
-    'Yo-Yo Cardio Test': 'Yo-Yo Test'
-}
-inverse_map = {v: k for k, v in metric_map.items()}
-tracked_metrics = sorted(list(inverse_map.keys()))
+# Every query below is computed once per data version and athlete scope
+scope = active_athlete_names if athlete_filter_mode == "Active Athletes Only" else None
+athlete_list = Fitness_Engine.athlete_options(scope)
+position_list = Fitness_Engine.position_options(scope)
+metric_map = Fitness_Engine.METRIC_LABELS
+inverse_map = Fitness_Engine.METRIC_COLUMNS
+tracked_metrics = Fitness_Engine.TRACKED_METRICS
 
 # --- Tabs ---
 st.markdown("---")
@@ -177,18 +127,10 @@ with tabs[0]:
     col1, col2, col3 = st.columns(3)
     selected_metric = col1.selectbox("Metric", tracked_metrics, key="lineplot_metric")
     selected_athletes = col2.multiselect("Athletes", athlete_list, key="lineplot_athletes")
-    selected_positions = col3.multiselect("Position", sorted(df["Primary Position"].dropna().unique()), key="lineplot_positions")
-
-    chart_df = df.copy()
-    if selected_athletes:
-        chart_df = chart_df[chart_df["Athlete"].isin(selected_athletes)]
-    if selected_positions:
-        chart_df = chart_df[chart_df["Primary Position"].isin(selected_positions)]
+    selected_positions = col3.multiselect("Position", position_list, key="lineplot_positions")
 
     raw_metric = inverse_map[selected_metric]
-    chart_df["Testing Date"] = pd.to_datetime(chart_df["Testing Date"], errors="coerce")
-    chart_df[raw_metric] = pd.to_numeric(chart_df[raw_metric], errors="coerce")
-    chart_df = chart_df.dropna(subset=["Testing Date", raw_metric])
+    chart_df = Fitness_Engine.metric_frame(selected_metric, scope, selected_athletes, selected_positions)
 
     if not chart_df.empty:
         # --- Line Chart ---
@@ -205,34 +147,7 @@ with tabs[0]:
         st.plotly_chart(fig, use_container_width=True)
 
         # --- Pivot Table ---
-        pivot_ready = chart_df.dropna(subset=[raw_metric, "Testing Date"])
-        pivot = pivot_ready.pivot_table(
-            index=["Athlete", "Primary Position"],
-            columns="Testing Date",
-            values=raw_metric,
-            aggfunc="mean"
-        ).reset_index()
-
-        # Format and sort date columns
-        date_map = {col: col.strftime("%B %Y") for col in pivot.columns if isinstance(col, pd.Timestamp)}
-        pivot.rename(columns=date_map, inplace=True)
-        date_cols = sorted(date_map.values(), key=lambda d: pd.to_datetime(d))
-        pivot = pivot.rename(columns={"Athlete": "Name", "Primary Position": "Position"})
-
-        # Convert and calculate deltas
-        pivot[date_cols] = pivot[date_cols].apply(pd.to_numeric, errors='coerce')
-        if len(date_cols) >= 2:
-            pivot["Δ Last"] = pivot[date_cols[-1]] - pivot[date_cols[-2]]
-            pivot["Δ Net"] = pivot[date_cols[-1]] - pivot[date_cols[0]]
-        else:
-            pivot["Δ Last"] = np.nan
-            pivot["Δ Net"] = np.nan
-
-        pivot["Δ Last"] = pivot["Δ Last"].round(2)
-        pivot["Δ Net"] = pivot["Δ Net"].round(2)
-
-        final_cols = ["Name", "Position"] + date_cols + ["Δ Last", "Δ Net"]
-        display_table = pivot[final_cols]
+        display_table = Fitness_Engine.progress_table(selected_metric, scope, selected_athletes, selected_positions)
 
         st.dataframe(display_table, use_container_width=True, hide_index=True)
         render_utilities(display_table, fig, filename="line_plot")
@@ -277,15 +192,11 @@ with tabs[1]:
 
     col1, col2, col3 = st.columns([3, 3, 2])
     selected_box_metric = col1.selectbox("Metric", tracked_metrics, key="box_metric")
-    selected_box_positions = col2.multiselect("Position", sorted(df["Primary Position"].dropna().unique()), key="box_positions")
+    selected_box_positions = col2.multiselect("Position", position_list, key="box_positions")
     chart_mode = col3.radio("Chart Type", ["Box", "Violin"], horizontal=True, key="box_violin_mode")
 
-    filtered_box_df = df.copy()
-    if selected_box_positions:
-        filtered_box_df = filtered_box_df[filtered_box_df["Primary Position"].isin(selected_box_positions)]
-
     raw_metric = inverse_map[selected_box_metric]
-    filtered_box_df = filtered_box_df.dropna(subset=["Testing Date", raw_metric])
+    filtered_box_df = Fitness_Engine.metric_frame(selected_box_metric, scope, positions=selected_box_positions)
     filtered_box_df["Testing Date"] = filtered_box_df["Testing Date"].dt.strftime("%Y-%m-%d")
 
     if not filtered_box_df.empty:
@@ -318,6 +229,8 @@ with tabs[2]:
         st.markdown("#### 🎯 What to Select")
         st.code(
             "• Choose an athlete from the dropdown\n"
+            "• Optionally overlay other athletes or the team average per testing date\n"
+            "• Normalize to plot every metric on the team's 0–100 range\n"
             "• Two radar plots will be generated:\n"
             "   - Physical Attributes (height, jump, etc.)\n"
             "   - Performance & Capacity (agility, endurance, etc.)"
@@ -327,47 +240,42 @@ with tabs[2]:
         st.code(
             "• Larger surface area = stronger performance\n"
             "• Each shape = 1 testing date (e.g. 'September 2024')\n"
+            "• Normalized: 0 = team's lowest, 100 = team's best (timed tests are flipped)\n"
             "• Smaller segments indicate weaker metrics on that date"
         )
 
         st.warning("⚠️ If nothing shows up, the athlete may have missing data for the selected tests.")
 
-    radar_athlete = st.selectbox("Select Athlete", athlete_list, key="dual_radar_athlete")
-    radar_df = df[df["Athlete"] == radar_athlete].copy()
-    radar_df["Testing Date"] = pd.to_datetime(radar_df["Testing Date"], errors="coerce")
-
-    group1_keys = ["Height (in.)", "Weight (lbs)", "Block Touch (in.)", "Approach Touch (in.)", "Broad Jump (in.)"]
-    group1_labels = ["Height", "Weight", "Block Touch", "Approach Touch", "Broad Jump"]
-    group2_keys = ["Block Vertical (in.)", "Approach Vertical (in.)", "Reps at E[X] Bench", "Agility Test (s)", "10 Down and Backs (s)", "Yo-Yo Cardio Test"]
-    group2_labels = ["Block Vertical", "Approach Vertical", "Reps @ E[X] Bench", "Agility Test", "10 Down/Backs", "Yo-Yo Test"]
+    col1, col2 = st.columns([2, 3])
+    radar_athlete = col1.selectbox("Select Athlete", athlete_list, key="dual_radar_athlete")
+    radar_overlay = col2.multiselect(
+        "Overlay Athletes", [a for a in athlete_list if a != radar_athlete], key="dual_radar_overlay"
+    )
+    col1, col2, col3 = st.columns(3)
+    radar_team = col1.checkbox("Overlay team average", key="dual_radar_team")
+    radar_normalize = col2.checkbox("Normalize to team range (0–100)", key="dual_radar_normalize")
+    radar_latest = col3.checkbox("Most recent test only", key="dual_radar_latest")
+    radar_athletes = [radar_athlete] + radar_overlay if radar_athlete else radar_overlay
+
+    def radar_figure(metric_labels):
+        radar = Fitness_Engine.radar_data(
+            radar_athletes, list(metric_labels), scope,
+            normalize=radar_normalize, team_average=radar_team, latest_only=radar_latest,
+        )
+        theta = list(metric_labels.values())
+        fig = go.Figure([
+            go.Scatterpolar(r=values, theta=theta, fill='toself', name=name)
+            for name, values in zip(radar["names"], radar["values"])
+        ])
+        radial = dict(visible=True, range=[0, 100]) if radar_normalize else dict(visible=True)
+        fig.update_layout(polar=dict(radialaxis=radial), showlegend=True, height=600)
+        return fig
 
     col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("#### 📊 Touches & Physical Attributes")
-        fig1 = go.Figure()
-        for _, row in radar_df.iterrows():
-            values = row[group1_keys]
-            if values.isnull().all():
-                continue
-            values.index = group1_labels
-            formatted_date = row["Testing Date"].strftime("%B %Y")
-            fig1.add_trace(go.Scatterpolar(r=values.values, theta=values.index, fill='toself', name=formatted_date))
-        fig1.update_layout(polar=dict(radialaxis=dict(visible=True)), showlegend=True, height=600)
-        st.plotly_chart(fig1, use_container_width=True)
-
-    with col2:
-        st.markdown("#### 🧪 Performance & Capacity Metrics")
-        fig2 = go.Figure()
-        for _, row in radar_df.iterrows():
-            values = row[group2_keys]
-            if values.isnull().all():
-                continue
-            values.index = group2_labels
-            formatted_date = row["Testing Date"].strftime("%B %Y")
-            fig2.add_trace(go.Scatterpolar(r=values.values, theta=values.index, fill='toself', name=formatted_date))
-        fig2.update_layout(polar=dict(radialaxis=dict(visible=True)), showlegend=True, height=600)
-        st.plotly_chart(fig2, use_container_width=True)
+    for column, (title, metric_labels) in zip([col1, col2], Fitness_Engine.RADAR_GROUPS.items()):
+        with column:
+            st.markdown(f"#### {'📊' if column is col1 else '🧪'} {title}")
+            st.plotly_chart(radar_figure(metric_labels), use_container_width=True)
 
 # 🔁 Tab 4: Progress Delta
 with tabs[3]:
@@ -407,60 +315,10 @@ with tabs[3]:
     # Inline filters
     col1, col2, col3 = st.columns([4, 3, 3])
     delta_metric_clean = col1.selectbox("Metric", tracked_metrics, key="delta_metric")
-    delta_position_filter = col2.multiselect("Position", sorted(df["Primary Position"].dropna().unique()), key="delta_positions")
+    delta_position_filter = col2.multiselect("Position", position_list, key="delta_positions")
     display_mode = col3.radio("Display As", ["Δ in value", "Δ (%)"], horizontal=True)
 
-    delta_metric = inverse_map[delta_metric_clean]
-
-    delta_df = df[["Athlete", "Primary Position", "Testing Date", delta_metric]].dropna()
-    delta_df["Testing Date"] = pd.to_datetime(delta_df["Testing Date"], errors="coerce")
-
-    if delta_position_filter:
-        delta_df = delta_df[delta_df["Primary Position"].isin(delta_position_filter)]
-
-    delta_df.sort_values(by=["Athlete", "Testing Date"], inplace=True)
-
-    results = []
-    for athlete, group in delta_df.groupby("Athlete"):
-        if group.shape[0] >= 2:
-            group_sorted = group.sort_values("Testing Date")
-
-            first_val = group_sorted.iloc[0][delta_metric]
-            first_date = group_sorted.iloc[0]["Testing Date"]
-            last_val = group_sorted.iloc[-1][delta_metric]
-            last_date = group_sorted.iloc[-1]["Testing Date"]
-
-            if group.shape[0] >= 3:
-                second_last_val = group_sorted.iloc[-2][delta_metric]
-                second_last_date = group_sorted.iloc[-2]["Testing Date"]
-            else:
-                second_last_val, second_last_date = None, None
-
-            try:
-                first_val = float(first_val)
-                last_val = float(last_val)
-                second_last_val = float(second_last_val) if second_last_val is not None else None
-
-                diff_first = last_val - first_val
-                diff_second = last_val - second_last_val if second_last_val is not None else None
-
-                pct_first = 100 * diff_first / last_val if last_val != 0 else None
-                pct_second = 100 * diff_second / last_val if last_val != 0 and diff_second is not None else None
-
-                results.append({
-                    "Athlete": athlete,
-                    "Δ_val_1st": round(diff_first, 2),
-                    "Δ_pct_1st": round(pct_first, 2) if pct_first is not None else None,
-                    "Δ_val_2nd": round(diff_second, 2) if diff_second is not None else None,
-                    "Δ_pct_2nd": round(pct_second, 2) if pct_second is not None else None,
-                    "First Test Date": first_date.strftime("%B %Y"),
-                    "Second Last Test Date": second_last_date.strftime("%B %Y") if second_last_date else None,
-                    "Most Recent Test Date": last_date.strftime("%B %Y")
-                })
-            except Exception:
-                continue
-
-    delta_summary = pd.DataFrame(results)
+    delta_summary = Fitness_Engine.delta_summary(delta_metric_clean, scope, delta_position_filter)
 
     if not delta_summary.empty:
         # Display mode mapping
@@ -517,7 +375,7 @@ with tabs[3]:
     else:
         st.info("Not enough valid data to generate progression charts.")
 
-# 📉 Tab 5 – Correlation Heatmap by Position Group (based on most recent test date)
+# 📉 Tab 5 – Correlation Heatmap by Position Group (most recent test date, optionally pooled)
 with tabs[4]:
     st.markdown("### 📉 Position-Specific Fitness Metric Correlations")
 
@@ -526,7 +384,7 @@ with tabs[4]:
         st.code(
             "A heatmap shows how strongly different physical tests are related to each other.\n"
             "Values range from -1 (strong inverse) to +1 (strong positive).\n"
-            "Only data from the most recent testing date is used."
+            "Data from the most recent testing date is used, or from several recent dates when pooled."
         )
 
         st.markdown("#### 🧠 Why Use It?")
@@ -549,69 +407,56 @@ with tabs[4]:
         st.markdown("#### 📈 Reading the Heatmaps")
         st.code(
             "• Each heatmap is specific to a positional group\n"
-            "• Only metrics with ≥75% valid data on the most recent test date are shown\n"
+            "• Only metrics with ≥75% valid data on the selected test date(s) are shown\n"
+            "• Pooling dates treats each athlete's test on each date as one sample\n"
+            "• Hover a cell for the exact pair and value\n"
             "• Dark red = strong positive correlation\n"
             "• Dark blue = strong negative correlation"
         )
 
         st.warning("⚠️ If a heatmap is missing, it means there isn't enough valid data for that group.")
 
-    # Define position groupings
-    position_groups = {
-        "Outside Hitters": ["LS", "RS"],
-        "Middle Hitters": ["MB", "M", "MH"],
-        "Setters & Liberos": ["S", "LIB"]
-    }
-
-    selected_cols = list(metric_map.keys())
-    most_recent_date = df["Testing Date"].dropna().max()
-    recent_df = df[df["Testing Date"] == most_recent_date]
-    recent_total = len(recent_df)
-
-    eligible_cols = [
-        col for col in selected_cols
-        if recent_df[col].notna().sum() / recent_total >= 0.75
-    ]
-
-    if len(eligible_cols) < 2:
-        st.warning("⚠️ Not enough metrics meet the 75% completeness threshold on the most recent test date.")
+    all_dates = Fitness_Engine.testing_dates(scope)
+    pooled_count = st.select_slider(
+        "Pool recent testing dates", options=list(range(1, len(all_dates) + 1)) or [1], value=1, key="corr_pool"
+    )
+    correlations = Fitness_Engine.position_correlations(scope, pooled_count)
+    date_text = ", ".join(date.strftime("%B %d, %Y") for date in correlations["dates"])
+
+    if len(correlations["eligible"]) < 2:
+        st.warning("⚠️ Not enough metrics meet the 75% completeness threshold on the selected test date(s).")
     else:
-        st.caption(f"✅ Using data from {most_recent_date.strftime('%B %d, %Y')} — metrics with ≥75% completeness included.")
+        st.caption(f"✅ Using data from {date_text} — metrics with ≥75% completeness included.")
 
-        fig, axes = plt.subplots(1, 3, figsize=(24, 8), constrained_layout=True)
         plotted = False
+        columns = st.columns(len(correlations["matrices"]))
+        for column, (label, corr) in zip(columns, correlations["matrices"].items()):
+            with column:
+                if corr is None:
+                    st.markdown(f"**{label}**")
+                    st.info("Not enough valid data")
+                    continue
+
+                labels = [metric_map.get(c, c) for c in corr.columns]
+                fig = px.imshow(
+                    corr.to_numpy(),
+                    x=labels,
+                    y=labels,
+                    zmin=-1,
+                    zmax=1,
+                    color_continuous_scale="RdBu_r",
+                    text_auto=".2f",
+                    aspect="auto",
+                    title=label,
+                )
+                fig.update_layout(height=520, margin=dict(l=10, r=10, t=50, b=10), coloraxis_showscale=column is columns[-1])
+                st.plotly_chart(fig, use_container_width=True)
+                plotted = True
 
-        for idx, (label, roles) in enumerate(position_groups.items()):
-            group_df = df[df["Primary Position"].isin(roles)]
-            group_df = group_df[group_df["Testing Date"] == most_recent_date]
-            group_df = group_df[eligible_cols].replace(0, np.nan).dropna()
-
-            if group_df.shape[0] < 2:
-                axes[idx].axis("off")
-                axes[idx].set_title(f"{label}\n(Not enough valid data)")
-                continue
-
-            corr = group_df.corr()
-
-            sns.heatmap(
-                corr,
-                annot=True,
-                fmt=".2f",
-                cmap="coolwarm",
-                ax=axes[idx],
-                cbar=(idx == 2),
-                xticklabels=[metric_map.get(c, c) for c in corr.columns],
-                yticklabels=[metric_map.get(c, c) for c in corr.index] if idx == 0 else False
-            )
-            axes[idx].set_title(label)
-            plotted = True
-
-        if plotted:
-            st.pyplot(fig)
-        else:
+        if not plotted:
             st.warning("⚠️ No valid data to generate grouped correlation matrices.")
 
-# ⚖️ Tab 6 – Z-Score Tracker with Athlete 1–3 Filters
+# ⚖️ Tab 6 – Z-Score Tracker
 with tabs[5]:
     st.markdown("### ⚖️ Z-Score Normalization")
 
@@ -619,7 +464,8 @@ with tabs[5]:
         st.markdown("#### 📏 What is a Z-Score?")
         st.code(
             "A Z-score represents how far an athlete's score for a given test is from the group average "
-            "on that specific testing date — in units of standard deviation."
+            "on that specific testing date — in units of standard deviation.\n"
+            "The percentile is the share of athletes tested that day who scored at or below it."
         )
 
         st.markdown("#### 🧠 Why Use It?")
@@ -632,7 +478,8 @@ with tabs[5]:
         st.markdown("#### 🎯 What to Select")
         st.code(
             "• Choose a metric (e.g. 'Block Touch')\n"
-            "• Select 2–3 athletes to compare\n"
+            "• Select any number of athletes to compare\n"
+            "• Scores are relative to every athlete tested that day, not only the ones selected\n"
             "• Graph will only include testing dates where at least 2 valid athlete scores exist"
         )
 
@@ -641,59 +488,41 @@ with tabs[5]:
             "Z =  0     ➜ Exactly average that day\n"
             "Z >  0     ➜ Above average (e.g., +2 is top performer)\n"
             "Z <  0     ➜ Below average\n"
-            "Dotted line marks Z = 0 as the team average baseline"
+            "Dotted line marks Z = 0 (or the 50th percentile) as the team baseline"
         )
 
         st.warning("⚠️ If no line appears, it likely means:\n- Too few athletes tested on the same date\n- Or selected metric has no variation (e.g. all values are the same)")
 
-    # Metric selection
-    z_metric = st.selectbox("Select Metric", sorted([metric_map.get(col, col) for col in metric_map.values()]), key="zscore_metric")
-    z_metric_raw = inverse_map[z_metric]
-
-    # 3-athlete comparison
-    col1, col2, col3 = st.columns(3)
-    athlete_1 = col1.selectbox("Athlete 1", sorted(athlete_list), key="zscore_a1")
-    athlete_2 = col2.selectbox("Athlete 2", sorted(athlete_list), key="zscore_a2")
-    athlete_3 = col3.selectbox("Athlete 3", sorted(athlete_list), key="zscore_a3")
-
-    # Remove empty or duplicate selections
-    selected_athletes = list({a for a in [athlete_1, athlete_2, athlete_3] if a})
-
-    # Filter dataset
-    z_df = df[df["Athlete"].isin(selected_athletes)][["Athlete", "Testing Date", z_metric_raw]].dropna()
-    z_df["Testing Date"] = pd.to_datetime(z_df["Testing Date"], errors="coerce")
-    z_df[z_metric_raw] = pd.to_numeric(z_df[z_metric_raw], errors="coerce")
+    # Metric and athlete selection
+    col1, col2, col3 = st.columns([3, 5, 2])
+    z_metric = col1.selectbox("Select Metric", tracked_metrics, key="zscore_metric")
+    selected_athletes = col2.multiselect("Athletes", athlete_list, key="zscore_athletes")
+    z_mode = col3.radio("Show", ["Z-Score", "Percentile"], horizontal=True, key="zscore_mode")
 
-    # Only allow testing dates with ≥2 athletes
-    valid_dates = z_df.groupby("Testing Date")[z_metric_raw].count()
-    valid_dates = valid_dates[valid_dates >= 2].index
-    z_df = z_df[z_df["Testing Date"].isin(valid_dates)]
+    z_df = Fitness_Engine.zscore_frame(z_metric, selected_athletes, scope)
 
-    if len(selected_athletes) < 2:
-        st.warning("⚠️ Please select at least two different athletes.")
+    if not selected_athletes:
+        st.warning("⚠️ Please select at least one athlete.")
     elif z_df.empty:
         st.warning("⚠️ No valid testing dates found with enough scores to calculate Z-scores.")
     else:
-        # Compute Z-scores per testing date
-        z_df["Z-Score"] = z_df.groupby("Testing Date")[z_metric_raw].transform(
-            lambda x: (x - x.mean()) / x.std(ddof=0)
-        )
-
-        # Plot Z-score trend
+        # Plot Z-score or percentile trend
+        baseline = 0 if z_mode == "Z-Score" else 50
         fig = px.line(
             z_df,
             x="Testing Date",
-            y="Z-Score",
+            y=z_mode,
             color="Athlete",
             markers=True,
-            title=f"Z-Score Trend – {z_metric}",
+            title=f"{z_mode} Trend – {z_metric}",
+            hover_data=[inverse_map[z_metric], "Tested"],
             labels={"Z-Score": "Standard Score", "Testing Date": "Date"}
         )
         fig.update_layout(
-            yaxis_title="Z-Score (standardized)",
+            yaxis_title="Z-Score (standardized)" if z_mode == "Z-Score" else "Percentile (team, same date)",
             xaxis_title="Testing Date",
             shapes=[
-                dict(type="line", xref="paper", x0=0, x1=1, y0=0, y1=0,
+                dict(type="line", xref="paper", x0=0, x1=1, y0=baseline, y1=baseline,
                      line=dict(color="gray", dash="dash"))
             ]
         )
@@ -716,82 +545,38 @@ with tabs[6]:
     st.markdown("### 📊 Athlete Performance vs VBC Benchmarks – Best / Average / Minimum")
     st.info("Touch metrics use volleyball-specific scale (9′6″–13′0″). All others use auto-range.")
 
-    @st.cache_data
-    def load_team_data():
-        df = pd.read_csv("data/Testing Data.csv")
-        df.columns = df.columns.str.strip()
-        return df
-
-    @st.cache_data
-    def load_vbc_data():
-        df = pd.read_csv("data/Volleyball Canada Normative.csv")
-        df.columns = df.columns.str.strip()
-        return df
-
-    # Load data
-    team_df = load_team_data()
-    vbc_df = load_vbc_data()
-
     # Mappings
-    metric_mapping = {
-        "Approach Touch (in.)": "Spike Touch (in)",
-        "Block Touch (in.)": "Block Touch (in)",
-        "Attack Velocity (km/h)": "Attack Velocity (kmph)",
-        "Serve Velocity (km/h)": "Spin Velocity (kmph)"
-    }
-
+    metric_mapping = Fitness_Engine.VBC_METRICS
     imperial_metrics = ["Approach Touch (in.)", "Block Touch (in.)"]
-    position_map = {
-        "S": "Setter",
-        "LS": "Left Side",
-        "RS": "Opposite",
-        "M": "Middle",
-        "LIB": "Libero"
-    }
+    position_map = Fitness_Engine.VBC_POSITIONS
 
     # --- Filters
     col1, col2, col3 = st.columns(3)
     selected_metric = col1.selectbox("📏 Metric", list(metric_mapping.keys()), key="vbc_axis_metric")
     selected_position_team = col2.selectbox("🧍 Position", list(position_map.keys()), key="vbc_axis_pos")
-    age_groups = sorted(vbc_df["Age-Group"].dropna().unique())
+    age_groups = Fitness_Engine.vbc_age_groups()
     selected_age_group = col3.selectbox("📅 Age Group", age_groups, key="vbc_axis_age")
 
     selected_metric_vbc = metric_mapping[selected_metric]
     selected_position_vbc = position_map[selected_position_team]
     use_imperial = selected_metric in imperial_metrics
 
-    # --- Filter and clean team data
-    team_filtered = team_df[team_df["Primary Position"] == selected_position_team].copy()
-    team_filtered["Testing Date"] = pd.to_datetime(team_filtered["Testing Date"], errors="coerce")
-    team_filtered[selected_metric] = pd.to_numeric(team_filtered[selected_metric], errors='coerce')  # Ensure numeric
-    team_filtered = team_filtered.dropna(subset=["Testing Date", selected_metric, "Athlete"])
-    team_filtered["Date Label"] = team_filtered["Testing Date"].dt.strftime("%b %Y")
+    # --- Team tests for this metric/position
+    team_filtered = Fitness_Engine.position_tests(selected_metric, selected_position_team)
 
     if team_filtered.empty:
         st.warning("⚠️ No athlete data available for this metric/position.")
         st.stop()
 
-    # --- Filter VBC data
-    vbc_filtered = vbc_df[
-        (vbc_df["Position"] == selected_position_vbc) &
-        (vbc_df["Age-Group"] == selected_age_group) &
-        (vbc_df[selected_metric_vbc].notna())
-    ]
-
     # --- VBC Ratings and Colors
-    rating_map = {
-        "Minimum": ("Minimum", "red"),
-        "Average": ("Average", "yellow"),
-        "Best": ("Best", "green")
-    }
+    rating_colors = {"Minimum": "red", "Average": "yellow", "Best": "green"}
 
     benchmark_lines = {}
-    for label, (rating_name, color) in rating_map.items():
-        val = vbc_filtered[vbc_filtered["Rating"] == rating_name][selected_metric_vbc].mean()
+    for label, val in Fitness_Engine.benchmark_values(selected_metric, selected_position_team, selected_age_group).items():
         if not pd.isna(val):
-            benchmark_lines[label] = (val, color)
+            benchmark_lines[label] = (val, rating_colors[label])
         else:
-            st.warning(f"⚠️ Missing benchmark for: {label} (Rating='{rating_name}')")
+            st.warning(f"⚠️ Missing benchmark for: {label} (Rating='{label}')")
 
     if not benchmark_lines:
         st.error("❌ No usable VBC benchmark values found.")
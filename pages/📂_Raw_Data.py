@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
-import os
+import numpy as np
 from functions import (
     Athlete_Data_Load,
     Overall_Data_Load,
     Rotation_Data_Load,
-    Match_Data_Load
+    Match_Data_Load,
+    Build_Log,
+    Cache_Manifest,
+    Cache_Warmup,
+    Data_Export,
+    Dataset_Cache,
+    Filter_Index,
+    Name_Index,
+    Setter_Distribution_Load,
+    Table_View
 )
 
 st.set_page_config(page_title="📂 Raw Data Viewer – For Exploratory Analysis", layout="wide")
@@ -19,6 +28,12 @@ Use this space for filtering, exploration, and validating raw data powering all
 ⚠️ **Note:** We are aware of a bug where navigation buttons do not always jump to the correct table location. This will be addressed post-launch.
 """)
 
+# Caches are built by the background warm-up; this page only reads caches that are current
+Cache_Warmup.request()
+warmup_statuses = Cache_Warmup.statuses()
+if Cache_Warmup.is_busy():
+    Cache_Warmup.render_progress(warmup_statuses)
+
 st.markdown("---")
 
 # --- Navigation anchor logic ---
@@ -31,6 +46,7 @@ match_total, match_latest = 0, "N/A"
 overall_total, overall_latest = 0, "N/A"
 rotation_total, rotation_latest = 0, "N/A"
 athlete_total, athlete_latest = 0, "N/A"
+setter_total, setter_latest = 0, "N/A"
 
 # Preload summaries
 from functions import (
@@ -40,19 +56,21 @@ from functions import (
     Athlete_Data_Load,
 )
 
-def get_summary(load_func):
+def get_summary(dataset, summary_func):
+    # Reads the summary written alongside each cache instead of loading the dataset
+    if warmup_statuses.get(dataset) != "ready":
+        return 0, "N/A"
     try:
-        df = load_func(force_rebuild=False)
-        total = df.shape[0]
-        latest = pd.to_datetime(df["Date"], errors='coerce').dropna().max()
-        return total, latest.strftime("%Y-%m-%d") if pd.notnull(latest) else "N/A"
+        summary = summary_func() or {}
+        return summary.get("rows", 0), summary.get("latest_date") or "N/A"
     except:
         return 0, "N/A"
 
-match_total, match_latest = get_summary(Match_Data_Load.load_preprocessed_match_data)
-overall_total, overall_latest = get_summary(Overall_Data_Load.load_preprocessed_overall_data)
-rotation_total, rotation_latest = get_summary(Rotation_Data_Load.load_preprocessed_rotation_data)
-athlete_total, athlete_latest = get_summary(Athlete_Data_Load.load_preprocessed_athlete_data)
+match_total, match_latest = get_summary("match", Match_Data_Load.load_match_summary)
+overall_total, overall_latest = get_summary("overall", Overall_Data_Load.load_overall_summary)
+rotation_total, rotation_latest = get_summary("rotation", Rotation_Data_Load.load_rotation_summary)
+athlete_total, athlete_latest = get_summary("athlete", Athlete_Data_Load.load_athlete_summary)
+setter_total, setter_latest = get_summary("setter", Setter_Distribution_Load.load_setter_summary)
 
 # CSS & JavaScript for scroll behavior and tight spacing
 st.markdown("""
@@ -113,15 +131,16 @@ st.markdown("""
   </div>
   <div class="nav-box">
     <button class="nav-button" onclick="scrollToSection('setter-dist-data-section')">📊 Setter Dist. Data</button><br>
-    <strong>Dynamic load</strong><br>
-    <small>Via CSV</small>
+    <strong>{} records</strong><br>
+    <small>Latest: {}</small>
   </div>
 </div>
 """.format(
     match_total, match_latest,
     overall_total, overall_latest,
     rotation_total, rotation_latest,
-    athlete_total, athlete_latest
+    athlete_total, athlete_latest,
+    setter_total, setter_latest
 ), unsafe_allow_html=True)
 
 # Anchors for scrolling target
@@ -142,59 +161,47 @@ st.markdown("---")
 # -------------------------------
 st.header("📘 Match Data")
 
-force_refresh_match = st.session_state.get("reset_cache_match", False)
-
-with st.spinner("🔄 Loading Match Data..."):
-    match_df = Match_Data_Load.load_preprocessed_match_data(force_rebuild=force_refresh_match)
+match_df = Cache_Warmup.load_ready("match", Match_Data_Load.load_preprocessed_match_data)
 
-if match_df.empty:
+if match_df is None:
+    Cache_Warmup.render_pending("match")
+elif match_df.empty:
     st.warning("⚠️ No match data found or processed.")
 else:
-    # Normalize team names
-    match_df["Home"] = match_df["Home"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    match_df["Away"] = match_df["Away"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    match_df["Team"] = match_df["Team"].replace({"CU": "Crandall", "Holland College": "Holland"})
-
     # Caption summary
     st.caption("This dataset includes all point-by-point match data for every set played in the tracked seasons.")
 
     # Filters
+    match_index = Filter_Index.load_index(Match_Data_Load.CACHE_FILE, match_df)
     col1, col2, col3, col4 = st.columns(4)
-    seasons = sorted(match_df["Season"].dropna().unique())
-    homes = sorted(match_df["Home"].dropna().unique())
-    aways = sorted(match_df["Away"].dropna().unique())
-    teams = sorted(match_df["Team"].dropna().unique())
-
-    f_season = col1.multiselect("Season", options=seasons)
-    f_home = col2.multiselect("Home", options=homes)
-    f_away = col3.multiselect("Away", options=aways)
-    f_team = col4.multiselect("Team", options=teams)
-
-    filtered_match = match_df.copy()
-    if f_season:
-        filtered_match = filtered_match[filtered_match["Season"].isin(f_season)]
-    if f_home:
-        filtered_match = filtered_match[filtered_match["Home"].isin(f_home)]
-    if f_away:
-        filtered_match = filtered_match[filtered_match["Away"].isin(f_away)]
-    if f_team:
-        filtered_match = filtered_match[filtered_match["Team"].isin(f_team)]
+    f_season = col1.multiselect("Season", options=Filter_Index.options(match_index, "Season"))
+    f_home = col2.multiselect("Home", options=Filter_Index.options(match_index, "Home"))
+    f_away = col3.multiselect("Away", options=Filter_Index.options(match_index, "Away"))
+    f_team = col4.multiselect("Team", options=Filter_Index.options(match_index, "Team"))
+
+    positions = Filter_Index.select(
+        match_index, {"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team}
+    )
+    filtered_match = Filter_Index.take(match_df, positions)
 
     st.success(f"✅ {filtered_match.shape[0]} match records shown")
-    st.dataframe(filtered_match)
+    Table_View.render_table(filtered_match, "match_table")
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.download_button("💾 Download Match CSV", filtered_match.to_csv(index=False).encode("utf-8"), "match_data.csv", "text/csv")
+        Data_Export.render_download(
+            filtered_match, "match", "match_data", "Match Data",
+            version=Dataset_Cache.cache_fingerprint(Match_Data_Load.CACHE_FILE),
+            filters={"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team},
+        )
     with col2:
         if st.button("🔁 Reset Match Cache"):
-            if os.path.exists(Match_Data_Load.CACHE_FILE):
-                os.remove(Match_Data_Load.CACHE_FILE)
-                st.session_state["reset_cache_match"] = True
+            if Cache_Manifest.remove_cache(Match_Data_Load.CACHE_FILE):
+                Cache_Warmup.request(["match"], force=True)
                 st.rerun()
             else:
                 st.info("ℹ️ No match cache found.")
-        st.caption("⚠️ Only use if source match data changed.")
+        st.caption("ℹ️ Cache rebuilds automatically when source match files change.")
 
 st.markdown("---")
 
@@ -203,58 +210,52 @@ st.markdown("---")
 # -------------------------------
 st.header("📊 Overall Data")
 
-force_refresh_overall = st.session_state.get("reset_cache_overall", False)
-
-with st.spinner("🔄 Loading Overall Data..."):
-    overall_df = Overall_Data_Load.load_preprocessed_overall_data(force_rebuild=force_refresh_overall)
+overall_df = Cache_Warmup.load_ready("overall", Overall_Data_Load.load_preprocessed_overall_data)
 
-if overall_df.empty:
+if overall_df is None:
+    Cache_Warmup.render_pending("overall")
+elif overall_df.empty:
     st.warning("⚠️ No overall data found or processed.")
 else:
-    # Normalize team names
-    overall_df["Home"] = overall_df["Home"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    overall_df["Away"] = overall_df["Away"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    overall_df["Team"] = overall_df["Team"].replace({"CU": "Crandall", "Holland College": "Holland"})
+    overall_index = Filter_Index.load_index(Overall_Data_Load.CACHE_FILE, overall_df)
 
+    # Only per-set rows (0-5) are shown; the index positions refer to the full frame
+    overall_base = None
     if "Matches" in overall_df.columns:
-        overall_df = overall_df[overall_df["Matches"].astype(str).str.strip().str.isnumeric()]
-        overall_df = overall_df[overall_df["Matches"].astype(int).between(0, 5)]
+        matches = overall_df["Matches"].astype(str).str.strip()
+        numeric = matches.str.isnumeric()
+        valid = numeric & pd.to_numeric(matches.where(numeric), errors="coerce").between(0, 5)
+        overall_base = np.flatnonzero(valid.to_numpy())
 
     col1, col2, col3, col4 = st.columns(4)
-    seasons = sorted(overall_df["Season"].dropna().unique())
-    homes = sorted(overall_df["Home"].dropna().unique())
-    aways = sorted(overall_df["Away"].dropna().unique())
-    teams = sorted(overall_df["Team"].dropna().unique())
-    f_season = col1.multiselect("Overall Season", options=seasons, key="overall_season")
-    f_home = col2.multiselect("Overall Home", options=homes, key="overall_home")
-    f_away = col3.multiselect("Overall Away", options=aways, key="overall_away")
-    f_team = col4.multiselect("Overall Team", options=teams, key="overall_team")
-
-    filtered_overall = overall_df.copy()
-    if f_season:
-        filtered_overall = filtered_overall[filtered_overall["Season"].isin(f_season)]
-    if f_home:
-        filtered_overall = filtered_overall[filtered_overall["Home"].isin(f_home)]
-    if f_away:
-        filtered_overall = filtered_overall[filtered_overall["Away"].isin(f_away)]
-    if f_team:
-        filtered_overall = filtered_overall[filtered_overall["Team"].isin(f_team)]
+    f_season = col1.multiselect("Overall Season", options=Filter_Index.options(overall_index, "Season"), key="overall_season")
+    f_home = col2.multiselect("Overall Home", options=Filter_Index.options(overall_index, "Home"), key="overall_home")
+    f_away = col3.multiselect("Overall Away", options=Filter_Index.options(overall_index, "Away"), key="overall_away")
+    f_team = col4.multiselect("Overall Team", options=Filter_Index.options(overall_index, "Team"), key="overall_team")
+
+    positions = Filter_Index.select(
+        overall_index, {"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team}, base=overall_base
+    )
+    filtered_overall = Filter_Index.take(overall_df, positions)
 
     st.success(f"✅ {filtered_overall.shape[0]} overall records shown")
-    st.dataframe(filtered_overall)
+    Table_View.render_table(filtered_overall, "overall_table")
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.download_button("💾 Download Overall CSV", filtered_overall.to_csv(index=False).encode("utf-8"), "overall_data.csv", "text/csv")
+        Data_Export.render_download(
+            filtered_overall, "overall", "overall_data", "Overall Data",
+            version=Dataset_Cache.cache_fingerprint(Overall_Data_Load.CACHE_FILE),
+            filters={"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team},
+        )
     with col2:
         if st.button("🔁 Reset Overall Cache"):
-            if os.path.exists(Overall_Data_Load.CACHE_FILE):
-                os.remove(Overall_Data_Load.CACHE_FILE)
-                st.session_state["reset_cache_overall"] = True
+            if Cache_Manifest.remove_cache(Overall_Data_Load.CACHE_FILE):
+                Cache_Warmup.request(["overall"], force=True)
                 st.rerun()
             else:
                 st.info("ℹ️ No overall cache found.")
-        st.caption("⚠️ Only use if source overall data changed.")
+        st.caption("ℹ️ Cache rebuilds automatically when source overall files change.")
 
 st.markdown("---")
 
@@ -263,61 +264,50 @@ st.markdown("---")
 # -------------------------------
 st.header("🔄 Rotation Data")
 
-force_refresh_rotation = st.session_state.get("reset_cache_rotation", False)
+rotation_df = Cache_Warmup.load_ready("rotation", Rotation_Data_Load.load_preprocessed_rotation_data)
 
-with st.spinner("🔄 Loading Rotation Data..."):
-    rotation_df = Rotation_Data_Load.load_preprocessed_rotation_data(force_rebuild=force_refresh_rotation)
-
-if rotation_df.empty:
+if rotation_df is None:
+    Cache_Warmup.render_pending("rotation")
+elif rotation_df.empty:
     st.warning("⚠️ No rotation data found or processed.")
 else:
-    # Normalize team names
-    rotation_df["Home"] = rotation_df["Home"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    rotation_df["Away"] = rotation_df["Away"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    rotation_df["Team"] = rotation_df["Team"].replace({"CU": "Crandall", "Holland College": "Holland"})
+    rotation_index = Filter_Index.load_index(Rotation_Data_Load.CACHE_FILE, rotation_df)
 
+    rotation_base = None
     if "Rotation" in rotation_df.columns:
-        rotation_df["Rotation_str"] = rotation_df["Rotation"].astype(str).str.strip()
-        rotation_df = rotation_df[
-            rotation_df["Rotation_str"].isin(["0", "1", "2", "3", "4", "5", "Unknown", "unknown", "nan"])
-        ]
-        rotation_df.drop(columns=["Rotation_str"], inplace=True, errors="ignore")
+        rotation_labels = rotation_df["Rotation"].astype(str).str.strip()
+        valid = rotation_labels.isin(["0", "1", "2", "3", "4", "5", "Unknown", "unknown", "nan"])
+        rotation_base = np.flatnonzero(valid.to_numpy())
 
     s1, s2, s3, s4 = st.columns(4)
-    seasons = sorted(rotation_df["Season"].dropna().unique())
-    homes = sorted(rotation_df["Home"].dropna().unique())
-    aways = sorted(rotation_df["Away"].dropna().unique())
-    teams = sorted(rotation_df["Team"].dropna().unique())
-    f_season = s1.multiselect("Rotation Season", options=seasons, key="rotation_season")
-    f_home = s2.multiselect("Rotation Home", options=homes, key="rotation_home")
-    f_away = s3.multiselect("Rotation Away", options=aways, key="rotation_away")
-    f_team = s4.multiselect("Rotation Team", options=teams, key="rotation_team")
-
-    filtered_rotation = rotation_df.copy()
-    if f_season:
-        filtered_rotation = filtered_rotation[filtered_rotation["Season"].isin(f_season)]
-    if f_home:
-        filtered_rotation = filtered_rotation[filtered_rotation["Home"].isin(f_home)]
-    if f_away:
-        filtered_rotation = filtered_rotation[filtered_rotation["Away"].isin(f_away)]
-    if f_team:
-        filtered_rotation = filtered_rotation[filtered_rotation["Team"].isin(f_team)]
+    f_season = s1.multiselect("Rotation Season", options=Filter_Index.options(rotation_index, "Season"), key="rotation_season")
+    f_home = s2.multiselect("Rotation Home", options=Filter_Index.options(rotation_index, "Home"), key="rotation_home")
+    f_away = s3.multiselect("Rotation Away", options=Filter_Index.options(rotation_index, "Away"), key="rotation_away")
+    f_team = s4.multiselect("Rotation Team", options=Filter_Index.options(rotation_index, "Team"), key="rotation_team")
+
+    positions = Filter_Index.select(
+        rotation_index, {"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team}, base=rotation_base
+    )
+    filtered_rotation = Filter_Index.take(rotation_df, positions)
 
     st.success(f"✅ {filtered_rotation.shape[0]} rotation records shown")
-    st.dataframe(filtered_rotation)
+    Table_View.render_table(filtered_rotation, "rotation_table")
 
     c1, c2 = st.columns([3, 1])
     with c1:
-        st.download_button("💾 Download Rotation CSV", filtered_rotation.to_csv(index=False).encode("utf-8"), "rotation_data.csv", "text/csv")
+        Data_Export.render_download(
+            filtered_rotation, "rotation", "rotation_data", "Rotation Data",
+            version=Dataset_Cache.cache_fingerprint(Rotation_Data_Load.CACHE_FILE),
+            filters={"Season": f_season, "Home": f_home, "Away": f_away, "Team": f_team},
+        )
     with c2:
         if st.button("🔁 Reset Rotation Cache"):
-            if os.path.exists(Rotation_Data_Load.CACHE_FILE):
-                os.remove(Rotation_Data_Load.CACHE_FILE)
-                st.session_state["reset_cache_rotation"] = True
+            if Cache_Manifest.remove_cache(Rotation_Data_Load.CACHE_FILE):
+                Cache_Warmup.request(["rotation"], force=True)
                 st.rerun()
             else:
                 st.info("ℹ️ No rotation cache found.")
-        st.caption("⚠️ Only use if source rotation data changed.")
+        st.caption("ℹ️ Cache rebuilds automatically when source rotation files change.")
 
 st.markdown("---")
 
@@ -326,65 +316,62 @@ st.markdown("---")
 # -------------------------------
 st.header("🏐 Athlete Data")
 
-force_refresh_athlete = st.session_state.get("reset_cache_athlete", False)
-with st.spinner("🔄 Loading Athlete Data..."):
-    athlete_df = Athlete_Data_Load.load_preprocessed_athlete_data(force_rebuild=force_refresh_athlete)
+athlete_df = Cache_Warmup.load_ready("athlete", Athlete_Data_Load.load_preprocessed_athlete_data)
 
-if athlete_df.empty:
+if athlete_df is None:
+    Cache_Warmup.render_pending("athlete")
+elif athlete_df.empty:
     st.warning("⚠️ No athlete data found or processed.")
 else:
-    # Normalize team names
-    athlete_df["Home"] = athlete_df["Home"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    athlete_df["Away"] = athlete_df["Away"].replace({"CU": "Crandall", "Holland College": "Holland"})
-    athlete_df["Team"] = athlete_df["Team"].replace({"CU": "Crandall", "Holland College": "Holland"})
+    athlete_index = Filter_Index.load_index(Athlete_Data_Load.CACHE_FILE, athlete_df)
 
     # Create combined index column without decimal padding
     if "#" in athlete_df.columns and "Athlete" in athlete_df.columns:
-        athlete_df.insert(0, "# - Athlete", athlete_df["#"].apply(lambda x: str(int(float(x))) if pd.notnull(x) and str(x).replace('.', '', 1).isdigit() else str(x)) + " - " + athlete_df["Athlete"].astype(str).str.strip())
+        athlete_df.insert(0, "# - Athlete", athlete_df["#"].astype("string").fillna("nan") + " - " + athlete_df["Athlete"].astype(str).str.strip())
 
     col1, col2, col3, col4, col5 = st.columns(5)
-    seasons = sorted(athlete_df["Season"].dropna().unique())
-    teams = sorted(athlete_df["Team"].dropna().unique()) if "Team" in athlete_df.columns else []
-    homes = sorted(athlete_df["Home"].dropna().unique())
-    aways = sorted(athlete_df["Away"].dropna().unique())
-    names = sorted(athlete_df["Athlete"].dropna().unique()) if "Athlete" in athlete_df.columns else []
-    s_seasons = col1.multiselect("Athlete Season", options=seasons)
-    s_teams = col2.multiselect("Athlete Team", options=teams)
-    s_home = col3.multiselect("Athlete Home", options=homes)
-    s_away = col4.multiselect("Athlete Away", options=aways)
+    s_seasons = col1.multiselect("Athlete Season", options=Filter_Index.options(athlete_index, "Season"))
+    s_teams = col2.multiselect("Athlete Team", options=Filter_Index.options(athlete_index, "Team"))
+    s_home = col3.multiselect("Athlete Home", options=Filter_Index.options(athlete_index, "Home"))
+    s_away = col4.multiselect("Athlete Away", options=Filter_Index.options(athlete_index, "Away"))
     s_name = col5.text_input("Search Athlete")
 
-    filtered_athlete = athlete_df.copy()
-    if s_seasons:
-        filtered_athlete = filtered_athlete[filtered_athlete["Season"].isin(s_seasons)]
-    if s_teams:
-        filtered_athlete = filtered_athlete[filtered_athlete["Team"].isin(s_teams)]
-    if s_home:
-        filtered_athlete = filtered_athlete[filtered_athlete["Home"].isin(s_home)]
-    if s_away:
-        filtered_athlete = filtered_athlete[filtered_athlete["Away"].isin(s_away)]
-    if s_name and "Athlete" in filtered_athlete.columns:
-        filtered_athlete = filtered_athlete[filtered_athlete["Athlete"].str.contains(s_name, case=False, na=False)]
+    # Name search runs over the distinct athlete names, then maps the matches to rows through the index
+    name_positions = None
+    if s_name and "Athlete" in athlete_index["columns"]:
+        name_index = Name_Index.build_index(tuple(Filter_Index.options(athlete_index, "Athlete")))
+        matched_names = Name_Index.search(name_index, s_name)
+        name_positions = Filter_Index.value_positions(athlete_index, "Athlete", matched_names)
+        if matched_names:
+            st.caption("🔎 Matching athletes: " + ", ".join(matched_names[:10]) + (" ..." if len(matched_names) > 10 else ""))
+
+    positions = Filter_Index.select(
+        athlete_index, {"Season": s_seasons, "Team": s_teams, "Home": s_home, "Away": s_away}, base=name_positions
+    )
+    filtered_athlete = Filter_Index.take(athlete_df, positions)
 
     st.success(f"✅ {filtered_athlete.shape[0]} athlete records shown")
     latest_athlete_date = pd.to_datetime(filtered_athlete["Date"], errors='coerce').dropna().max()
     if pd.notnull(latest_athlete_date):
         st.markdown(f"**🗓️ Athlete data current as of:** {latest_athlete_date.date()}")
 
-    st.dataframe(filtered_athlete)
+    Table_View.render_table(filtered_athlete, "athlete_table")
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        st.download_button("💾 Download Athlete CSV", filtered_athlete.to_csv(index=False).encode("utf-8"), "athlete_data.csv", "text/csv")
+        Data_Export.render_download(
+            filtered_athlete, "athlete", "athlete_data", "Athlete Data",
+            version=Dataset_Cache.cache_fingerprint(Athlete_Data_Load.CACHE_FILE),
+            filters={"Season": s_seasons, "Team": s_teams, "Home": s_home, "Away": s_away, "Athlete": s_name},
+        )
     with col2:
         if st.button("🔁 Reset Athlete Cache"):
-            if os.path.exists(Athlete_Data_Load.CACHE_FILE):
-                os.remove(Athlete_Data_Load.CACHE_FILE)
-                st.session_state["reset_cache_athlete"] = True
+            if Cache_Manifest.remove_cache(Athlete_Data_Load.CACHE_FILE):
+                Cache_Warmup.request(["athlete"], force=True)
                 st.rerun()
             else:
                 st.info("ℹ️ No athlete cache found.")
-        st.caption("⚠️ Only use if source athlete data changed.")
+        st.caption("ℹ️ Cache rebuilds automatically when source athlete files change.")
 
 st.markdown("---")
 
@@ -393,55 +380,93 @@ st.markdown("---")
 # -------------------------------
 st.header("📊 Setter Distribution Data")
 
-setter_file = "data/Setter Distribution Data.csv"
+setter_df = Cache_Warmup.load_ready("setter", Setter_Distribution_Load.load_preprocessed_setter_data)
 
-if os.path.exists(setter_file):
-    try:
-        setter_df = pd.read_csv(setter_file)
-
-        # Filters
-        f1, f2, f3, f4, f5 = st.columns(5)
-        teams = sorted(setter_df["Team"].dropna().unique())
-        homes = sorted(setter_df["Home"].dropna().unique()) if "Home" in setter_df.columns else []
-        aways = sorted(setter_df["Away"].dropna().unique()) if "Away" in setter_df.columns else []
-        tendencies = sorted(setter_df["Setter Tendency"].dropna().unique()) if "Setter Tendency" in setter_df.columns else []
-        positions = sorted(setter_df["Position"].dropna().unique()) if "Position" in setter_df.columns else []
-
-        f_team = f1.multiselect("Team", options=teams)
-        f_home = f2.multiselect("Home", options=homes)
-        f_away = f3.multiselect("Away", options=aways)
-        f_tend = f4.multiselect("Setter Tendency", options=tendencies)
-        f_pos  = f5.multiselect("Position", options=positions)
-
-        filtered_setter_df = setter_df.copy()
-        if f_team:
-            filtered_setter_df = filtered_setter_df[filtered_setter_df["Team"].isin(f_team)]
-        if f_home and "Home" in filtered_setter_df.columns:
-            filtered_setter_df = filtered_setter_df[filtered_setter_df["Home"].isin(f_home)]
-        if f_away and "Away" in filtered_setter_df.columns:
-            filtered_setter_df = filtered_setter_df[filtered_setter_df["Away"].isin(f_away)]
-        if f_tend and "Setter Tendency" in filtered_setter_df.columns:
-            filtered_setter_df = filtered_setter_df[filtered_setter_df["Setter Tendency"].isin(f_tend)]
-        if f_pos and "Position" in filtered_setter_df.columns:
-            filtered_setter_df = filtered_setter_df[filtered_setter_df["Position"].isin(f_pos)]
-
-        st.success(f"✅ Showing {filtered_setter_df.shape[0]} filtered rows from Setter Distribution Data")
-        st.dataframe(filtered_setter_df)
-
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.download_button(
-                "💾 Download Setter Distribution CSV",
-                data=filtered_setter_df.to_csv(index=False).encode("utf-8"),
-                file_name="setter_distribution_data.csv",
-                mime="text/csv"
-            )
-        with col2:
-            st.caption("📌 Direct from scouting reports and analytics exports")
-    except Exception as e:
-        st.error(f"❌ Failed to load Setter Distribution Data: {e}")
+if setter_df is None:
+    Cache_Warmup.render_pending("setter")
+elif setter_df.empty:
+    st.warning(f"⚠️ No setter distribution data found at {Setter_Distribution_Load.SETTER_DATA_FILE}")
 else:
-    st.warning("⚠️ Setter Distribution file not found at data/Setter Distribution Data.csv")
+    setter_index = Filter_Index.load_index(Setter_Distribution_Load.CACHE_FILE, setter_df)
+
+    # Filters
+    f1, f2, f3, f4, f5 = st.columns(5)
+    f_team = f1.multiselect("Team", options=Filter_Index.options(setter_index, "Team"), key="setter_team")
+    f_home = f2.multiselect("Home", options=Filter_Index.options(setter_index, "Home"), key="setter_home")
+    f_away = f3.multiselect("Away", options=Filter_Index.options(setter_index, "Away"), key="setter_away")
+    f_tend = f4.multiselect("Setter Tendency", options=Filter_Index.options(setter_index, "Setter Tendency"), key="setter_tendency")
+    f_pos  = f5.multiselect("Position", options=Filter_Index.options(setter_index, "Position"), key="setter_position")
+
+    positions = Filter_Index.select(
+        setter_index, {"Team": f_team, "Home": f_home, "Away": f_away, "Setter Tendency": f_tend, "Position": f_pos}
+    )
+    filtered_setter_df = Filter_Index.take(setter_df, positions)
+
+    st.success(f"✅ Showing {filtered_setter_df.shape[0]} filtered rows from Setter Distribution Data")
+    Table_View.render_table(filtered_setter_df, "setter_table")
+
+    with st.expander("📈 Setter tendencies by position"):
+        by_position = Setter_Distribution_Load.load_setter_aggregate("position")
+        if f_team and not by_position.empty:
+            by_position = by_position[by_position["Team"].isin(f_team)]
+        st.dataframe(by_position, hide_index=True)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        Data_Export.render_download(
+            filtered_setter_df, "setter", "setter_distribution_data", "Setter Distribution Data",
+            version=Dataset_Cache.cache_fingerprint(Setter_Distribution_Load.CACHE_FILE),
+            filters={"Team": f_team, "Home": f_home, "Away": f_away, "Setter Tendency": f_tend, "Position": f_pos},
+        )
+    with col2:
+        if st.button("🔁 Reset Setter Cache"):
+            if Setter_Distribution_Load.remove_setter_cache():
+                Cache_Warmup.request(["setter"], force=True)
+                st.rerun()
+            else:
+                st.info("ℹ️ No setter distribution cache found.")
+        st.caption("📌 Direct from scouting reports and analytics exports")
+
+# -------------------------------
+# Section 6: Loader Diagnostics
+# -------------------------------
+st.markdown("---")
+st.header("🩺 Loader Diagnostics")
+st.caption("Profile of the most recent cache build for each dataset: stage timings, per-file rows and skipped files.")
+
+build_runs = Build_Log.last_runs()
+if not build_runs:
+    st.info("ℹ️ No cache builds recorded yet. A build is logged whenever a cache is rebuilt from source files.")
+
+for dataset, run in build_runs.items():
+    with st.expander(f"{str(dataset).title()} — built {run.get('started', 'N/A')} in {run.get('seconds', 0):.2f}s"):
+        files_df = pd.DataFrame(run.get("files", []))
+        status_counts = files_df["status"].value_counts() if not files_df.empty else pd.Series(dtype=int)
+
+        m1, m2, m3, m4, m5 = st.columns(5)
+        m1.metric("Parsed", int(status_counts.get("parsed", 0)))
+        m2.metric("Streamed", int(status_counts.get("streamed", 0)))
+        m3.metric("Reused", int(status_counts.get("reused", 0)))
+        m4.metric("Skipped", int(status_counts.get("skipped", 0)))
+        m5.metric("Rows out", run.get("rows_out", 0))
+
+        for message in run.get("errors", []):
+            st.error(f"❌ {message}")
+
+        stage_seconds = pd.Series(Build_Log.stage_totals(run), dtype=float).sort_values(ascending=False)
+        if not stage_seconds.empty:
+            st.markdown("**⏱️ Seconds per stage** (file stages are summed over files)")
+            st.bar_chart(stage_seconds)
+
+        if not files_df.empty:
+            stages_df = pd.DataFrame(files_df["stages"].tolist()).add_prefix("s ")
+            files_df = pd.concat([files_df.drop(columns=["stages"]), stages_df], axis=1)
+            skipped = files_df[files_df["status"] == "skipped"]
+            if not skipped.empty:
+                st.markdown("**⚠️ Skipped files**")
+                st.dataframe(skipped[["file", "skip_reason"]], hide_index=True)
+            st.markdown("**🐢 Slowest files**")
+            st.dataframe(files_df.sort_values("seconds", ascending=False).head(20), hide_index=True)
 
 # -------------------------------
 # Footer
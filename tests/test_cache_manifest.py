@@ -0,0 +1,96 @@
+# tests/test_cache_manifest.py
+# When a parquet cache counts as current for its source files
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Cache_Manifest  # noqa: E402
+
+@pytest.fixture
+def cache(tmp_path):
+    source_dir = tmp_path / "Overall Data"
+    source_dir.mkdir()
+    source = source_dir / "match.csv"
+    source.write_text("Kill,Ace\n3,1\n", encoding="utf-8")
+    cache_file = str(tmp_path / "overall_data_cache.parquet")
+    with open(cache_file, "wb") as f:
+        f.write(b"parquet")
+    return cache_file, str(source_dir), source
+
+def manifest_for(source_dir):
+    return Cache_Manifest.build_source_manifest([source_dir])
+
+def touch(path, seconds=5):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+def build(cache_file, source_dir, hash_contents, monkeypatch):
+    monkeypatch.setattr(Cache_Manifest, "HASH_SOURCE_CONTENTS", hash_contents)
+    Cache_Manifest.write_manifest(cache_file, manifest_for(source_dir))
+
+@pytest.mark.parametrize("hash_contents", [False, True])
+def test_unchanged_sources_are_current(cache, hash_contents, monkeypatch):
+    cache_file, source_dir, _ = cache
+    build(cache_file, source_dir, hash_contents, monkeypatch)
+    assert Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_missing_cache_or_manifest_is_stale(cache, monkeypatch):
+    cache_file, source_dir, _ = cache
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+    build(cache_file, source_dir, False, monkeypatch)
+    os.remove(cache_file)
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_touch_invalidates_without_hashes(cache, monkeypatch):
+    cache_file, source_dir, source = cache
+    build(cache_file, source_dir, False, monkeypatch)
+    touch(source)
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_touch_keeps_cache_current_with_hashes(cache, monkeypatch):
+    cache_file, source_dir, source = cache
+    build(cache_file, source_dir, True, monkeypatch)
+    assert "sha256" in Cache_Manifest.read_manifest(cache_file)["sources"][str(source)]
+    touch(source)
+    assert Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+    # The new stat is recorded, so the next check does not hash again
+    stored = Cache_Manifest.read_manifest(cache_file)["sources"][str(source)]
+    assert stored["mtime_ns"] == os.stat(source).st_mtime_ns
+
+@pytest.mark.parametrize("hash_contents", [False, True])
+def test_same_size_content_change_invalidates(cache, hash_contents, monkeypatch):
+    cache_file, source_dir, source = cache
+    build(cache_file, source_dir, hash_contents, monkeypatch)
+    source.write_text("Kill,Ace\n4,1\n", encoding="utf-8")
+    touch(source)
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_added_or_removed_source_invalidates(cache, monkeypatch):
+    cache_file, source_dir, source = cache
+    build(cache_file, source_dir, True, monkeypatch)
+    extra = os.path.join(source_dir, "second match.csv")
+    with open(extra, "w", encoding="utf-8") as f:
+        f.write("Kill,Ace\n1,0\n")
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+    build(cache_file, source_dir, True, monkeypatch)
+    os.remove(source)
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_version_bump_invalidates(cache, monkeypatch):
+    cache_file, source_dir, _ = cache
+    build(cache_file, source_dir, True, monkeypatch)
+    monkeypatch.setattr(Cache_Manifest, "MANIFEST_VERSION", Cache_Manifest.MANIFEST_VERSION + 1)
+    assert not Cache_Manifest.is_cache_current(cache_file, manifest_for(source_dir))
+
+def test_remove_cache_takes_its_manifest(cache, monkeypatch):
+    cache_file, source_dir, _ = cache
+    build(cache_file, source_dir, False, monkeypatch)
+    assert Cache_Manifest.remove_cache(cache_file)
+    assert not os.path.exists(cache_file)
+    assert not os.path.exists(Cache_Manifest.manifest_path(cache_file))
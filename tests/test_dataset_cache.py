@@ -0,0 +1,42 @@
+# tests/test_dataset_cache.py
+# Frames handed out by the shared cache must never write through to the cached frame
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Dataset_Cache  # noqa: E402
+
+KEY = Dataset_Cache.make_key(("data/test_cache.parquet", 1, 1))
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    Dataset_Cache.clear()
+    yield
+    Dataset_Cache.clear()
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_edits_on_a_view_stay_out_of_the_cache(copy_on_write, monkeypatch):
+    monkeypatch.setattr(Dataset_Cache, "copy_on_write_enabled", lambda: copy_on_write)
+    Dataset_Cache.put(KEY, pd.DataFrame({"Kill": [1, 2, 3], "Team": ["A", "B", "C"]}))
+
+    edited = Dataset_Cache.get(KEY)
+    edited.loc[0, "Kill"] = 99
+    edited["Team"] = "Z"
+    edited["New"] = 1
+
+    cached = Dataset_Cache.get(KEY)
+    assert cached["Kill"].tolist() == [1, 2, 3]
+    assert cached["Team"].tolist() == ["A", "B", "C"]
+    assert "New" not in cached.columns
+
+def test_view_without_copy_on_write_owns_its_data(monkeypatch):
+    monkeypatch.setattr(Dataset_Cache, "copy_on_write_enabled", lambda: False)
+    df = pd.DataFrame({"Kill": [1, 2, 3]})
+    assert not np.shares_memory(Dataset_Cache.view(df)["Kill"].to_numpy(), df["Kill"].to_numpy())
@@ -0,0 +1,106 @@
+# tests/test_filter_index.py
+# Row selection through the inverted filter index against the chained isin masks it replaced
+
+import itertools
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Filter_Index  # noqa: E402
+
+SEASONS = ["2022-2023", "2023-2024", "2024-2025"]
+TEAMS = ["Crandall", "UNBSJ", "Holland", "STU", None]
+
+@pytest.fixture(scope="module")
+def frame():
+    rng = np.random.default_rng(7)
+    rows = 400
+    df = pd.DataFrame({
+        # Category with an unused level, as the typed caches have after filtering
+        "Season": pd.Categorical(rng.choice(SEASONS, rows), categories=SEASONS + ["2021-2022"]),
+        "Home": rng.choice(TEAMS, rows),
+        "Away": rng.choice(TEAMS, rows),
+        "Team": rng.choice(TEAMS[:-1], rows),
+        "Position": rng.integers(1, 7, rows),
+        "Kill": rng.integers(0, 20, rows),
+    })
+    return df
+
+def isin_filter(df, selections, base_mask=None):
+    # The Raw Data page before the index: one isin mask per non-empty multiselect
+    out = df if base_mask is None else df[base_mask]
+    for col, selected in selections.items():
+        if selected:
+            out = out[out[col].isin(selected)]
+    return out
+
+def labels(selections):
+    return {col: [str(value) for value in selected] for col, selected in selections.items()}
+
+def selection_cases(df):
+    rng = np.random.default_rng(11)
+    columns = ["Season", "Home", "Away", "Team", "Position"]
+    for count in range(1, len(columns) + 1):
+        for cols in itertools.combinations(columns, count):
+            selections = {}
+            for col in cols:
+                present = df[col].dropna().unique().tolist()
+                size = rng.integers(1, len(present) + 1)
+                selections[col] = list(rng.choice(np.array(present, dtype=object), size, replace=False))
+            yield selections
+
+def test_options_are_the_sorted_present_values(frame):
+    index = Filter_Index.build_index(frame)
+    assert Filter_Index.options(index, "Season") == SEASONS
+    assert Filter_Index.options(index, "Home") == sorted(frame["Home"].dropna().unique())
+    assert Filter_Index.options(index, "Position") == [str(value) for value in sorted(frame["Position"].unique())]
+    assert Filter_Index.options(index, "Athlete") == []
+
+def test_selection_matches_isin_masks(frame):
+    index = Filter_Index.build_index(frame)
+    for selections in selection_cases(frame):
+        positions = Filter_Index.select(index, labels(selections))
+        pd.testing.assert_frame_equal(Filter_Index.take(frame, positions), isin_filter(frame, selections))
+
+def test_base_positions_match_a_leading_mask(frame):
+    index = Filter_Index.build_index(frame)
+    base_mask = frame["Kill"] >= 5
+    base = np.flatnonzero(base_mask.to_numpy())
+    for selections in selection_cases(frame):
+        positions = Filter_Index.select(index, labels(selections), base=base)
+        pd.testing.assert_frame_equal(Filter_Index.take(frame, positions), isin_filter(frame, selections, base_mask))
+
+def test_empty_selections_leave_the_frame_alone(frame):
+    index = Filter_Index.build_index(frame)
+    assert Filter_Index.select(index, {"Season": [], "Team": []}) is None
+    assert Filter_Index.take(frame, None) is frame
+
+def test_unknown_label_selects_nothing(frame):
+    index = Filter_Index.build_index(frame)
+    positions = Filter_Index.select(index, {"Team": ["Nobody"]})
+    assert len(Filter_Index.take(frame, positions)) == 0
+
+def test_sidecar_round_trip(frame, tmp_path):
+    cache_file = str(tmp_path / "match_data_cache.parquet")
+    frame.to_parquet(cache_file, index=False)
+    Filter_Index.write_index(frame, cache_file)
+    index = Filter_Index.load_index(cache_file, frame)
+    built = Filter_Index.build_index(frame)
+    for col, entry in built["columns"].items():
+        for name, array in entry.items():
+            np.testing.assert_array_equal(index["columns"][col][name], array)
+
+def test_sidecar_from_another_build_is_ignored(frame, tmp_path):
+    cache_file = str(tmp_path / "match_data_cache.parquet")
+    frame.to_parquet(cache_file, index=False)
+    Filter_Index.write_index(frame, cache_file)
+    # A rebuild rewrites the parquet, so the old sidecar no longer matches its stat
+    frame.iloc[:10].to_parquet(cache_file, index=False)
+    assert Filter_Index.read_index(cache_file) is None
+    assert Filter_Index.load_index(cache_file, frame.iloc[:10])["rows"] == 10
@@ -0,0 +1,121 @@
+# tests/test_fitness_deltas.py
+# The one-pass Delta tab table against the per-athlete loop it replaced
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Fitness_Engine  # noqa: E402
+
+# --- Reference: the per-athlete loop _delta_summary ran before build_delta_table ---
+def reference_delta(delta_df, column):
+    delta_df = delta_df.sort_values(by=["Athlete", "Testing Date"])
+
+    results = []
+    for athlete, group in delta_df.groupby("Athlete"):
+        if group.shape[0] < 2:
+            continue
+        first_val, first_date = group.iloc[0][column], group.iloc[0]["Testing Date"]
+        last_val, last_date = group.iloc[-1][column], group.iloc[-1]["Testing Date"]
+        if group.shape[0] >= 3:
+            second_last_val, second_last_date = group.iloc[-2][column], group.iloc[-2]["Testing Date"]
+        else:
+            second_last_val, second_last_date = None, None
+
+        diff_first = last_val - first_val
+        diff_second = last_val - second_last_val if second_last_val is not None else None
+        pct_first = 100 * diff_first / last_val if last_val != 0 else None
+        pct_second = 100 * diff_second / last_val if last_val != 0 and diff_second is not None else None
+
+        results.append({
+            "Athlete": athlete,
+            "Δ_val_1st": round(diff_first, 2),
+            "Δ_pct_1st": round(pct_first, 2) if pct_first is not None else None,
+            "Δ_val_2nd": round(diff_second, 2) if diff_second is not None else None,
+            "Δ_pct_2nd": round(pct_second, 2) if pct_second is not None else None,
+            "First Test Date": first_date.strftime("%B %Y"),
+            "Second Last Test Date": second_last_date.strftime("%B %Y") if second_last_date else None,
+            "Most Recent Test Date": last_date.strftime("%B %Y"),
+        })
+    return pd.DataFrame(results, columns=Fitness_Engine.DELTA_COLUMNS)
+
+def metric_frame(store, column, positions=()):
+    # The per-metric input the loop received (_metric_frame)
+    rows = Fitness_Engine.metric_rows(store, column)
+    if positions:
+        rows = rows[rows["Primary Position"].isin(positions)]
+    out = rows[["Athlete", "Primary Position", "Testing Date", "Value"]].rename(columns={"Value": column})
+    for col in ["Athlete", "Primary Position"]:
+        out[col] = out[col].astype(str)
+    return out.sort_values(["Testing Date", "Athlete"], kind="stable").reset_index(drop=True)
+
+def delta_tables(store, positions=()):
+    # _delta_tables without the per-version memo
+    rows = Fitness_Engine.metric_rows(store)
+    if positions:
+        rows = rows[rows["Primary Position"].isin(positions)]
+    table = Fitness_Engine.build_delta_table(rows)
+    return {
+        str(metric): frame[Fitness_Engine.DELTA_COLUMNS].reset_index(drop=True)
+        for metric, frame in table.groupby("Metric", observed=True, sort=False)
+    }
+
+def normalized(df):
+    # The loop left None where the table has NaN
+    return df.astype(object).where(df.notna(), np.nan).reset_index(drop=True)
+
+def assert_matches_loop(store, positions=()):
+    tables = delta_tables(store, positions)
+    checked = 0
+    for column in store["metrics"]:
+        expected = reference_delta(metric_frame(store, column, positions), column)
+        actual = tables.get(column, pd.DataFrame(columns=Fitness_Engine.DELTA_COLUMNS))
+        pd.testing.assert_frame_equal(normalized(actual), normalized(expected), check_dtype=False)
+        checked += len(expected)
+    return checked
+
+# --- Fixtures ---
+def synthetic_store():
+    tests = {
+        # athlete: (position, [(date, broad jump, agility)])
+        "Single Test": ("S", [("2023-09-01", 90, 40.1)]),
+        "Two Tests": ("LS", [("2023-09-01", 95, 41.0), ("2024-01-15", 97.5, 39.2)]),
+        "Three Tests": ("M", [("2023-09-01", 88, 42.0), ("2024-01-15", 91, 40.0), ("2024-09-03", 93.333, 38.77)]),
+        "Ends At Zero": ("LIB", [("2023-09-01", 80, 40.0), ("2024-01-15", 85, 39.0), ("2024-09-03", 0, 38.0)]),
+        "Gap In Metric": ("RS", [("2023-09-01", 99, None), ("2024-01-15", None, 37.5), ("2024-09-03", 101, 36.25)]),
+        "Four Tests": ("MB", [
+            ("2023-01-10", 84, 44.0), ("2023-09-01", 86, 43.0), ("2024-01-15", 85, 43.5), ("2024-09-03", 89.456, 41.111),
+        ]),
+    }
+    rows = [
+        {"Athlete": athlete, "Primary Position": position, "Year of Eligibility": "2", "Testing Date": date,
+         "Broad Jump (in.)": jump, "Agility Test (s)": agility}
+        for athlete, (position, athlete_tests) in tests.items()
+        for date, jump, agility in athlete_tests
+    ]
+    raw = pd.DataFrame(rows).astype(object)
+    return Fitness_Engine.build_store(raw.where(raw.notna(), "").astype(str))
+
+@pytest.mark.parametrize("positions", [(), ("M", "MB", "LIB")])
+def test_synthetic_tests_match_loop(positions):
+    assert assert_matches_loop(synthetic_store(), positions)
+
+def test_zero_latest_value_has_no_percent_change():
+    table = delta_tables(synthetic_store())["Broad Jump (in.)"].set_index("Athlete")
+    assert table.loc["Ends At Zero", "Δ_val_1st"] == -80
+    assert pd.isna(table.loc["Ends At Zero", "Δ_pct_1st"])
+    assert pd.isna(table.loc["Two Tests", "Δ_val_2nd"])
+    assert "Single Test" not in table.index
+
+def test_bundled_testing_data_matches_loop():
+    if not os.path.exists(os.path.join(ROOT, Fitness_Engine.TESTING_DATA_FILE)):
+        pytest.skip("no bundled testing data")
+    store = Fitness_Engine.build_store(pd.read_csv(os.path.join(ROOT, Fitness_Engine.TESTING_DATA_FILE), dtype=str))
+    assert assert_matches_loop(store)
+    assert assert_matches_loop(store, tuple(Fitness_Engine.POSITION_GROUPS["Outside Hitters"]))
@@ -0,0 +1,50 @@
+# tests/test_match_batches.py
+# A match export read in row batches must build the same typed frame as a whole-file read
+
+import glob
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Dataset_Schema, Ingestion_Core, Match_Data_Load  # noqa: E402
+
+MATCH_FILES = sorted(glob.glob(os.path.join(ROOT, Match_Data_Load.MATCH_DATA_DIR, "*.csv")))
+CHUNK_ROWS = 5
+
+def build(file_path, streamed, monkeypatch):
+    monkeypatch.setattr(Ingestion_Core, "STREAM_THRESHOLD_BYTES", 0 if streamed else 1 << 40)
+    monkeypatch.setattr(Ingestion_Core, "STREAM_CHUNK_ROWS", CHUNK_ROWS)
+    frames = Match_Data_Load.process_match_data_file(file_path, os.path.basename(file_path))
+    assert frames is not None
+    batch_count = len(frames)
+    return batch_count, Ingestion_Core.combine_frames(frames, Dataset_Schema.MATCH_SCHEMA)
+
+def assert_batched_like_whole(file_path, monkeypatch):
+    _, whole = build(file_path, False, monkeypatch)
+    batch_count, batched = build(file_path, True, monkeypatch)
+    assert batch_count > 1
+    pd.testing.assert_frame_equal(batched, whole)
+
+@pytest.mark.parametrize("file_path", MATCH_FILES, ids=os.path.basename)
+def test_bundled_files_batched_like_whole(file_path, monkeypatch):
+    assert len(pd.read_csv(file_path)) > CHUNK_ROWS
+    assert_batched_like_whole(file_path, monkeypatch)
+
+def test_column_typed_differently_per_batch(tmp_path, monkeypatch):
+    # The first batch of "Set 5" holds only bare numbers and blanks, so inferring types per batch
+    # reads it as float ("25" -> 25.0, normalized to "25-0") while the whole file reads it as text
+    source = MATCH_FILES[0]
+    df = pd.read_csv(source).astype({"Set 5": object})
+    df.loc[:CHUNK_ROWS - 1, "Set 5"] = ["25", None] * (CHUNK_ROWS // 2) + ["25"] * (CHUNK_ROWS % 2)
+    df.loc[CHUNK_ROWS:, "Set 5"] = "15 - 13"
+    target = tmp_path / os.path.basename(source)
+    with open(target, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join("0" if col.startswith("0") else col for col in df.columns) + "\n")
+        df.to_csv(f, header=False, index=False)
+
+    assert_batched_like_whole(str(target), monkeypatch)
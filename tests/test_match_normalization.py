@@ -0,0 +1,125 @@
+# tests/test_match_normalization.py
+# Parity between the vectorized match column transforms and the row-wise helpers they replaced
+
+import glob
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Match_Data_Load, Team_Aliases  # noqa: E402
+
+HOME = Team_Aliases.HOME_TEAM
+MATCH_FILES = sorted(glob.glob(os.path.join(ROOT, Match_Data_Load.MATCH_DATA_DIR, "*.csv")))
+
+# --- Row-wise reference: the per-row lambdas process_match_data_file used before vectorizing ---
+def reference_split(opponent, is_opponents_file):
+    def team(val):
+        if not is_opponents_file:
+            return HOME
+        val = val.strip()
+        if val.startswith("@"):
+            return val[1:].strip()
+        if val.lower().startswith("vs"):
+            return val[3:].strip()
+        return "Unknown"
+
+    def home(val):
+        val = val.strip()
+        return val[1:].strip() if val.startswith("@") else HOME if val.lower().startswith("vs") else "Unknown"
+
+    def away(val):
+        val = val.strip()
+        return HOME if val.startswith("@") else val[3:].strip() if val.lower().startswith("vs") else "Unknown"
+
+    return opponent.apply(team), opponent.apply(home), opponent.apply(away)
+
+def reference_result(result, team):
+    frame = pd.DataFrame({"Result": result, "Team": team})
+    return frame.apply(Match_Data_Load.adjust_result_for_team, axis=1)
+
+def reference_set_scores(values, team):
+    frame = pd.DataFrame({"Score": values.apply(Match_Data_Load.normalize_set_score), "Team": team})
+    return frame.apply(lambda row: Match_Data_Load.flip_set_score(row, "Score"), axis=1)
+
+def vectorized_set_scores(values, team):
+    return Match_Data_Load.flip_set_score_column(Match_Data_Load.normalize_set_score_column(values), team)
+
+def assert_same(left, right):
+    assert list(left.astype(object)) == list(right.astype(object))
+
+def set_columns(df):
+    return [col for col in df.columns if col.lower().startswith("score") or col.lower().startswith("set ")]
+
+# --- Bundled match exports ---
+@pytest.mark.parametrize("file_path", MATCH_FILES, ids=os.path.basename)
+def test_bundled_files_match_row_wise(file_path):
+    df = pd.read_csv(file_path)
+    is_opponents_file = "Opponents" in os.path.basename(file_path)
+
+    expected = reference_split(df["Opponent"], is_opponents_file)
+    actual = Match_Data_Load.split_opponent_column(df["Opponent"], is_opponents_file)
+    for exp, act in zip(expected, actual):
+        assert_same(act, exp)
+
+    team = actual[0]
+    assert_same(Match_Data_Load.adjust_result_column(df["Result"], team), reference_result(df["Result"], team))
+    for col in set_columns(df):
+        assert_same(vectorized_set_scores(df[col], team), reference_set_scores(df[col], team))
+
+def test_bundled_files_present():
+    assert MATCH_FILES
+
+# --- Edge cases ---
+OPPONENTS = pd.Series(["@ USTA", "vs Holland College", "  VS  DAL AC ", "@UNBSJ", "Tournament", " @  Reds 18U"])
+
+@pytest.mark.parametrize("is_opponents_file", [False, True])
+def test_opponent_edge_cases(is_opponents_file):
+    expected = reference_split(OPPONENTS, is_opponents_file)
+    actual = Match_Data_Load.split_opponent_column(OPPONENTS, is_opponents_file)
+    for exp, act in zip(expected, actual):
+        assert_same(act, exp)
+
+TEAMS = pd.Series([HOME, "USTA", "Holland", HOME, "DAL AC", "Unknown", "UNBSJ", "USTA"])
+
+def test_result_edge_cases_for_other_teams():
+    results = pd.Series(["W 3-1", "W 3-1", "L 0-3", "L1-3", "W 12-10", "Forfeit", "", "L 2-3 (OT)"])
+    assert_same(Match_Data_Load.adjust_result_column(results, TEAMS), reference_result(results, TEAMS))
+
+def test_result_non_text_cells_fail_like_row_wise():
+    results = pd.Series(["W 3-1", np.nan])
+    teams = pd.Series([HOME, "USTA"])
+    with pytest.raises(TypeError):
+        reference_result(results, teams)
+    with pytest.raises(TypeError):
+        Match_Data_Load.adjust_result_column(results, teams)
+
+def test_set_score_edge_cases():
+    values = pd.Series([
+        "25 - 23",      # plain score
+        "23-Sep",       # Excel turned 23-9 into a date
+        "Oct-25",       # month first
+        "25 - 23 - 1",  # three digit runs stay as-is
+        "-",            # no set played
+        np.nan,         # missing cell
+        "  15-13  ",    # padding
+        "Dec",          # month name alone
+    ])
+    assert_same(vectorized_set_scores(values, TEAMS), reference_set_scores(values, TEAMS))
+
+def test_set_score_numeric_column():
+    # A column with no dashes at all reads back as floats
+    values = pd.Series([25.0, np.nan, 17.0, 3.0, 1.0, 0.0, 2.0, 4.0])
+    assert_same(vectorized_set_scores(values, TEAMS), reference_set_scores(values, TEAMS))
+
+def test_opponent_missing_cell_fails_like_row_wise():
+    opponents = pd.Series(["@ USTA", np.nan])
+    with pytest.raises(AttributeError):
+        reference_split(opponents, True)
+    with pytest.raises(TypeError):
+        Match_Data_Load.split_opponent_column(opponents, True)
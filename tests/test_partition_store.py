@@ -0,0 +1,121 @@
+# tests/test_partition_store.py
+# Incremental partition reuse and purging in Partition_Store
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Cache_Manifest, Partition_Store  # noqa: E402
+
+DATASET = "overall"
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(Partition_Store, "PARTITION_ROOT", str(tmp_path / "partitions"))
+    source_dir = tmp_path / "Overall Data"
+    source_dir.mkdir()
+    for day, kills in (("2024-11-02", 3), ("2024-11-09", 5)):
+        (source_dir / f"Crandall vs UNBSJ ({day}).csv").write_text(f"Date,Kill\n{day},{kills}\n", encoding="utf-8")
+    return str(source_dir)
+
+class Parser:
+    def __init__(self):
+        self.parsed = []
+
+    def __call__(self, file_path, file_name):
+        self.parsed.append(file_name)
+        df = pd.read_csv(file_path)
+        df["Season"] = "2024-2025"
+        df["source_file"] = file_name
+        return df
+
+def load(source_dir, parser=None):
+    parser = parser or Parser()
+    frames = Partition_Store.load_partitioned_files(DATASET, source_dir, parser)
+    combined = pd.concat(frames, ignore_index=True).sort_values("source_file", ignore_index=True)
+    return combined, sorted(parser.parsed)
+
+def partition_files():
+    return sorted(
+        os.path.join(root, file)
+        for root, _, files in os.walk(Partition_Store.dataset_dir(DATASET))
+        for file in files if file.endswith(".parquet")
+    )
+
+def touch(path, seconds=5):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+def test_first_build_parses_and_indexes_every_source(store):
+    combined, parsed = load(store)
+    assert len(parsed) == 2
+    assert combined["Kill"].tolist() == [3, 5]
+    assert len(partition_files()) == 2
+
+    with open(Partition_Store.index_path(DATASET), "r", encoding="utf-8") as f:
+        stored = json.load(f)
+    assert stored["version"] == Cache_Manifest.MANIFEST_VERSION
+    assert len(stored["files"]) == 2
+
+def test_unchanged_sources_are_reused(store):
+    first, _ = load(store)
+    second, parsed = load(store)
+    assert parsed == []
+    pd.testing.assert_frame_equal(second, first)
+
+def test_only_changed_sources_are_parsed_again(store):
+    load(store)
+    changed = os.path.join(store, "Crandall vs UNBSJ (2024-11-09).csv")
+    with open(changed, "w", encoding="utf-8") as f:
+        f.write("Date,Kill\n2024-11-09,7\n")
+    touch(changed)
+
+    combined, parsed = load(store)
+    assert parsed == ["Crandall vs UNBSJ (2024-11-09).csv"]
+    assert combined["Kill"].tolist() == [3, 7]
+    assert len(partition_files()) == 2
+
+def test_removed_source_takes_its_partition(store):
+    load(store)
+    os.remove(os.path.join(store, "Crandall vs UNBSJ (2024-11-02).csv"))
+    combined, parsed = load(store)
+    assert parsed == []
+    assert combined["Kill"].tolist() == [5]
+    assert len(partition_files()) == 1
+
+def test_version_bump_purges_partitions(store, monkeypatch):
+    load(store)
+    stale = os.path.join(Partition_Store.dataset_dir(DATASET), "season=2023-2024", "date=2023-11-03", "orphan.parquet")
+    os.makedirs(os.path.dirname(stale))
+    pd.DataFrame({"Kill": [1]}).to_parquet(stale)
+
+    monkeypatch.setattr(Cache_Manifest, "MANIFEST_VERSION", Cache_Manifest.MANIFEST_VERSION + 1)
+    assert Partition_Store.read_index(DATASET) is None
+    combined, parsed = load(store)
+    assert len(parsed) == 2
+    assert combined["Kill"].tolist() == [3, 5]
+    assert not os.path.exists(stale)
+    assert Partition_Store.read_index(DATASET) is not None
+
+def test_unversioned_index_is_purged(store):
+    load(store)
+    files = Partition_Store.read_index(DATASET)
+    # The index layout written before it carried a processing version
+    with open(Partition_Store.index_path(DATASET), "w", encoding="utf-8") as f:
+        json.dump(files, f)
+
+    _, parsed = load(store)
+    assert len(parsed) == 2
+    assert len(partition_files()) == 2
+
+def test_force_rebuild_parses_everything(store):
+    load(store)
+    parser = Parser()
+    Partition_Store.load_partitioned_files(DATASET, store, parser, force_rebuild=True)
+    assert len(parser.parsed) == 2
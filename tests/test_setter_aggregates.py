@@ -0,0 +1,39 @@
+# tests/test_setter_aggregates.py
+# Match counts in the setter rollups
+
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from functions import Setter_Distribution_Load  # noqa: E402
+
+def setter_rows(rows):
+    columns = ["Season", "Date", "Home", "Away", "Team", "Setter Tendency", "Position", "A Att", "H %"]
+    df = pd.DataFrame(rows, columns=columns)
+    df["Date"] = pd.to_datetime(df["Date"])
+    return df
+
+def test_doubleheader_counts_as_two_matches():
+    df = setter_rows([
+        ("2024-2025", "2024-11-02", "Crandall", "UNBSJ", "Crandall", "Overall", 1, 10, 0.2),
+        ("2024-2025", "2024-11-02", "Crandall", "UNBSJ", "Crandall", "Overall", 2, 5, 0.1),
+        ("2024-2025", "2024-11-02", "Crandall", "STU", "Crandall", "Overall", 1, 8, 0.3),
+        ("2024-2025", "2024-11-09", "UNBSJ", "Crandall", "Crandall", "Overall", 1, 6, 0.0),
+    ])
+    team = Setter_Distribution_Load.build_aggregate(df, "team")
+    assert team["Matches"].tolist() == [3]
+
+    position = Setter_Distribution_Load.build_aggregate(df, "position").set_index("Position")
+    assert position["Matches"].to_dict() == {1: 3, 2: 1}
+
+def test_undated_rows_are_not_matches():
+    df = setter_rows([
+        ("2024-2025", None, "Crandall", "UNBSJ", "Crandall", "Overall", 1, 10, 0.2),
+        ("2024-2025", "2024-11-02", "Crandall", "UNBSJ", "Crandall", "Quick", 1, 5, 0.1),
+    ])
+    team = Setter_Distribution_Load.build_aggregate(df, "team").set_index("Setter Tendency")
+    assert team["Matches"].to_dict() == {"Overall": 0, "Quick": 1}